@@ -0,0 +1,93 @@
+import threading
+from typing import List, Tuple
+from domain.models import Column, Table
+
+
+VALUE_OVERHEAD = 32
+SAMPLE_ROWS = 64
+
+
+def estimate_row_bytes(rows: List[Tuple]) -> float:
+    step = max(1, len(rows) // SAMPLE_ROWS)
+    sample = rows[::step]
+    total = 0
+    for row in sample:
+        for value in row:
+            if isinstance(value, (str, bytes, bytearray)):
+                total += len(value) + VALUE_OVERHEAD
+            else:
+                total += VALUE_OVERHEAD
+    return max(total / len(sample), 1.0)
+
+
+class AdaptiveBatchController:
+
+    MIN_ROWS = 100
+    LOB_ESTIMATE = 64 * 1024
+    TYPE_WIDTHS = {
+        'bit': 1, 'tinyint': 1, 'smallint': 2, 'int': 4, 'bigint': 8,
+        'real': 4, 'float': 8, 'decimal': 17, 'numeric': 17,
+        'money': 8, 'smallmoney': 4,
+        'date': 3, 'time': 5, 'smalldatetime': 4, 'datetime': 8,
+        'datetime2': 8, 'datetimeoffset': 10,
+        'uniqueidentifier': 16, 'timestamp': 8, 'rowversion': 8,
+        'text': LOB_ESTIMATE, 'ntext': LOB_ESTIMATE, 'image': LOB_ESTIMATE,
+        'xml': LOB_ESTIMATE,
+    }
+
+    def __init__(self, table: Table,
+                 target_batch_bytes: int = 32 * 1024 * 1024,
+                 target_batch_seconds: float = 2.0,
+                 memory_ceiling_bytes: int = 512 * 1024 * 1024,
+                 in_flight_batches: int = 1,
+                 max_rows: int = 1000000):
+        self.target_batch_bytes = target_batch_bytes
+        self.target_batch_seconds = target_batch_seconds
+        self.memory_ceiling_bytes = memory_ceiling_bytes
+        self.in_flight_batches = max(in_flight_batches, 1)
+        self.max_rows = max_rows
+        self.row_bytes = self.estimate_row_bytes(table)
+        self._measured = False
+        self._lock = threading.Lock()
+        self._size = self._clamp(self.target_batch_bytes / self.row_bytes)
+
+    @classmethod
+    def estimate_row_bytes(cls, table: Table) -> float:
+        return float(sum(cls._column_width(col) + VALUE_OVERHEAD
+                         for col in table.columns)) or 1.0
+
+    @classmethod
+    def _column_width(cls, column: Column) -> int:
+        data_type = column.data_type.lower()
+        if data_type in cls.TYPE_WIDTHS:
+            return cls.TYPE_WIDTHS[data_type]
+        if column.max_length == -1:
+            return cls.LOB_ESTIMATE
+        if column.max_length:
+            return column.max_length * (2 if data_type in ('nchar', 'nvarchar') else 1)
+        return 8
+
+    def next_size(self) -> int:
+        with self._lock:
+            return self._size
+
+    def record(self, rows: List[Tuple], seconds: float, row_bytes: float = 0.0) -> None:
+        if not rows:
+            return
+        measured = row_bytes or estimate_row_bytes(rows)
+        with self._lock:
+            if self._measured:
+                self.row_bytes = (self.row_bytes + measured) / 2
+            else:
+                self.row_bytes = measured
+                self._measured = True
+
+            desired = self.target_batch_bytes / self.row_bytes
+            if seconds > 0:
+                desired = min(desired, len(rows) * self.target_batch_seconds / seconds)
+            desired = min(max(desired, self._size / 2), self._size * 2)
+            self._size = self._clamp(desired)
+
+    def _clamp(self, rows: float) -> int:
+        ceiling = self.memory_ceiling_bytes / (self.row_bytes * self.in_flight_batches)
+        return int(max(1, min(max(rows, self.MIN_ROWS), self.max_rows, ceiling)))
@@ -0,0 +1,39 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+from domain.ports import ICheckpointStore
+from domain.models import TableCheckpoint
+
+
+class BatchCheckpointer:
+
+    def __init__(self, store: Optional[ICheckpointStore], checkpoint: TableCheckpoint,
+                 key_positions: List[int]):
+        self.store = store
+        self.checkpoint = checkpoint
+        self.key_positions = key_positions
+        self._lock = threading.Lock()
+        self._next_seq = 0
+        self._pending: Dict[int, Tuple[int, Optional[Tuple]]] = {}
+
+    def committed(self, seq: int, rows: List[Tuple]) -> None:
+        last_key = None
+        if self.key_positions:
+            last_key = tuple(rows[-1][i] for i in self.key_positions)
+
+        with self._lock:
+            self._pending[seq] = (len(rows), last_key)
+            advanced = False
+            while self._next_seq in self._pending:
+                count, key = self._pending.pop(self._next_seq)
+                self.checkpoint.rows_committed += count
+                if key is not None:
+                    self.checkpoint.last_key = key
+                self._next_seq += 1
+                advanced = True
+            if advanced and self.store is not None:
+                self.store.save(self.checkpoint)
+
+    def finish(self) -> None:
+        self.checkpoint.data_done = True
+        if self.store is not None:
+            self.store.save(self.checkpoint)
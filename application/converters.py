@@ -0,0 +1,82 @@
+import re
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from domain.ports import ITypeMapper
+from domain.models import Column, Table
+
+
+_DATETIMEOFFSET = struct.Struct('<6hI2h')
+
+
+def _datetimeoffset(value: bytes) -> datetime:
+    year, month, day, hour, minute, second, nanos, tz_hour, tz_minute = _DATETIMEOFFSET.unpack(value)
+    return datetime(year, month, day, hour, minute, second, nanos // 1000,
+                    timezone(timedelta(hours=tz_hour, minutes=tz_minute)))
+
+
+def _datetimeoffset_text(value: bytes) -> str:
+    return _datetimeoffset(value).isoformat()
+
+
+def _bit_text(value: bool) -> str:
+    return '1' if value else '0'
+
+
+def _hex_text(value: bytes) -> str:
+    return '0x' + value.hex().upper()
+
+
+CONVERTERS = {
+    ('datetimeoffset', 'TIMESTAMP WITH TIME ZONE'): _datetimeoffset,
+    ('datetimeoffset', 'TEXT'): _datetimeoffset_text,
+    ('datetimeoffset', 'VARCHAR'): _datetimeoffset_text,
+    ('bit', 'SMALLINT'): int,
+    ('bit', 'INTEGER'): int,
+    ('bit', 'TEXT'): _bit_text,
+    ('binary', 'TEXT'): _hex_text,
+    ('varbinary', 'TEXT'): _hex_text,
+    ('timestamp', 'TEXT'): _hex_text,
+    ('rowversion', 'TEXT'): _hex_text,
+    ('money', 'TEXT'): str,
+    ('smallmoney', 'TEXT'): str,
+    ('decimal', 'TEXT'): str,
+    ('numeric', 'TEXT'): str,
+}
+
+
+def _skip_nulls(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda value: None if value is None else convert(value)
+
+
+class ColumnConverterPlan:
+
+    def __init__(self, converters: List[Optional[Callable[[Any], Any]]]):
+        self.steps: List[Tuple[int, Callable[[Any], Any]]] = [
+            (i, _skip_nulls(convert)) for i, convert in enumerate(converters) if convert is not None
+        ]
+
+    @classmethod
+    def compile(cls, table: Table, columns: List[str], type_mapper: ITypeMapper,
+                pg_types: Optional[Dict[str, str]] = None) -> 'ColumnConverterPlan':
+        by_name = {col.name: col for col in table.columns}
+        pg_types = pg_types or {}
+        return cls([cls._converter_for(by_name[name], pg_types.get(name) or type_mapper.map_type(by_name[name]))
+                    for name in columns])
+
+    @staticmethod
+    def _converter_for(column: Column, mapped_type: str) -> Optional[Callable[[Any], Any]]:
+        pg_type = re.sub(r'\(.*?\)', '', mapped_type).strip().upper()
+        return CONVERTERS.get((column.data_type.lower(), pg_type))
+
+    @property
+    def is_identity(self) -> bool:
+        return not self.steps
+
+    def apply(self, rows: List[Tuple]) -> List[Tuple]:
+        if not self.steps or not rows:
+            return rows
+        values = list(zip(*rows))
+        for i, convert in self.steps:
+            values[i] = list(map(convert, values[i]))
+        return list(zip(*values))
@@ -0,0 +1,38 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import List
+from domain.ports import IMigrationHook
+
+
+NO_HOOK = nullcontext()
+
+
+class HookChain:
+
+    def __init__(self, hooks: List[IMigrationHook]):
+        self.hooks = list(hooks)
+
+    def before_table(self, table_name: str) -> None:
+        for hook in self.hooks:
+            hook.before_table(table_name)
+
+    def after_table(self, table_name: str) -> None:
+        for hook in reversed(self.hooks):
+            hook.after_table(table_name)
+
+    def before_stage(self, table_name: str, stage: str) -> None:
+        for hook in self.hooks:
+            hook.before_stage(table_name, stage)
+
+    def after_stage(self, table_name: str, stage: str, seconds: float) -> None:
+        for hook in reversed(self.hooks):
+            hook.after_stage(table_name, stage, seconds)
+
+    @contextmanager
+    def stage(self, table_name: str, stage: str):
+        self.before_stage(table_name, stage)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.after_stage(table_name, stage, time.perf_counter() - started)
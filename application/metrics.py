@@ -0,0 +1,109 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from domain.models import MigrationResult
+from application.batching import estimate_row_bytes
+from application.hooks import HookChain, NO_HOOK
+
+
+class TableMetrics:
+
+    STAGES = ('schema_read', 'ddl', 'fetch', 'transform', 'write', 'index_build', 'maintenance')
+
+    def __init__(self, table_name: str, hooks: Optional[HookChain] = None):
+        self.table_name = table_name
+        self.hooks = hooks
+        self.started = time.perf_counter()
+        self.stage_seconds: Dict[str, float] = {stage: 0.0 for stage in self.STAGES}
+        self.rows = 0
+        self.bytes = 0
+        self.batch_latencies: List[float] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        if self.hooks is not None:
+            self.hooks.before_stage(self.table_name, name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            self.add_stage(name, seconds)
+            if self.hooks is not None:
+                self.hooks.after_stage(self.table_name, name, seconds)
+
+    def hook(self, name: str):
+        if self.hooks is None:
+            return NO_HOOK
+        return self.hooks.stage(self.table_name, name)
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+
+    def timed_batches(self, batches: Iterator[List[Tuple]]) -> Iterator[List[Tuple]]:
+        try:
+            while True:
+                if self.hooks is not None:
+                    self.hooks.before_stage(self.table_name, 'fetch')
+                started = time.perf_counter()
+                try:
+                    rows = next(batches)
+                except StopIteration:
+                    return
+                finally:
+                    seconds = time.perf_counter() - started
+                    self.add_stage('fetch', seconds)
+                    if self.hooks is not None:
+                        self.hooks.after_stage(self.table_name, 'fetch', seconds)
+                yield rows
+        finally:
+            close = getattr(batches, 'close', None)
+            if close is not None:
+                close()
+
+    def transformed(self, batches: Iterator[List[Tuple]],
+                    transform: Callable[[List[Tuple]], List[Tuple]]) -> Iterator[List[Tuple]]:
+        try:
+            for rows in batches:
+                if self.hooks is not None:
+                    self.hooks.before_stage(self.table_name, 'transform')
+                started = time.perf_counter()
+                rows = transform(rows)
+                seconds = time.perf_counter() - started
+                self.add_stage('transform', seconds)
+                if self.hooks is not None:
+                    self.hooks.after_stage(self.table_name, 'transform', seconds)
+                yield rows
+        finally:
+            close = getattr(batches, 'close', None)
+            if close is not None:
+                close()
+
+    def record_batch(self, rows: List[Tuple], seconds: float) -> float:
+        row_bytes = estimate_row_bytes(rows) if rows else 0.0
+        with self._lock:
+            self.rows += len(rows)
+            self.bytes += int(row_bytes * len(rows))
+            self.batch_latencies.append(seconds)
+            self.stage_seconds['write'] += seconds
+        return row_bytes
+
+    def apply_to(self, result: MigrationResult) -> MigrationResult:
+        with self._lock:
+            result.bytes_migrated = self.bytes
+            result.batch_count = len(self.batch_latencies)
+            result.stage_seconds = dict(self.stage_seconds)
+            result.batch_latencies = list(self.batch_latencies)
+        return result
+
+    def snapshot(self) -> MigrationResult:
+        result = MigrationResult(
+            table_name=self.table_name,
+            rows_migrated=self.rows,
+            success=True,
+            duration_seconds=time.perf_counter() - self.started
+        )
+        return self.apply_to(result)
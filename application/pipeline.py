@@ -0,0 +1,78 @@
+import queue
+import threading
+from typing import Callable, Iterable, List, Tuple
+
+
+class BatchPipeline:
+
+    _DONE = object()
+    _POLL_SECONDS = 0.1
+
+    def __init__(self, queue_depth: int):
+        if queue_depth < 1:
+            raise ValueError("queue_depth must be at least 1")
+        self.queue_depth = queue_depth
+
+    def run(self, batches: Iterable[List[Tuple]],
+            writers: List[Callable[[int, List[Tuple]], None]]) -> None:
+        work: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        cancel = threading.Event()
+        errors: List[BaseException] = []
+        errors_lock = threading.Lock()
+
+        def fail(exc: BaseException) -> None:
+            with errors_lock:
+                errors.append(exc)
+            cancel.set()
+
+        def put(item) -> bool:
+            while not cancel.is_set():
+                try:
+                    work.put(item, timeout=self._POLL_SECONDS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def read() -> None:
+            try:
+                for seq, rows in enumerate(batches):
+                    if not put((seq, rows)):
+                        break
+            except BaseException as e:
+                fail(e)
+            finally:
+                close = getattr(batches, 'close', None)
+                if close is not None:
+                    close()
+                for _ in writers:
+                    put(self._DONE)
+
+        def write(writer: Callable[[int, List[Tuple]], None]) -> None:
+            while True:
+                try:
+                    item = work.get(timeout=self._POLL_SECONDS)
+                except queue.Empty:
+                    if cancel.is_set():
+                        return
+                    continue
+                if item is self._DONE or cancel.is_set():
+                    return
+                try:
+                    writer(*item)
+                except BaseException as e:
+                    fail(e)
+                    return
+
+        threads = [threading.Thread(target=read, name="pipeline-reader", daemon=True)]
+        threads += [
+            threading.Thread(target=write, args=(w,), name=f"pipeline-writer-{i}", daemon=True)
+            for i, w in enumerate(writers)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        if errors:
+            raise errors[0]
@@ -0,0 +1,53 @@
+from typing import Dict, List
+from domain.ports import ISourceDatabase, ITargetDatabase, ITypeMapper, IPlanCache
+from domain.models import Table, TablePlan, TableSize
+
+
+PLAN_VERSION = 2
+
+
+class MigrationPlanCompiler:
+
+    def __init__(self, plan_cache: IPlanCache, type_mapper: ITypeMapper):
+        self.plan_cache = plan_cache
+        self.type_mapper = type_mapper
+        self.recompiled: List[str] = []
+
+    def compile(self, source_db: ISourceDatabase, target_db: ITargetDatabase,
+                table_names: List[str]) -> Dict[str, TablePlan]:
+        fingerprints = source_db.get_schema_fingerprints()
+        sizes = source_db.get_table_sizes()
+        self.recompiled = []
+
+        target_fingerprints = {name: f"{PLAN_VERSION}:{type(target_db).__name__}:{fingerprints.get(name)}"
+                               for name in table_names}
+        cached = {name: self.plan_cache.get(name) for name in table_names}
+        stale = [name for name in table_names
+                 if fingerprints.get(name) is None or cached[name] is None
+                 or cached[name].fingerprint != target_fingerprints[name]]
+        # Only tables whose schema changed are introspected, in one catalog round trip.
+        schemas = source_db.get_table_schemas(stale) if stale else {}
+
+        plans: Dict[str, TablePlan] = {}
+        for name in table_names:
+            plan = cached[name]
+            if name in schemas:
+                plan = self.compile_table(target_db, schemas[name], target_fingerprints[name])
+                self.recompiled.append(name)
+
+            size = sizes.get(name, TableSize())
+            plan.estimated_rows = size.row_count
+            plan.estimated_bytes = size.reserved_bytes
+            self.plan_cache.save(plan)
+            plans[name] = plan
+        return plans
+
+    def compile_table(self, target_db: ITargetDatabase, table: Table, fingerprint: str) -> TablePlan:
+        return TablePlan(
+            table=table,
+            fingerprint=fingerprint,
+            pg_types={col.name: self.type_mapper.map_type(col) for col in table.columns},
+            ddl=target_db.table_ddl(table, deferred=False),
+            deferred_ddl=target_db.table_ddl(table, deferred=True),
+            read_strategy='keyset' if table.get_key_columns() else 'scan'
+        )
@@ -0,0 +1,106 @@
+import threading
+import time
+from typing import Dict, Optional
+from domain.ports import ILogger
+
+
+class _TableProgress:
+
+    def __init__(self, total_rows: int, rows_done: int):
+        self.total_rows = total_rows
+        self.rows_done = rows_done
+        self.initial_rows = rows_done
+        self.started = time.perf_counter()
+
+
+class ProgressReporter:
+
+    def __init__(self, logger: ILogger, interval_seconds: float = 5.0, exact_totals: bool = False):
+        self.logger = logger
+        self.interval_seconds = interval_seconds
+        self.exact_totals = exact_totals
+        self.expected_rows = 0
+        self._tables: Dict[str, _TableProgress] = {}
+        self._finished_rows = 0
+        self._initial_rows = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = time.perf_counter()
+        self._last_rows = 0
+        self._last_report = self._started
+
+    def start(self, expected_rows: int = 0) -> None:
+        self.expected_rows = expected_rows
+        self._started = self._last_report = time.perf_counter()
+        if self.interval_seconds > 0 and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='progress-reporter', daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def start_table(self, table_name: str, total_rows: int, rows_done: int = 0) -> None:
+        with self._lock:
+            self._tables[table_name] = _TableProgress(total_rows, rows_done)
+            self._initial_rows += rows_done
+            self._last_rows += rows_done
+
+    def update(self, table_name: str, rows_done: int) -> None:
+        with self._lock:
+            table = self._tables.get(table_name)
+            if table is not None:
+                table.rows_done = rows_done
+
+    def finish_table(self, table_name: str) -> None:
+        with self._lock:
+            table = self._tables.pop(table_name, None)
+            if table is not None:
+                self._finished_rows += table.rows_done
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.report()
+
+    def report(self) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            tables = [(name, t.total_rows, t.rows_done, t.rows_done - t.initial_rows, now - t.started)
+                      for name, t in self._tables.items()]
+            rows_done = self._finished_rows + sum(t.rows_done for t in self._tables.values())
+            rate = (rows_done - self._initial_rows) / max(now - self._started, 1e-9)
+            recent = (rows_done - self._last_rows) / max(now - self._last_report, 1e-9)
+            self._last_rows, self._last_report = rows_done, now
+        if not tables:
+            return
+
+        estimate = "" if self.exact_totals else "~"
+        for name, total_rows, done, moved, elapsed in tables:
+            table_rate = moved / elapsed if elapsed > 0 else 0.0
+            table_eta = (total_rows - done) / table_rate if table_rate > 0 and total_rows > done else None
+            percent = min(done / max(total_rows, 1), 1.0) * 100
+            eta_text = f", ETA ~{table_eta:,.0f}վ" if table_eta is not None else ""
+            self.logger.progress(
+                f"   Progress: {name} {done:,}/{estimate}{total_rows:,} ({percent:.1f}%, "
+                f"{table_rate:,.0f} տող/վ{eta_text})",
+                {'event': 'table_progress', 'table': name, 'rows': done, 'total_rows': total_rows,
+                 'rows_per_second': round(table_rate, 1),
+                 'eta_seconds': round(table_eta, 1) if table_eta is not None else None}
+            )
+
+        expected_rows = max(self.expected_rows, rows_done)
+        eta = (expected_rows - rows_done) / rate if rate > 0 and expected_rows > rows_done else None
+        expected = f"/~{expected_rows:,}" if self.expected_rows else ""
+        eta_text = f", ETA ~{eta:,.0f}վ" if eta is not None else ""
+        self.logger.progress(
+            f"   Progress: ընդամենը {rows_done:,}{expected} տող, {len(tables)} ակտիվ աղյուսակ, "
+            f"{recent:,.0f} տող/վ (միջինը {rate:,.0f}){eta_text}",
+            {'event': 'progress', 'rows': rows_done, 'expected_rows': expected_rows,
+             'active_tables': len(tables), 'rows_per_second': round(recent, 1),
+             'average_rows_per_second': round(rate, 1),
+             'eta_seconds': round(eta, 1) if eta is not None else None}
+        )
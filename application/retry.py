@@ -0,0 +1,34 @@
+import random
+import time
+from typing import Callable, Optional, TypeVar
+from domain.errors import TransientDatabaseError
+
+
+T = TypeVar('T')
+
+
+class RetryPolicy:
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.5, max_delay: float = 30.0):
+        self.max_attempts = max(max_attempts, 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        backoff = min(self.base_delay * (2 ** (attempt - 1)), self.max_delay)
+        return backoff * random.uniform(0.5, 1.0)
+
+    def run(self, operation: Callable[[int], T],
+            on_retry: Optional[Callable[[int, Exception, float], None]] = None) -> T:
+        attempt = 1
+        while True:
+            try:
+                return operation(attempt)
+            except TransientDatabaseError as e:
+                if attempt >= self.max_attempts:
+                    raise
+                delay = self.delay(attempt)
+                if on_retry is not None:
+                    on_retry(attempt, e, delay)
+                time.sleep(delay)
+                attempt += 1
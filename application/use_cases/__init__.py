@@ -1,3 +1,8 @@
 from .migrate_db import MigrateDatabaseUseCase
+from .sync_db import SyncDatabaseUseCase
+from .verify_db import VerifyDatabaseUseCase
+from .load_spool import LoadSpoolUseCase
+from .dry_run import DryRunUseCase
 
-__all__ = ['MigrateDatabaseUseCase']
\ No newline at end of file
+__all__ = ['MigrateDatabaseUseCase', 'SyncDatabaseUseCase', 'VerifyDatabaseUseCase', 'LoadSpoolUseCase',
+           'DryRunUseCase']
\ No newline at end of file
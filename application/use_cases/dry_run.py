@@ -0,0 +1,188 @@
+import heapq
+import statistics
+import time
+from typing import List, Optional
+from domain.ports import ISourceDatabase, ILogger
+from domain.models import Table, TableSize, TableRunEstimate
+from application.batching import AdaptiveBatchController, estimate_row_bytes
+
+
+
+class DryRunUseCase:
+
+    # Share of write throughput lost to maintaining the primary key during the load.
+    PK_WRITE_OVERHEAD = 0.3
+
+    def __init__(self,
+                 source_db: ISourceDatabase,
+                 logger: ILogger,
+                 batch_size: int = 10000,
+                 pipeline_depth: int = 0,
+                 writer_count: int = 1,
+                 table_workers: int = 1,
+                 partition_threshold_rows: int = 0,
+                 range_partitions: int = 4,
+                 deferred_threshold_rows: int = 0,
+                 index_workers: int = 4,
+                 adaptive_batching: bool = False,
+                 target_batch_bytes: int = 32 * 1024 * 1024,
+                 target_batch_seconds: float = 2.0,
+                 memory_ceiling_bytes: int = 512 * 1024 * 1024,
+                 sample_rows: int = 10000,
+                 sample_min_rows: int = 100000,
+                 write_bytes_per_second: float = 64 * 1024 * 1024,
+                 index_bytes_per_second: float = 128 * 1024 * 1024):
+        self.source_db = source_db
+        self.logger = logger
+        self.batch_size = batch_size
+        self.pipeline_depth = pipeline_depth
+        self.writer_count = max(writer_count, 1)
+        self.table_workers = max(table_workers, 1)
+        self.partition_threshold_rows = partition_threshold_rows
+        self.range_partitions = range_partitions
+        self.deferred_threshold_rows = deferred_threshold_rows
+        self.index_workers = max(index_workers, 1)
+        self.adaptive_batching = adaptive_batching
+        self.target_batch_bytes = target_batch_bytes
+        self.target_batch_seconds = target_batch_seconds
+        self.memory_ceiling_bytes = memory_ceiling_bytes
+        self.sample_rows = sample_rows
+        self.sample_min_rows = sample_min_rows
+        self.write_bytes_per_second = write_bytes_per_second
+        self.index_bytes_per_second = index_bytes_per_second
+        self.total_seconds = 0.0
+
+    def execute(self) -> List[TableRunEstimate]:
+        try:
+            self.logger.info("Կապեր հաստատվում են...")
+            self.source_db.connect()
+            tables = self.source_db.get_tables()
+            sizes = self.source_db.get_table_sizes()
+            self.logger.info(f"Փորձնական պլանավորում: {len(tables)} աղյուսակ")
+
+            estimates = []
+            schemas = []
+            for name in tables:
+                table = self.source_db.get_table_schema(name)
+                estimates.append(self._plan_table(table, sizes.get(name, TableSize())))
+                schemas.append(table)
+
+            sampled = [e.read_rows_per_second for e in estimates if e.sample_rows]
+            fallback_rate = statistics.median(sampled) if sampled else None
+            for estimate, table in zip(estimates, schemas):
+                self._estimate_duration(estimate, table, fallback_rate)
+                self._log_estimate(estimate)
+
+            self.total_seconds = self._makespan([e.estimated_seconds for e in estimates])
+            self.logger.info(f"Ընդհանուր գնահատված տևողություն: ~{self.total_seconds:,.0f}վ "
+                             f"({self.table_workers} աղյուսակային հոսք)")
+            return estimates
+
+        except Exception as e:
+            self.logger.error(f"Ընդհանուր սխալ: {e}")
+            raise
+        finally:
+            self.source_db.disconnect()
+
+    def _plan_table(self, table: Table, size: TableSize) -> TableRunEstimate:
+        has_key = bool(table.get_key_columns())
+        estimate = TableRunEstimate(
+            table_name=table.qualified_name,
+            row_count=size.row_count,
+            reserved_bytes=size.reserved_bytes,
+            has_key=has_key,
+            has_lobs=any(col.is_lob for col in table.columns),
+            index_count=len(table.indexes),
+            adaptive_batching=self.adaptive_batching
+        )
+
+        # Same rules MigrateDatabaseUseCase applies, so the plan is what a run with these settings does.
+        if table.partitioning is not None:
+            estimate.read_strategy = 'partitions'
+            estimate.parallelism = min(table.partitioning.partition_count, max(self.range_partitions, 1))
+        elif (self.partition_threshold_rows > 0 and self.range_partitions > 1
+              and size.row_count >= self.partition_threshold_rows and has_key):
+            estimate.read_strategy = 'ranges'
+            estimate.parallelism = self.range_partitions
+        else:
+            estimate.read_strategy = 'keyset' if has_key else 'scan'
+            estimate.parallelism = self.writer_count if self.pipeline_depth > 0 else 1
+        estimate.deferred_constraints = (self.deferred_threshold_rows > 0
+                                         and size.row_count >= self.deferred_threshold_rows
+                                         and table.partitioning is None)
+
+        if size.row_count >= self.sample_min_rows:
+            self._sample(table, estimate)
+        if not estimate.row_bytes or (estimate.has_lobs and size.row_count):
+            # The sample skips LOB columns, whose pages are counted in the reserved size.
+            estimate.row_bytes = (size.reserved_bytes / size.row_count if size.row_count
+                                  else AdaptiveBatchController.estimate_row_bytes(table))
+
+        if self.adaptive_batching:
+            in_flight = estimate.parallelism if estimate.read_strategy in ('ranges', 'partitions') else (
+                self.pipeline_depth + self.writer_count + 1 if self.pipeline_depth > 0 else 1)
+            estimate.batch_size = AdaptiveBatchController(
+                table,
+                target_batch_bytes=self.target_batch_bytes,
+                target_batch_seconds=self.target_batch_seconds,
+                memory_ceiling_bytes=self.memory_ceiling_bytes,
+                in_flight_batches=in_flight
+            ).next_size()
+        else:
+            estimate.batch_size = self.batch_size
+        return estimate
+
+    def _sample(self, table: Table, estimate: TableRunEstimate) -> None:
+        columns = [col.name for col in table.columns if not col.is_lob] or [table.columns[0].name]
+        started = time.perf_counter()
+        # A TOP-bounded read, so the server never starts a scan of the whole table.
+        rows = self.source_db.read_data_batch(table, columns, None, self.sample_rows)
+        seconds = time.perf_counter() - started
+        if not rows:
+            return
+        estimate.sample_rows = len(rows)
+        estimate.sample_seconds = seconds
+        estimate.row_bytes = estimate_row_bytes(rows)
+        estimate.read_rows_per_second = len(rows) / max(seconds, 1e-6)
+
+    def _estimate_duration(self, estimate: TableRunEstimate, table: Table,
+                           fallback_rate: Optional[float]) -> None:
+        read_rate = estimate.read_rows_per_second or fallback_rate
+        write_rate = self.write_bytes_per_second / max(estimate.row_bytes, 1.0)
+        if table.primary_keys and not estimate.deferred_constraints:
+            write_rate /= 1 + self.PK_WRITE_OVERHEAD
+
+        if estimate.read_strategy in ('ranges', 'partitions'):
+            rate = (min(read_rate, write_rate) if read_rate else write_rate) * estimate.parallelism
+        else:
+            rate = min(read_rate, write_rate * estimate.parallelism) if read_rate else write_rate
+        estimate.load_seconds = estimate.row_count / max(rate, 1e-6)
+
+        builds = estimate.index_count + (1 if estimate.deferred_constraints and table.primary_keys else 0)
+        if builds:
+            parallel = estimate.deferred_constraints or estimate.read_strategy == 'partitions'
+            workers = min(self.index_workers, builds) if parallel else 1
+            data_bytes = estimate.row_count * estimate.row_bytes
+            estimate.index_seconds = data_bytes * builds / self.index_bytes_per_second / workers
+
+    def _makespan(self, durations: List[float]) -> float:
+        if self.table_workers <= 1:
+            return sum(durations)
+        # Tables are handed out largest first, each to the worker that frees up earliest.
+        workers = [0.0] * self.table_workers
+        for seconds in sorted(durations, reverse=True):
+            heapq.heappush(workers, heapq.heappop(workers) + seconds)
+        return max(workers)
+
+    def _log_estimate(self, estimate: TableRunEstimate) -> None:
+        batch = f"{estimate.batch_size:,}" + (" (adaptive)" if estimate.adaptive_batching else "")
+        sample = (f", նմուշ {estimate.sample_rows:,} տող {estimate.read_rows_per_second:,.0f} տող/վ"
+                  if estimate.sample_rows else "")
+        self.logger.info(
+            f"   {estimate.table_name}: ~{estimate.row_count:,} տող, {estimate.reserved_bytes / 1048576:,.1f} MB, "
+            f"{estimate.read_strategy} x{estimate.parallelism}, փաթեթ {batch}"
+            + (", UNLOGGED" if estimate.deferred_constraints else "")
+            + (", LOB" if estimate.has_lobs else "")
+            + sample
+            + f" → ~{estimate.estimated_seconds:,.1f}վ"
+        )
@@ -0,0 +1,150 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+from domain.ports import ITargetDatabase, ILogger, ISpoolReader
+from domain.models import MigrationStatistics, MigrationResult, SpoolFile, SpoolTable
+
+
+
+class LoadSpoolUseCase:
+
+    def __init__(self,
+                 spool_reader: ISpoolReader,
+                 target_factory: Callable[[], ITargetDatabase],
+                 logger: ILogger,
+                 workers: int = 4,
+                 freeze: bool = True,
+                 analyze: bool = True):
+        self.spool_reader = spool_reader
+        self.target_factory = target_factory
+        self.logger = logger
+        self.workers = max(workers, 1)
+        self.freeze = freeze
+        self.analyze = analyze
+        self.stats = MigrationStatistics()
+        self._local = threading.local()
+        self._opened: List[ITargetDatabase] = []
+        self._opened_lock = threading.Lock()
+
+    def execute(self) -> MigrationStatistics:
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            spool_tables = self.spool_reader.get_tables()
+            ready = [t for t in spool_tables if t.complete]
+            for spool_table in spool_tables:
+                if not spool_table.complete:
+                    self.logger.warning(f"Բաց թողնված (արտահանումը ավարտված չէ): {spool_table.table.qualified_name}")
+            self.logger.info(f"Բեռնում spool-ից: {len(ready)} աղյուսակ, "
+                             f"{sum(len(t.files) for t in ready)} ֆայլ, {self.workers} կապ")
+
+            self.logger.info("Կապեր հաստատվում են...")
+            target_db = self._target()
+            for spool_table in ready:
+                target_db.create_table(spool_table.table, deferred=spool_table.deferred)
+                target_db.delete_rows_after(spool_table.table, None)
+
+            start_times = {t.table.qualified_name: datetime.now() for t in ready}
+            loaded: Dict[str, int] = {t.table.qualified_name: 0 for t in ready}
+            errors: Dict[str, str] = {}
+            if self.freeze:
+                work = sorted(((t, t.files) for t in ready),
+                              key=lambda item: sum(f.size_bytes for f in item[1]), reverse=True)
+            else:
+                work = sorted(((t, [f]) for t in ready for f in t.files),
+                              key=lambda item: item[1][0].size_bytes, reverse=True)
+            futures = {pool.submit(self._load_files, t, files): t for t, files in work}
+            for future in as_completed(futures):
+                name = futures[future].table.qualified_name
+                try:
+                    loaded[name] += future.result()
+                except Exception as e:
+                    errors.setdefault(name, str(e))
+
+            index_futures = {
+                pool.submit(self._finish_table, t): t
+                for t in ready if t.table.qualified_name not in errors
+            }
+            index_seconds: Dict[str, float] = {}
+            maintenance_seconds: Dict[str, float] = {}
+            for future in as_completed(index_futures):
+                name = index_futures[future].table.qualified_name
+                try:
+                    index_seconds[name], maintenance_seconds[name] = future.result()
+                except Exception as e:
+                    errors[name] = str(e)
+
+            for spool_table in ready:
+                name = spool_table.table.qualified_name
+                result = MigrationResult(
+                    table_name=name,
+                    rows_migrated=loaded[name],
+                    success=name not in errors,
+                    error=errors.get(name),
+                    duration_seconds=(datetime.now() - start_times[name]).total_seconds(),
+                    index_duration_seconds=index_seconds.get(name, 0.0),
+                    deferred_constraints=spool_table.deferred,
+                    bytes_migrated=sum(f.size_bytes for f in spool_table.files),
+                    batch_count=len(spool_table.files),
+                    stage_seconds={'index_build': index_seconds.get(name, 0.0),
+                                   'maintenance': maintenance_seconds.get(name, 0.0)}
+                )
+                self.stats.add_result(result)
+                if result.success:
+                    self.logger.info(f"✓ Հաջող: {name}, {result.rows_migrated:,} տող")
+                else:
+                    self.logger.error(f"✗ Ձախողում: {name}: {result.error}")
+
+            self.logger.info(f"Մշակված աղյուսակներ: {self.stats.tables_processed}")
+            self.logger.info(f"Ընդհանուր տողեր: {self.stats.total_rows:,}")
+            self.logger.info(f"Ձախողված: {len(self.stats.failed_tables)}")
+            return self.stats
+
+        except Exception as e:
+            self.logger.error(f"Ընդհանուր սխալ: {e}")
+            raise
+        finally:
+            pool.shutdown(wait=True)
+            for target_db in self._opened:
+                target_db.disconnect()
+
+    def _target(self) -> ITargetDatabase:
+        target_db = getattr(self._local, 'target', None)
+        if target_db is None:
+            target_db = self.target_factory()
+            with self._opened_lock:
+                self._opened.append(target_db)
+            target_db.connect()
+            self._local.target = target_db
+        return target_db
+
+    def _load_files(self, spool_table: SpoolTable, spool_files: List[SpoolFile]) -> int:
+        target_db = self._target()
+        columns = [c.name for c in spool_table.table.columns]
+        target_db.begin_transaction()
+        try:
+            if self.freeze:
+                target_db.begin_table_load(spool_table.table)
+            for spool_file in spool_files:
+                with self.spool_reader.open_file(spool_file) as stream:
+                    target_db.copy_from(spool_table.table, columns, stream, spool_file.format)
+            target_db.commit_transaction()
+        except Exception:
+            target_db.rollback_transaction()
+            raise
+        return sum(f.rows for f in spool_files)
+
+    def _finish_table(self, spool_table: SpoolTable) -> Tuple[float, float]:
+        start_time = datetime.now()
+        target_db = self._target()
+        if spool_table.deferred:
+            target_db.build_deferred_constraints(spool_table.table)
+        else:
+            target_db.create_indexes(spool_table.table, spool_table.table.indexes)
+        index_seconds = (datetime.now() - start_time).total_seconds()
+
+        start_time = datetime.now()
+        if self.analyze:
+            # Frozen COPY already set the visibility map; otherwise freeze now, not in production.
+            target_db.analyze_table(spool_table.table, vacuum=not self.freeze)
+        return index_seconds, (datetime.now() - start_time).total_seconds()
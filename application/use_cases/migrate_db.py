@@ -1,6 +1,25 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from domain.ports import ISourceDatabase, ITargetDatabase, ITypeMapper, ILogger
-from domain.models import MigrationStatistics, MigrationResult, Table
+from typing import Callable, Dict, List, Optional, Tuple
+from domain.ports import (
+    ISourceDatabase, ITargetDatabase, ITypeMapper, ILogger, ICheckpointStore, IMetricsExporter, IPlanCache,
+    IMigrationHook
+)
+from domain.errors import TransientDatabaseError
+from domain.models import (MigrationStatistics, MigrationResult, Table, KeyRange, TableSize,
+                           TableCheckpoint, TablePlan)
+from application.pipeline import BatchPipeline
+from application.checkpoint import BatchCheckpointer
+from application.batching import AdaptiveBatchController
+from application.metrics import TableMetrics
+from application.converters import ColumnConverterPlan
+from application.planning import MigrationPlanCompiler
+from application.retry import RetryPolicy
+from application.progress import ProgressReporter
+from application.hooks import HookChain
 
 
 
@@ -11,38 +30,106 @@ class MigrateDatabaseUseCase:
                  target_db: ITargetDatabase,
                  type_mapper: ITypeMapper,
                  logger: ILogger,
-                 batch_size: int = 10000):
+                 batch_size: int = 10000,
+                 pipeline_depth: int = 0,
+                 writer_count: int = 1,
+                 target_factory: Optional[Callable[[], ITargetDatabase]] = None,
+                 table_workers: int = 1,
+                 source_factory: Optional[Callable[[], ISourceDatabase]] = None,
+                 partition_threshold_rows: int = 0,
+                 range_partitions: int = 4,
+                 deferred_threshold_rows: int = 0,
+                 checkpoint_store: Optional[ICheckpointStore] = None,
+                 resume: bool = False,
+                 adaptive_batching: bool = False,
+                 target_batch_bytes: int = 32 * 1024 * 1024,
+                 target_batch_seconds: float = 2.0,
+                 memory_ceiling_bytes: int = 512 * 1024 * 1024,
+                 metrics_exporter: Optional[IMetricsExporter] = None,
+                 metrics_interval_seconds: float = 5.0,
+                 exact_row_counts: bool = False,
+                 plan_cache: Optional[IPlanCache] = None,
+                 retry_attempts: int = 5,
+                 retry_base_delay: float = 0.5,
+                 retry_max_delay: float = 30.0,
+                 maintenance_workers: int = 2,
+                 vacuum_after_load: bool = False,
+                 progress_interval_seconds: float = 5.0,
+                 hooks: Optional[List[IMigrationHook]] = None):
+        if writer_count > 1 and target_factory is None:
+            raise ValueError("target_factory is required when writer_count > 1")
+        if table_workers > 1 and (source_factory is None or target_factory is None):
+            raise ValueError("source_factory and target_factory are required when table_workers > 1")
+        if partition_threshold_rows > 0 and (source_factory is None or target_factory is None):
+            raise ValueError("source_factory and target_factory are required for range partitioning")
+        if resume and checkpoint_store is None:
+            raise ValueError("checkpoint_store is required to resume a migration")
         self.source_db = source_db
         self.target_db = target_db
         self.type_mapper = type_mapper
         self.logger = logger
         self.batch_size = batch_size
+        self.pipeline_depth = pipeline_depth
+        self.writer_count = max(writer_count, 1)
+        self.target_factory = target_factory
+        self.table_workers = max(table_workers, 1)
+        self.source_factory = source_factory
+        self.partition_threshold_rows = partition_threshold_rows
+        self.range_partitions = range_partitions
+        self.deferred_threshold_rows = deferred_threshold_rows
+        self.checkpoint_store = checkpoint_store
+        self.plan_cache = plan_cache
+        self.retry_policy = RetryPolicy(retry_attempts, retry_base_delay, retry_max_delay)
+        self.maintenance_workers = maintenance_workers
+        self.vacuum_after_load = vacuum_after_load
+        self.resume = resume
+        self.adaptive_batching = adaptive_batching
+        self.target_batch_bytes = target_batch_bytes
+        self.target_batch_seconds = target_batch_seconds
+        self.memory_ceiling_bytes = memory_ceiling_bytes
+        self.metrics_exporter = metrics_exporter
+        self.metrics_interval_seconds = metrics_interval_seconds
+        self.exact_row_counts = exact_row_counts
         self.stats = MigrationStatistics()
+        self._active_metrics: Dict[str, TableMetrics] = {}
+        self._metrics_lock = threading.Lock()
+        self._last_export = 0.0
+        self._plans: Dict[str, TablePlan] = {}
+        self._maintenance: Optional[ThreadPoolExecutor] = None
+        self._maintenance_futures: List[Tuple[str, Future]] = []
+        self._progress = ProgressReporter(logger, progress_interval_seconds, exact_row_counts)
+        self._hooks = HookChain(hooks) if hooks else None
     
     def execute(self) -> MigrationStatistics:
+        if self.maintenance_workers > 0:
+            self._maintenance = ThreadPoolExecutor(max_workers=self.maintenance_workers)
         try:
             self.logger.info("Կապեր հաստատվում են...")
             self.source_db.connect()
             self.target_db.connect()
             
+            if self.checkpoint_store is not None and not self.resume:
+                self.checkpoint_store.clear()
+            
             tables = self.source_db.get_tables()
             self.logger.info(f"Գտնված {len(tables)} աղյուսակ")
+            sizes = self.source_db.get_table_sizes()
+            self._progress.start(sum(sizes[t].row_count for t in tables if t in sizes))
             
-            for i, table_name in enumerate(tables, 1):
-                self.logger.info(f"\n{'='*60}")
-                self.logger.info(f"[{i}/{len(tables)}] Միգրացիա: {table_name}")
-                self.logger.info(f"{'='*60}")
-                
-                result = self._migrate_table(table_name)
-                self.stats.add_result(result)
-                
-                if result.success:
-                    self.logger.info(
-                        f"✓ Հաջող: {result.rows_migrated} տող, "
-                        f"{result.duration_seconds:.2f}վ"
-                    )
-                else:
-                    self.logger.error(f"✗ Ձախողում: {result.error}")
+            if self.plan_cache is not None:
+                compiler = MigrationPlanCompiler(self.plan_cache, self.type_mapper)
+                self._plans = compiler.compile(self.source_db, self.target_db, tables)
+                self.logger.info(f"Միգրացիայի պլաններ: {len(tables) - len(compiler.recompiled)} պահոցից, "
+                                 f"{len(compiler.recompiled)} նոր կազմված")
+            
+            if self.table_workers > 1:
+                self._run_table_workers(self._order_by_size(tables))
+            else:
+                for i, table_name in enumerate(tables, 1):
+                    self._process_table(i, len(tables), table_name,
+                                        self.source_db, self.target_db)
+            
+            self._finish_maintenance()
             
             self.logger.info(f"\n{'='*60}")
             self.logger.info("ՄԻԳՐԱՑԻԱՆ ԱՎԱՐՏՎԱԾ")
@@ -50,6 +137,7 @@ class MigrateDatabaseUseCase:
             self.logger.info(f"Աղյուսակներ: {self.stats.tables_processed}")
             self.logger.info(f"Ընդամենը տողեր: {self.stats.total_rows}")
             self.logger.info(f"Ձախողված: {len(self.stats.failed_tables)}")
+            self._publish_metrics(force=True)
             
             return self.stats
             
@@ -57,77 +145,492 @@ class MigrateDatabaseUseCase:
             self.logger.error(f"Ընդհանուր սխալ: {e}")
             raise
         finally:
+            self._progress.stop()
+            if self._maintenance is not None:
+                self._maintenance.shutdown(wait=True)
             self.source_db.disconnect()
             self.target_db.disconnect()
     
-    def _migrate_table(self, table_name: str) -> MigrationResult:
+    def _order_by_size(self, tables: List[str]) -> List[str]:
+        sizes: Dict[str, TableSize] = self.source_db.get_table_sizes()
+        return sorted(tables, key=lambda name: sizes.get(name, TableSize()).reserved_bytes, reverse=True)
+    
+    def _run_table_workers(self, tables: List[str]) -> None:
+        work: queue.Queue = queue.Queue()
+        for item in enumerate(tables, 1):
+            work.put(item)
+        errors: List[Exception] = []
+        
+        def worker(source_db: ISourceDatabase, target_db: ITargetDatabase, owned: bool) -> None:
+            try:
+                if owned:
+                    source_db.connect()
+                    target_db.connect()
+                while True:
+                    try:
+                        i, table_name = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    self._process_table(i, len(tables), table_name, source_db, target_db)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                if owned:
+                    source_db.disconnect()
+                    target_db.disconnect()
+        
+        threads = [threading.Thread(target=worker, args=(self.source_db, self.target_db, False))]
+        for _ in range(self.table_workers - 1):
+            threads.append(threading.Thread(
+                target=worker, args=(self.source_factory(), self.target_factory(), True)
+            ))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        if errors and not work.empty():
+            raise errors[0]
+        for e in errors:
+            self.logger.warning(f"Աշխատող հոսքի սխալ: {e}")
+    
+    def _process_table(self, index: int, total: int, table_name: str,
+                       source_db: ISourceDatabase, target_db: ITargetDatabase) -> None:
+        self.logger.info(f"\n{'='*60}")
+        self.logger.info(f"[{index}/{total}] Միգրացիա: {table_name}")
+        self.logger.info(f"{'='*60}")
+        
+        result = self._migrate_table(table_name, source_db, target_db)
+        self.stats.add_result(result)
+        self._publish_metrics(force=True)
+        
+        if result.skipped:
+            self.logger.info(f"✓ Բաց է թողնված (արդեն ավարտված): {table_name}")
+        elif result.success:
+            self.logger.info(
+                f"✓ Հաջող: {table_name}, {result.rows_migrated} տող, "
+                f"{result.duration_seconds:.2f}վ (ինդեքսներ՝ {result.index_duration_seconds:.2f}վ)"
+            )
+        else:
+            self.logger.error(f"✗ Ձախողում: {table_name}: {result.error}")
+    
+    def _migrate_table(self, table_name: str, source_db: ISourceDatabase,
+                       target_db: ITargetDatabase) -> MigrationResult:
         start_time = datetime.now()
+        checkpoint = self._get_checkpoint(table_name)
+        
+        if checkpoint.indexes_done:
+            return MigrationResult(
+                table_name=table_name,
+                rows_migrated=checkpoint.rows_committed,
+                success=True,
+                skipped=True
+            )
+        
+        metrics = TableMetrics(table_name, self._hooks)
+        with self._metrics_lock:
+            self._active_metrics[table_name] = metrics
+        if self._hooks is not None:
+            self._hooks.before_table(table_name)
         
         try:
             self.logger.info("1. Սխեմայի ընթերցում...")
-            table = self.source_db.get_table_schema(table_name)
+            plan = self._plans.get(table_name)
+            with metrics.stage('schema_read'):
+                table = plan.table if plan is not None else source_db.get_table_schema(table_name)
+                total_rows = source_db.count_rows(table.qualified_name, exact=self.exact_row_counts)
+            self._progress.start_table(table_name, total_rows, checkpoint.rows_committed)
+            resumed = checkpoint.schema_created
             
-            self.logger.info("2. Աղյուսակի ստեղծում...")
-            self.target_db.create_table(table)
+            # A PostgreSQL crash empties UNLOGGED tables; a migrator crash leaves loaded data in place.
+            if resumed and checkpoint.deferred and (not checkpoint.data_done or not target_db.has_rows(table)):
+                self.logger.warning("   UNLOGGED աղյուսակը կլցվի նորից")
+                self._restart_table_data(target_db, table, checkpoint)
+            
+            if resumed:
+                deferred = checkpoint.deferred
+                self.logger.info(f"2. Վերսկսում {checkpoint.rows_committed:,} տողից...")
+            else:
+                deferred = self._should_defer_constraints(total_rows) and table.partitioning is None
+                self.logger.info("2. Աղյուսակի ստեղծում..." + (" (UNLOGGED, առանց սահմանափակումների)" if deferred else ""))
+                with metrics.stage('ddl'):
+                    target_db.create_table(table, deferred=deferred,
+                                           ddl=plan.ddl_for(deferred) if plan is not None else None)
+                checkpoint.schema_created = True
+                checkpoint.deferred = deferred
+                self._save_checkpoint(checkpoint)
             
             self.logger.info("3. Տվյալների միգրացիա...")
-            rows_migrated = self._migrate_table_data(table)
+            if checkpoint.data_done:
+                rows_migrated = checkpoint.rows_committed
+            else:
+                rows_migrated = self._migrate_table_data(table, total_rows, source_db,
+                                                         target_db, checkpoint, resumed, metrics)
             
             self.logger.info("4. Ինդեքսների ստեղծում...")
-            self.target_db.create_indexes(table_name, table.indexes)
+            index_start = datetime.now()
+            with metrics.stage('index_build'):
+                if deferred:
+                    target_db.build_deferred_constraints(table)
+                else:
+                    target_db.create_indexes(table, table.indexes)
+            index_duration = (datetime.now() - index_start).total_seconds()
+            checkpoint.indexes_done = True
+            self._save_checkpoint(checkpoint)
+            
+            if self._maintenance is not None:
+                self._maintenance_futures.append(
+                    (table_name, self._maintenance.submit(self._maintain_table, table)))
             
             duration = (datetime.now() - start_time).total_seconds()
             
-            return MigrationResult(
+            return metrics.apply_to(MigrationResult(
                 table_name=table_name,
                 rows_migrated=rows_migrated,
                 success=True,
-                duration_seconds=duration
-            )
+                duration_seconds=duration,
+                index_duration_seconds=index_duration,
+                deferred_constraints=deferred
+            ))
             
         except Exception as e:
             duration = (datetime.now() - start_time).total_seconds()
-            return MigrationResult(
+            return metrics.apply_to(MigrationResult(
                 table_name=table_name,
                 rows_migrated=0,
                 success=False,
                 error=str(e),
                 duration_seconds=duration
-            )
+            ))
+        finally:
+            if self._hooks is not None:
+                self._hooks.after_table(table_name)
+            self._progress.finish_table(table_name)
+            with self._metrics_lock:
+                self._active_metrics.pop(table_name, None)
     
-    def _migrate_table_data(self, table: Table) -> int:
-        total_rows = self.source_db.count_rows(table.name)
-        
-        if total_rows == 0:
-            return 0
+    def _maintain_table(self, table: Table) -> float:
+        started = time.perf_counter()
+        self.target_db.analyze_table(table, vacuum=self.vacuum_after_load)
+        return time.perf_counter() - started
+    
+    def _finish_maintenance(self) -> None:
+        if not self._maintenance_futures:
+            return
+        self.logger.info("5. Հետբեռնման սպասարկում (" + ("VACUUM FREEZE, " if self.vacuum_after_load else "") + "ANALYZE)...")
+        started = time.perf_counter()
+        results = {r.table_name: r for r in self.stats.snapshot()}
+        for table_name, future in self._maintenance_futures:
+            try:
+                seconds = future.result()
+            except Exception as e:
+                self.logger.warning(f"   Սպասարկման սխալ: {table_name}: {e}")
+                continue
+            if table_name in results:
+                results[table_name].stage_seconds['maintenance'] = seconds
+        self.logger.info(f"   Սպասարկված աղյուսակներ: {len(self._maintenance_futures)}, "
+                         f"սպասում {time.perf_counter() - started:.2f}վ")
+        self._maintenance_futures = []
+    
+    def _get_checkpoint(self, table_name: str, range_id: int = 0) -> TableCheckpoint:
+        checkpoint = None
+        if self.checkpoint_store is not None:
+            checkpoint = self.checkpoint_store.get(table_name, range_id)
+        return checkpoint or TableCheckpoint(table_name=table_name, range_id=range_id)
+    
+    def _save_checkpoint(self, checkpoint: TableCheckpoint) -> None:
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.save(checkpoint)
+    
+    def _clear_checkpoints(self, table_name: str) -> None:
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.clear(table_name)
+    
+    def _restart_table_data(self, target_db: ITargetDatabase, table: Table,
+                            checkpoint: TableCheckpoint) -> None:
+        self._clear_checkpoints(table.qualified_name)
+        target_db.delete_rows_after(table, None)
+        checkpoint.last_key = None
+        checkpoint.rows_committed = 0
+        checkpoint.data_done = False
+        checkpoint.boundaries = None
+        self._save_checkpoint(checkpoint)
+    
+    def _discard_uncommitted(self, target_db: ITargetDatabase, table: Table,
+                             checkpoint: TableCheckpoint,
+                             key_range: Optional[KeyRange] = None) -> None:
+        target_db.delete_rows_after(table, checkpoint.last_key, key_range)
+        if not table.get_key_columns():
+            checkpoint.rows_committed = 0
+            self._save_checkpoint(checkpoint)
+    
+    def _should_defer_constraints(self, total_rows: int) -> bool:
+        return self.deferred_threshold_rows > 0 and total_rows >= self.deferred_threshold_rows
+    
+    def _migrate_table_data(self, table: Table, total_rows: int, source_db: ISourceDatabase,
+                            target_db: ITargetDatabase, checkpoint: TableCheckpoint,
+                            resumed: bool, metrics: TableMetrics) -> int:
+        if self.exact_row_counts:
+            self.logger.info(f"   Ընդամենը տողեր: {total_rows:,}")
+        else:
+            self.logger.info(f"   Մոտավոր տողեր: ~{total_rows:,}")
         
-        self.logger.info(f"   Ընդամենը տողեր: {total_rows:,}")
+        if resumed and not table.has_portable_key_order():
+            # The target sorts these keys differently from the source, so a partial load cannot be trimmed.
+            self.logger.warning("   Բանալու կարգը տարբերվում է աղբյուրից, աղյուսակը կլցվի նորից")
+            self._restart_table_data(target_db, table, checkpoint)
+            resumed = False
         
         columns = [col.name for col in table.columns]
-        offset = 0
-        rows_migrated = 0
+        table_plan = self._plans.get(table.qualified_name)
+        plan = ColumnConverterPlan.compile(table, columns, self.type_mapper,
+                                           table_plan.pg_types if table_plan is not None else None)
+        if (checkpoint.boundaries is not None or self._reads_source_partitions(table)
+                or self._should_partition(table, total_rows)):
+            return self._migrate_table_ranges(table, columns, total_rows, source_db,
+                                              checkpoint, resumed, metrics, plan)
         
-        while offset < total_rows:
-            rows = self.source_db.read_data_batch(
-                table.name, columns, offset, self.batch_size
-            )
-            
-            if not rows:
-                break
+        if resumed:
+            self._discard_uncommitted(target_db, table, checkpoint)
+        
+        key_positions = [columns.index(k) for k in table.get_key_columns()]
+        checkpointer = BatchCheckpointer(self.checkpoint_store, checkpoint, key_positions)
+        in_flight = self.pipeline_depth + self.writer_count + 1 if self.pipeline_depth > 0 else 1
+        sizer = self._create_batch_sizer(table, in_flight)
+        batches = self._read_batches(
+            self._stream_rows(source_db, table, columns, self._chunk_size(sizer),
+                              after_key=checkpoint.last_key),
+            plan, metrics
+        )
+        
+        if self.pipeline_depth > 0:
+            self._migrate_table_data_pipelined(table, columns, batches,
+                                               target_db, checkpointer, sizer, metrics)
+        else:
+            for seq, rows in enumerate(batches):
+                self._write_batch(target_db, table, columns, rows, sizer, metrics)
+                checkpointer.committed(seq, rows)
+                self._record_progress(table.qualified_name, checkpoint.rows_committed)
+        
+        checkpointer.finish()
+        return checkpoint.rows_committed
+    
+    def _should_partition(self, table: Table, total_rows: int) -> bool:
+        return (self.partition_threshold_rows > 0
+                and self.range_partitions > 1
+                and total_rows >= self.partition_threshold_rows
+                and bool(table.get_key_columns()))
+    
+    def _reads_source_partitions(self, table: Table) -> bool:
+        return (table.partitioning is not None
+                and self.source_factory is not None
+                and self.target_factory is not None)
+    
+    def _migrate_table_ranges(self, table: Table, columns: List[str], total_rows: int,
+                              source_db: ISourceDatabase, checkpoint: TableCheckpoint,
+                              resumed: bool, metrics: TableMetrics,
+                              plan: ColumnConverterPlan) -> int:
+        if table.partitioning is not None:
+            if checkpoint.boundaries is None:
+                checkpoint.boundaries = table.partitioning.boundaries
+                self._save_checkpoint(checkpoint)
+            ranges = KeyRange.partitions(table.partitioning)
+            workers = min(len(ranges), max(self.range_partitions, 1))
+            self.logger.info(f"   Աղբյուրի {len(ranges)} բաժին ըստ [{table.partitioning.column}], {workers} հոսք")
+        else:
+            if checkpoint.boundaries is None:
+                checkpoint.boundaries = source_db.get_key_boundaries(table, self.range_partitions)
+                self._save_checkpoint(checkpoint)
+            ranges = KeyRange.split(table.get_key_columns()[0], checkpoint.boundaries)
+            workers = len(ranges)
+            self.logger.info(f"   Բաժանված է {len(ranges)} միջակայքի")
+        
+        key_positions = [columns.index(k) for k in table.get_key_columns()]
+        range_checkpoints = [self._get_checkpoint(table.qualified_name, i)
+                             for i in range(1, len(ranges) + 1)]
+        progress_lock = threading.Lock()
+        cancel = threading.Event()
+        rows_migrated = sum(cp.rows_committed for cp in range_checkpoints)
+        sizer = self._create_batch_sizer(table, workers)
+        
+        def migrate_range(key_range: KeyRange, range_checkpoint: TableCheckpoint) -> None:
+            nonlocal rows_migrated
+            if range_checkpoint.data_done or cancel.is_set():
+                return
+            range_source = self.source_factory()
+            range_target = self.target_factory()
+            checkpointer = BatchCheckpointer(self.checkpoint_store, range_checkpoint, key_positions)
+            try:
+                range_source.connect()
+                range_target.connect()
+                if resumed:
+                    self._discard_uncommitted(range_target, table, range_checkpoint, key_range)
+                batches = self._read_batches(
+                    self._stream_rows(range_source, table, columns, self._chunk_size(sizer),
+                                      after_key=range_checkpoint.last_key,
+                                      key_range=key_range),
+                    plan, metrics
+                )
+                for seq, rows in enumerate(batches):
+                    if cancel.is_set():
+                        batches.close()
+                        return
+                    self._write_batch(range_target, table, columns, rows, sizer, metrics)
+                    checkpointer.committed(seq, rows)
+                    with progress_lock:
+                        rows_migrated += len(rows)
+                        self._record_progress(table.qualified_name, rows_migrated)
+                checkpointer.finish()
+            except Exception:
+                cancel.set()
+                raise
+            finally:
+                range_source.disconnect()
+                range_target.disconnect()
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(migrate_range, r, cp) for r, cp in zip(ranges, range_checkpoints)]
+            for future in futures:
+                future.result()
+        
+        checkpoint.rows_committed = sum(cp.rows_committed for cp in range_checkpoints)
+        BatchCheckpointer(self.checkpoint_store, checkpoint, []).finish()
+        return checkpoint.rows_committed
+    
+    def _migrate_table_data_pipelined(self, table: Table, columns: List[str],
+                                      batches,
+                                      target_db: ITargetDatabase,
+                                      checkpointer: BatchCheckpointer,
+                                      sizer: Optional[AdaptiveBatchController],
+                                      metrics: TableMetrics) -> None:
+        def make_writer(target_db: ITargetDatabase):
+            def write(seq: int, rows: List[Tuple]) -> None:
+                self._write_batch(target_db, table, columns, rows, sizer, metrics)
+                checkpointer.committed(seq, rows)
+                self._record_progress(table.qualified_name, checkpointer.checkpoint.rows_committed)
+            return write
+        
+        targets = [target_db]
+        try:
+            for _ in range(self.writer_count - 1):
+                extra_target = self.target_factory()
+                extra_target.connect()
+                targets.append(extra_target)
             
-            self.target_db.begin_transaction()
+            BatchPipeline(self.pipeline_depth).run(
+                batches, [make_writer(t) for t in targets]
+            )
+        finally:
+            for extra_target in targets[1:]:
+                extra_target.disconnect()
+    
+    def _stream_rows(self, source_db: ISourceDatabase, table: Table, columns: List[str],
+                     chunk_size, after_key: Optional[Tuple] = None,
+                     key_range: Optional[KeyRange] = None):
+        key_positions = [columns.index(k) for k in table.get_key_columns()]
+        attempt = 1
+        while True:
+            try:
+                if attempt > 1:
+                    source_db.disconnect()
+                    source_db.connect()
+                for rows in source_db.stream_rows(table, columns, chunk_size,
+                                                  after_key=after_key, key_range=key_range):
+                    attempt = 1
+                    if key_positions:
+                        after_key = tuple(rows[-1][p] for p in key_positions)
+                    yield rows
+                return
+            except TransientDatabaseError as e:
+                if not key_positions or attempt >= self.retry_policy.max_attempts:
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                self._log_retry(attempt, e, delay)
+                time.sleep(delay)
+                attempt += 1
+    
+    def _log_retry(self, attempt: int, error: Exception, delay: float) -> None:
+        self.logger.warning(f"   Անցողիկ սխալ (փորձ {attempt}/{self.retry_policy.max_attempts}), "
+                            f"կրկնում {delay:.1f}վ հետո: {error}")
+    
+    def _read_batches(self, batches, plan: ColumnConverterPlan, metrics: TableMetrics):
+        batches = metrics.timed_batches(batches)
+        if plan.is_identity:
+            return batches
+        return metrics.transformed(batches, plan.apply)
+    
+    def _create_batch_sizer(self, table: Table,
+                            in_flight_batches: int) -> Optional[AdaptiveBatchController]:
+        if not self.adaptive_batching:
+            return None
+        sizer = AdaptiveBatchController(
+            table,
+            target_batch_bytes=self.target_batch_bytes,
+            target_batch_seconds=self.target_batch_seconds,
+            memory_ceiling_bytes=self.memory_ceiling_bytes,
+            in_flight_batches=in_flight_batches
+        )
+        self.logger.info(f"   Սկզբնական փաթեթ: {sizer.next_size():,} տող "
+                         f"(~{sizer.row_bytes:,.0f} բայթ/տող)")
+        return sizer
+    
+    def _chunk_size(self, sizer: Optional[AdaptiveBatchController]):
+        return sizer.next_size if sizer is not None else self.batch_size
+    
+    def _write_batch(self, target_db: ITargetDatabase, table: Table,
+                     columns: List[str], rows: List[Tuple],
+                     sizer: Optional[AdaptiveBatchController],
+                     metrics: TableMetrics) -> None:
+        key_positions = [columns.index(k) for k in table.get_key_columns()]
+        commit_unknown = False
+        
+        def attempt(number: int) -> None:
+            nonlocal commit_unknown
+            if number > 1:
+                target_db.disconnect()
+                target_db.connect()
+            committing = False
+            target_db.begin_transaction()
             try:
-                self.target_db.insert_batch(table.name, columns, rows)
-                self.target_db.commit_transaction()
-                
-                rows_migrated += len(rows)
-                offset += len(rows)
-                
-                progress = (offset / total_rows) * 100
-                self.logger.info(f"   Progress: {offset:,}/{total_rows:,} ({progress:.1f}%)")
-                
+                if commit_unknown and key_positions:
+                    # A failed commit may have gone through; failures before it were rolled back.
+                    target_db.delete_batch(table, [tuple(row[p] for p in key_positions) for row in rows])
+                with metrics.hook('insert'):
+                    target_db.insert_batch(table, columns, rows)
+                committing = True
+                with metrics.hook('commit'):
+                    target_db.commit_transaction()
             except Exception as e:
-                self.target_db.rollback_transaction()
+                commit_unknown = commit_unknown or committing
+                try:
+                    target_db.rollback_transaction()
+                except TransientDatabaseError:
+                    pass
+                if committing and not key_positions and isinstance(e, TransientDatabaseError):
+                    raise RuntimeError(f"Commit outcome unknown, cannot retry a table without keys: {e}") from e
                 raise
         
-        return rows_migrated
+        started = time.perf_counter()
+        self.retry_policy.run(attempt, self._log_retry)
+        seconds = time.perf_counter() - started
+        row_bytes = metrics.record_batch(rows, seconds)
+        if sizer is not None:
+            sizer.record(rows, seconds, row_bytes)
+    
+    def _record_progress(self, table_name: str, rows_migrated: int) -> None:
+        self._progress.update(table_name, rows_migrated)
+        self._publish_metrics()
+    
+    def _publish_metrics(self, force: bool = False) -> None:
+        if self.metrics_exporter is None:
+            return
+        with self._metrics_lock:
+            now = time.monotonic()
+            if not force and now - self._last_export < self.metrics_interval_seconds:
+                return
+            self._last_export = now
+            in_progress = [m.snapshot() for m in self._active_metrics.values()]
+            try:
+                self.metrics_exporter.export(self.stats, in_progress)
+            except Exception as e:
+                self.logger.warning(f"Չափումների արտահանման սխալ: {e}")
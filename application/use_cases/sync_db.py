@@ -0,0 +1,116 @@
+from datetime import datetime
+from typing import Optional
+from domain.ports import ISourceDatabase, ITargetDatabase, ITypeMapper, ILogger, ICheckpointStore
+from domain.models import MigrationStatistics, MigrationResult, Table
+from application.converters import ColumnConverterPlan
+
+
+
+class SyncDatabaseUseCase:
+
+    def __init__(self,
+                 source_db: ISourceDatabase,
+                 target_db: ITargetDatabase,
+                 type_mapper: ITypeMapper,
+                 checkpoint_store: ICheckpointStore,
+                 logger: ILogger,
+                 batch_size: int = 10000):
+        self.source_db = source_db
+        self.target_db = target_db
+        self.type_mapper = type_mapper
+        self.checkpoint_store = checkpoint_store
+        self.logger = logger
+        self.batch_size = batch_size
+        self.stats = MigrationStatistics()
+
+    def execute(self) -> MigrationStatistics:
+        try:
+            self.logger.info("Կապեր հաստատվում են...")
+            self.source_db.connect()
+            self.target_db.connect()
+
+            tables = self.source_db.get_tables()
+            self.logger.info(f"Համաժամեցում: {len(tables)} աղյուսակ")
+
+            for i, table_name in enumerate(tables, 1):
+                self.logger.info(f"[{i}/{len(tables)}] Համաժամեցում: {table_name}")
+                result = self._sync_table(table_name)
+                if result is None:
+                    continue
+                self.stats.add_result(result)
+
+                if result.success:
+                    self.logger.info(f"✓ {table_name}: {result.rows_migrated} փոփոխություն, "
+                                     f"{result.duration_seconds:.2f}վ")
+                else:
+                    self.logger.error(f"✗ Ձախողում: {table_name}: {result.error}")
+
+            self.logger.info(f"Համաժամեցված աղյուսակներ: {self.stats.tables_processed}")
+            self.logger.info(f"Ընդամենը փոփոխություններ: {self.stats.total_rows}")
+            self.logger.info(f"Ձախողված: {len(self.stats.failed_tables)}")
+
+            return self.stats
+
+        except Exception as e:
+            self.logger.error(f"Ընդհանուր սխալ: {e}")
+            raise
+        finally:
+            self.source_db.disconnect()
+            self.target_db.disconnect()
+
+    def _sync_table(self, table_name: str) -> Optional[MigrationResult]:
+        start_time = datetime.now()
+        table = self.source_db.get_table_schema(table_name)
+
+        method = self.source_db.get_change_tracking_method(table)
+        if method is None or not table.get_key_columns():
+            self.logger.warning(f"   {table_name}: rowversion կամ change tracking չկա, բաց է թողնվում")
+            return None
+        if method == 'rowversion':
+            self.logger.warning(f"   {table_name}: rowversion-ը ջնջումները չի հայտնաբերում")
+
+        try:
+            changes = self._apply_changes(table, method)
+            duration = (datetime.now() - start_time).total_seconds()
+            return MigrationResult(
+                table_name=table_name,
+                rows_migrated=changes,
+                success=True,
+                duration_seconds=duration
+            )
+        except Exception as e:
+            duration = (datetime.now() - start_time).total_seconds()
+            return MigrationResult(
+                table_name=table_name,
+                rows_migrated=0,
+                success=False,
+                error=str(e),
+                duration_seconds=duration
+            )
+
+    def _apply_changes(self, table: Table, method: str) -> int:
+        columns = [col.name for col in table.columns]
+        plan = ColumnConverterPlan.compile(table, columns, self.type_mapper)
+        since = self.checkpoint_store.get_sync_state(table.qualified_name)
+        self.logger.info(f"   Մեթոդ: {method}, սկսած: {since!r}")
+
+        high_water_mark = None
+        changes = 0
+        for batch in self.source_db.read_changes(table, columns, since, self.batch_size):
+            self.target_db.begin_transaction()
+            try:
+                if batch.upserts:
+                    self.target_db.upsert_batch(table, columns, plan.apply(batch.upserts))
+                if batch.deletes:
+                    self.target_db.delete_batch(table, batch.deletes)
+                self.target_db.commit_transaction()
+            except Exception:
+                self.target_db.rollback_transaction()
+                raise
+            high_water_mark = batch.high_water_mark
+            changes += len(batch.upserts) + len(batch.deletes)
+            self.logger.info(f"   upsert: {len(batch.upserts):,}, delete: {len(batch.deletes):,}")
+
+        if high_water_mark is not None:
+            self.checkpoint_store.save_sync_state(table.qualified_name, high_water_mark)
+        return changes
@@ -0,0 +1,161 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from domain.ports import ISourceDatabase, ITargetDatabase, ILogger
+from domain.models import Table, KeyRange, VerificationResult
+
+
+
+class VerifyDatabaseUseCase:
+
+    def __init__(self,
+                 source_factory: Callable[[], ISourceDatabase],
+                 target_factory: Callable[[], ITargetDatabase],
+                 logger: ILogger,
+                 workers: int = 4,
+                 initial_ranges: int = 16,
+                 split_factor: int = 8,
+                 leaf_rows: int = 5000,
+                 max_depth: int = 6):
+        self.source_factory = source_factory
+        self.target_factory = target_factory
+        self.logger = logger
+        self.workers = max(workers, 1)
+        self.initial_ranges = initial_ranges
+        self.split_factor = max(split_factor, 2)
+        self.leaf_rows = leaf_rows
+        self.max_depth = max_depth
+        self.results: List[VerificationResult] = []
+        self._local = threading.local()
+        self._opened: List[Tuple[ISourceDatabase, ITargetDatabase]] = []
+        self._opened_lock = threading.Lock()
+
+    def execute(self) -> List[VerificationResult]:
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            self.logger.info("Կապեր հաստատվում են...")
+            source_db, _ = self._connections()
+            tables = source_db.get_tables()
+            self.logger.info(f"Ստուգում: {len(tables)} աղյուսակ, {self.workers} կապ")
+
+            for i, table_name in enumerate(tables, 1):
+                self.logger.info(f"[{i}/{len(tables)}] Ստուգում: {table_name}")
+                result = self._verify_table(pool, source_db.get_table_schema(table_name))
+                self.results.append(result)
+
+                if not result.success:
+                    self.logger.error(f"✗ Ձախողում: {table_name}: {result.error}")
+                elif result.matches:
+                    self.logger.info(f"✓ Համընկնում: {table_name}, {result.source_rows:,} տող, "
+                                     f"{result.ranges_checked} միջակայք, {result.duration_seconds:.2f}վ")
+                else:
+                    self.logger.error(
+                        f"✗ Անհամապատասխանություն: {table_name}: "
+                        f"աղբյուր {result.source_rows:,} / թիրախ {result.target_rows:,} տող, "
+                        f"բացակա {len(result.missing_keys)}, ավելորդ {len(result.extra_keys)}, "
+                        f"փոփոխված {len(result.changed_keys)}"
+                    )
+                    for label, keys in (("բացակա", result.missing_keys),
+                                        ("ավելորդ", result.extra_keys),
+                                        ("փոփոխված", result.changed_keys)):
+                        if keys:
+                            self.logger.error(f"   {label}: {keys[:10]}")
+
+            mismatched = [r.table_name for r in self.results if not r.matches]
+            self.logger.info(f"Ստուգված աղյուսակներ: {len(self.results)}")
+            self.logger.info(f"Անհամապատասխան: {len(mismatched)}")
+            return self.results
+
+        except Exception as e:
+            self.logger.error(f"Ընդհանուր սխալ: {e}")
+            raise
+        finally:
+            pool.shutdown(wait=True)
+            for source_db, target_db in self._opened:
+                source_db.disconnect()
+                target_db.disconnect()
+
+    def _connections(self) -> Tuple[ISourceDatabase, ITargetDatabase]:
+        pair = getattr(self._local, 'pair', None)
+        if pair is None:
+            pair = (self.source_factory(), self.target_factory())
+            with self._opened_lock:
+                self._opened.append(pair)
+            pair[0].connect()
+            pair[1].connect()
+            self._local.pair = pair
+        return pair
+
+    def _verify_table(self, pool: ThreadPoolExecutor, table: Table) -> VerificationResult:
+        start_time = datetime.now()
+        key_columns = table.get_key_columns()
+        result = VerificationResult(table_name=table.qualified_name, success=True,
+                                    keyed=bool(key_columns))
+        try:
+            # Keys that sort differently on the two engines would put rows in different ranges,
+            # so those tables get one whole-table checksum and row hashes only on a mismatch.
+            if key_columns and table.has_portable_key_order():
+                source_db, _ = self._connections()
+                boundaries = source_db.get_key_boundaries(table, self.initial_ranges)
+                ranges = KeyRange.split(key_columns[0], boundaries)
+            else:
+                ranges = [None]
+
+            source_hashes: Dict[Tuple, str] = {}
+            target_hashes: Dict[Tuple, str] = {}
+            depth = 0
+            while ranges:
+                checked = list(pool.map(lambda r, d=depth: self._check_range(table, r, d), ranges))
+                result.ranges_checked += len(ranges)
+                if depth == 0:
+                    result.source_rows = sum(c[0] for c in checked)
+                    result.target_rows = sum(c[1] for c in checked)
+                ranges = []
+                for _, _, mismatched, children, hashes in checked:
+                    result.mismatched_ranges += mismatched
+                    ranges.extend(children)
+                    if hashes is not None:
+                        source_hashes.update(hashes[0])
+                        target_hashes.update(hashes[1])
+                depth += 1
+
+            result.missing_keys = sorted(k for k in source_hashes if k not in target_hashes)
+            result.extra_keys = sorted(k for k in target_hashes if k not in source_hashes)
+            result.changed_keys = sorted(k for k, digest in source_hashes.items()
+                                         if k in target_hashes and target_hashes[k] != digest)
+        except Exception as e:
+            result.success = False
+            result.error = str(e)
+        result.duration_seconds = (datetime.now() - start_time).total_seconds()
+        return result
+
+    def _check_range(self, table: Table, key_range: Optional[KeyRange], depth: int):
+        source_db, target_db = self._connections()
+        source = source_db.checksum_range(table, key_range)
+        target = target_db.checksum_range(table, key_range)
+        if source == target:
+            return source.row_count, target.row_count, 0, [], None
+        if key_range is None:
+            if not table.get_key_columns():
+                return source.row_count, target.row_count, 1, [], None
+            hashes = (source_db.row_hashes(table), target_db.row_hashes(table))
+            return source.row_count, target.row_count, 1, [], hashes
+
+        children: List[KeyRange] = []
+        if depth < self.max_depth and max(source.row_count, target.row_count) > self.leaf_rows:
+            children = self._split(key_range, source_db.get_key_boundaries(
+                table, self.split_factor, key_range))
+        if children:
+            return source.row_count, target.row_count, 1, children, None
+
+        hashes = (source_db.row_hashes(table, key_range), target_db.row_hashes(table, key_range))
+        return source.row_count, target.row_count, 1, [], hashes
+
+    def _split(self, key_range: KeyRange, boundaries: List[Any]) -> List[KeyRange]:
+        # The source returns boundaries from within the range in its own collation order.
+        inside = [b for b in dict.fromkeys(boundaries) if b != key_range.lower and b != key_range.upper]
+        if not inside:
+            return []
+        edges = [key_range.lower] + inside + [key_range.upper]
+        return [KeyRange(key_range.column, edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
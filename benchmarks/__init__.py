@@ -0,0 +1,9 @@
+from .synthetic_source import SyntheticSourceDatabase, SyntheticTable
+from .null_target import NullTargetDatabase, SinkCounter
+
+__all__ = [
+    'SyntheticSourceDatabase',
+    'SyntheticTable',
+    'NullTargetDatabase',
+    'SinkCounter'
+]
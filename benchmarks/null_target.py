@@ -0,0 +1,92 @@
+import threading
+from typing import Any, List, Optional, Tuple
+from psycopg2.extensions import QuotedString, adapt
+from domain.ports import ITypeMapper
+from domain.models import Table, Index, KeyRange
+from infrastructure.adapters.postsql_adapter import PostgreSQLAdapter
+
+
+class SinkCounter:
+
+    def __init__(self):
+        self.rows = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, rows: int, size: int) -> None:
+        with self._lock:
+            self.rows += rows
+            self.bytes += size
+
+
+def adapted_size(value: Any) -> int:
+    adapted = adapt(value)
+    if isinstance(adapted, QuotedString):
+        # Without a connection psycopg2 would encode strings as latin-1.
+        adapted.encoding = 'utf8'
+    return len(adapted.getquoted())
+
+
+class NullTargetDatabase(PostgreSQLAdapter):
+
+    def __init__(self, type_mapper: ITypeMapper, counter: SinkCounter,
+                 load_method: str = 'copy'):
+        super().__init__({}, type_mapper, load_method=load_method)
+        self.counter = counter
+        self._pending: List[Tuple[int, int]] = []
+
+    def connect(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+    def create_table(self, table: Table, deferred: bool = False,
+                     ddl: Optional[List[str]] = None) -> None:
+        pass
+
+    def insert_batch(self, table: Table, columns: List[str], rows: List[Tuple]) -> None:
+        buffer = None
+        if self.load_method != 'insert':
+            buffer, _ = self._encode_copy(table, columns, rows)
+        if buffer is not None:
+            size = len(buffer.getbuffer())
+        else:
+            size = sum(adapted_size(param) for row in rows for param in row)
+        self._pending.append((len(rows), size))
+
+    def upsert_batch(self, table: Table, columns: List[str], rows: List[Tuple]) -> None:
+        self.insert_batch(table, columns, rows)
+
+    def delete_batch(self, table: Table, keys: List[Tuple]) -> None:
+        pass
+
+    def create_indexes(self, table: Table, indexes: List[Index]) -> None:
+        pass
+
+    def build_deferred_constraints(self, table: Table) -> None:
+        pass
+
+    def begin_table_load(self, table: Table) -> None:
+        pass
+
+    def analyze_table(self, table: Table, vacuum: bool = False) -> None:
+        pass
+
+    def delete_rows_after(self, table: Table, last_key: Optional[Tuple],
+                          key_range: Optional[KeyRange] = None) -> None:
+        pass
+
+    def has_rows(self, table: Table) -> bool:
+        return self.counter.rows > 0
+
+    def begin_transaction(self) -> None:
+        self._pending = []
+
+    def commit_transaction(self) -> None:
+        for rows, size in self._pending:
+            self.counter.add(rows, size)
+        self._pending = []
+
+    def rollback_transaction(self) -> None:
+        self._pending = []
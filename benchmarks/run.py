@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+from domain.ports import ILogger
+from application.use_cases.migrate_db import MigrateDatabaseUseCase
+from infrastructure.adapters.type_mapper import MSSQLToPostgreSQLTypeMapper
+from .synthetic_source import SyntheticSourceDatabase
+from .null_target import NullTargetDatabase, SinkCounter
+from .scenarios import SCENARIOS, Scenario
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+class QuietLogger(ILogger):
+
+    def info(self, message: str) -> None:
+        pass
+
+    def warning(self, message: str) -> None:
+        print(f"WARNING: {message}", file=sys.stderr)
+
+    def error(self, message: str) -> None:
+        print(f"ERROR: {message}", file=sys.stderr)
+
+    def progress(self, message: str, fields: Dict[str, Any]) -> None:
+        pass
+
+
+def peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    info = psutil.Process().memory_info()
+    return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)
+
+
+def run_scenario(scenario: Scenario, batch_size: int) -> Dict[str, float]:
+    type_mapper = MSSQLToPostgreSQLTypeMapper()
+    counter = SinkCounter()
+
+    def make_source() -> SyntheticSourceDatabase:
+        return SyntheticSourceDatabase(scenario.tables)
+
+    def make_target() -> NullTargetDatabase:
+        return NullTargetDatabase(type_mapper, counter, load_method=scenario.load_method)
+
+    use_case = MigrateDatabaseUseCase(
+        source_db=make_source(),
+        target_db=make_target(),
+        type_mapper=type_mapper,
+        logger=QuietLogger(),
+        batch_size=batch_size,
+        target_factory=make_target,
+        source_factory=make_source,
+        **scenario.options
+    )
+
+    started = time.perf_counter()
+    stats = use_case.execute()
+    elapsed = time.perf_counter() - started
+    if stats.failed_tables:
+        raise RuntimeError(f"{scenario.name}: failed tables {stats.failed_tables}")
+
+    return {
+        'rows': counter.rows,
+        'bytes': counter.bytes,
+        'seconds': elapsed,
+        'rows_per_second': counter.rows / elapsed,
+        'mb_per_second': counter.bytes / elapsed / (1024 * 1024),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def run_isolated(name: str, batch_size: int) -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.run', '--child', name, '--batch-size', str(batch_size)],
+        check=True, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def best_of(name: str, batch_size: int, repeat: int) -> Dict[str, float]:
+    runs = [run_isolated(name, batch_size) for _ in range(repeat)]
+    best = max(runs, key=lambda r: r['rows_per_second'])
+    rss = [r['peak_rss_mb'] for r in runs if r['peak_rss_mb'] is not None]
+    best['peak_rss_mb'] = min(rss) if rss else None
+    return best
+
+
+def compare(name: str, result: Dict[str, float], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    reference = baseline.get(name)
+    if reference is None:
+        return []
+    problems = []
+    for metric in ('rows_per_second', 'mb_per_second'):
+        if result[metric] < reference[metric] * (1 - tolerance):
+            problems.append(f"{metric} {result[metric]:,.1f} < baseline {reference[metric]:,.1f}")
+    if result['peak_rss_mb'] and reference.get('peak_rss_mb'):
+        if result['peak_rss_mb'] > reference['peak_rss_mb'] * (1 + tolerance):
+            problems.append(f"peak_rss_mb {result['peak_rss_mb']:,.1f} > baseline {reference['peak_rss_mb']:,.1f}")
+    return problems
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline migration throughput benchmarks")
+    parser.add_argument('scenarios', nargs='*', help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument('--batch-size', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="runs per scenario; the fastest one is reported")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help="allowed relative drop in throughput (or growth in RSS) before failing")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="store this run's results as the new baseline")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.child:
+        print(json.dumps(run_scenario(SCENARIOS[args.child], args.batch_size)))
+        return 0
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}")
+        return 2
+
+    baseline = load_baseline(args.baseline)
+    results = {}
+    regressions = 0
+
+    print(f"{'scenario':<20} {'rows/s':>12} {'MB/s':>9} {'peak RSS MB':>12}  status")
+    for name in names:
+        result = best_of(name, args.batch_size, max(args.repeat, 1))
+        results[name] = result
+        problems = compare(name, result, baseline, args.tolerance)
+        regressions += bool(problems)
+        status = "REGRESSION: " + "; ".join(problems) if problems else ("ok" if name in baseline else "new")
+        rss = f"{result['peak_rss_mb']:,.1f}" if result['peak_rss_mb'] is not None else "n/a"
+        print(f"{name:<20} {result['rows_per_second']:>12,.0f} {result['mb_per_second']:>9,.1f} {rss:>12}  {status}")
+
+    if args.update_baseline:
+        baseline.update({
+            name: {k: round(r[k], 2) if r[k] is not None else None
+                   for k in ('rows_per_second', 'mb_per_second', 'peak_rss_mb')}
+            for name, r in results.items()
+        })
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+from .synthetic_source import SyntheticTable
+
+
+MIXED_TYPES = ['int', 'decimal', 'nvarchar', 'datetime2', 'uniqueidentifier', 'varbinary']
+
+
+@dataclass
+class Scenario:
+    name: str
+    tables: List[SyntheticTable]
+    options: Dict[str, Any] = field(default_factory=dict)
+    load_method: str = 'copy'
+
+
+SCENARIOS = {s.name: s for s in [
+    Scenario('narrow', [SyntheticTable('narrow', 200000, ['int', 'decimal', 'nvarchar', 'datetime2'])]),
+    Scenario('wide', [SyntheticTable('wide', 40000, MIXED_TYPES * 8)]),
+    Scenario('binary_heavy', [SyntheticTable('blobs', 20000, ['int', 'varbinary', 'varbinary'],
+                                             binary_length=4096)]),
+    Scenario('narrow_copy_text', [SyntheticTable('narrow', 200000, ['int', 'decimal', 'nvarchar', 'datetime2'])],
+             load_method='copy_text'),
+    Scenario('narrow_insert', [SyntheticTable('narrow', 50000, ['int', 'decimal', 'nvarchar', 'datetime2'])],
+             load_method='insert'),
+    Scenario('pipelined', [SyntheticTable('mixed', 100000, MIXED_TYPES)],
+             {'pipeline_depth': 4, 'writer_count': 2}),
+    Scenario('adaptive', [SyntheticTable('mixed', 100000, MIXED_TYPES)],
+             {'adaptive_batching': True, 'target_batch_bytes': 4 * 1024 * 1024}),
+    Scenario('parallel_tables', [SyntheticTable(f"t{i}", 25000, MIXED_TYPES, seed=i) for i in range(8)],
+             {'table_workers': 4}),
+    Scenario('ranges', [SyntheticTable('mixed', 100000, MIXED_TYPES)],
+             {'partition_threshold_rows': 1, 'range_partitions': 4}),
+]}
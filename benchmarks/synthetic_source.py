@@ -0,0 +1,158 @@
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from domain.ports import ISourceDatabase
+from domain.models import Table, Column, KeyRange, TableSize, ChangeBatch, RangeChecksum
+
+
+POOL_SIZE = 1024
+
+
+@dataclass
+class SyntheticTable:
+    name: str
+    rows: int
+    column_types: List[str] = field(default_factory=lambda: ['int', 'decimal', 'nvarchar', 'datetime2'])
+    text_length: int = 40
+    binary_length: int = 64
+    seed: int = 1
+
+    def to_table(self) -> Table:
+        columns = [Column('id', 'bigint', is_nullable=False)]
+        for i, data_type in enumerate(self.column_types, 1):
+            columns.append(self._column(f"c{i}_{data_type}", data_type))
+        return Table(name=self.name, columns=columns, primary_keys=['id'])
+
+    def _column(self, name: str, data_type: str) -> Column:
+        if data_type in ('decimal', 'numeric'):
+            return Column(name, data_type, precision=18, scale=4)
+        if data_type in ('nvarchar', 'varchar', 'nchar', 'char'):
+            return Column(name, data_type, max_length=self.text_length * 2)
+        if data_type in ('varbinary', 'binary'):
+            return Column(name, data_type, max_length=self.binary_length)
+        return Column(name, data_type)
+
+
+class SyntheticSourceDatabase(ISourceDatabase):
+
+    def __init__(self, tables: List[SyntheticTable]):
+        self.tables = {t.name: t for t in tables}
+        self._pools: Dict[str, List[List[Any]]] = {}
+
+    def connect(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+    def get_tables(self) -> List[str]:
+        return list(self.tables)
+
+    def get_table_schema(self, table_name: str) -> Table:
+        return self.tables[table_name].to_table()
+
+    def get_table_schemas(self, table_names: List[str]) -> Dict[str, Table]:
+        return {name: self.get_table_schema(name) for name in table_names}
+
+    def get_table_sizes(self) -> Dict[str, TableSize]:
+        return {name: TableSize(row_count=spec.rows,
+                                reserved_bytes=spec.rows * (len(spec.column_types) + 1) * 16)
+                for name, spec in self.tables.items()}
+
+    def get_schema_fingerprints(self) -> Dict[str, str]:
+        return {name: repr(spec.to_table()) for name, spec in self.tables.items()}
+
+    def count_rows(self, table_name: str, exact: bool = False) -> int:
+        return self.tables[table_name].rows
+
+    def read_data_batch(self, table: Table, columns: List[str],
+                        last_key: Optional[Tuple], batch_size: int) -> List[Tuple]:
+        spec = self.tables[table.name]
+        start = 0 if last_key is None else last_key[0] + 1
+        return self._rows(spec, start, min(start + batch_size, spec.rows))
+
+    def stream_rows(self, table: Table, columns: List[str],
+                    chunk_size: Union[int, Callable[[], int]],
+                    after_key: Optional[Tuple] = None,
+                    key_range: Optional[KeyRange] = None) -> Iterator[List[Tuple]]:
+        spec = self.tables[table.name]
+        start = 0 if after_key is None else after_key[0] + 1
+        end = spec.rows
+        if key_range is not None:
+            if key_range.lower is not None:
+                start = max(start, key_range.lower)
+            if key_range.upper is not None:
+                end = min(end, key_range.upper)
+        while start < end:
+            size = chunk_size() if callable(chunk_size) else chunk_size
+            stop = min(start + size, end)
+            yield self._rows(spec, start, stop)
+            start = stop
+
+    def get_key_boundaries(self, table: Table, parts: int,
+                           key_range: Optional[KeyRange] = None) -> List[Any]:
+        lower, upper = 0, self.tables[table.name].rows
+        if key_range is not None:
+            lower = key_range.lower if key_range.lower is not None else lower
+            upper = key_range.upper if key_range.upper is not None else upper
+        return [lower + (upper - lower) * i // parts for i in range(1, parts)]
+
+    def get_change_tracking_method(self, table: Table) -> Optional[str]:
+        return None
+
+    def read_changes(self, table: Table, columns: List[str], since: Optional[Any],
+                     chunk_size: int) -> Iterator[ChangeBatch]:
+        return iter(())
+
+    def checksum_range(self, table: Table, key_range: Optional[KeyRange] = None) -> RangeChecksum:
+        raise NotImplementedError("verification is not part of the benchmark suite")
+
+    def row_hashes(self, table: Table, key_range: Optional[KeyRange] = None) -> Dict[Tuple, str]:
+        raise NotImplementedError("verification is not part of the benchmark suite")
+
+    def _rows(self, spec: SyntheticTable, start: int, stop: int) -> List[Tuple]:
+        pools = self._pool(spec)
+        width = len(pools)
+        return [
+            (i,) + tuple(pools[c][(i * 7919 + c * 104729) % POOL_SIZE] for c in range(width))
+            for i in range(start, stop)
+        ]
+
+    def _pool(self, spec: SyntheticTable) -> List[List[Any]]:
+        pools = self._pools.get(spec.name)
+        if pools is None:
+            rng = random.Random(spec.seed)
+            pools = [[self._value(rng, data_type, spec) for _ in range(POOL_SIZE)]
+                     for data_type in spec.column_types]
+            self._pools[spec.name] = pools
+        return pools
+
+    @staticmethod
+    def _value(rng: random.Random, data_type: str, spec: SyntheticTable) -> Any:
+        if rng.random() < 0.05:
+            return None
+        if data_type in ('int', 'bigint', 'smallint', 'tinyint'):
+            return rng.randint(0, 2 ** 31 - 1)
+        if data_type == 'bit':
+            return rng.random() < 0.5
+        if data_type in ('float', 'real'):
+            return rng.uniform(-1e6, 1e6)
+        if data_type in ('decimal', 'numeric', 'money'):
+            return Decimal(rng.randint(-10 ** 12, 10 ** 12)).scaleb(-4)
+        if data_type in ('nvarchar', 'varchar', 'nchar', 'char', 'text', 'ntext'):
+            length = rng.randint(spec.text_length // 2, spec.text_length)
+            alphabet = 'abcdefghijklmnopqrstuvwxyz ԱԲԳաբգ\t\\'
+            return ''.join(rng.choice(alphabet) for _ in range(length))
+        if data_type in ('datetime2', 'datetime', 'smalldatetime'):
+            return datetime(2000, 1, 1) + timedelta(seconds=rng.randint(0, 10 ** 9),
+                                                    microseconds=rng.randint(0, 999999))
+        if data_type == 'date':
+            return (datetime(2000, 1, 1) + timedelta(days=rng.randint(0, 10000))).date()
+        if data_type == 'uniqueidentifier':
+            return str(uuid.UUID(int=rng.getrandbits(128))).upper()
+        if data_type in ('varbinary', 'binary', 'image'):
+            return rng.randbytes(rng.randint(spec.binary_length // 2, spec.binary_length))
+        raise ValueError(f"Unsupported synthetic type: {data_type}")
@@ -1,7 +1,15 @@
-from .models import Column, Index, Table, MigrationResult, MigrationStatistics
-from .ports import ISourceDatabase, ITargetDatabase, ITypeMapper, ILogger
+from .models import (Column, LobValue, Index, PartitionScheme, Table, KeyRange, TableSize, TableCheckpoint, ChangeBatch,
+                     TablePlan, TableRunEstimate, SpoolFile, SpoolTable, RangeChecksum, VerificationResult,
+                     MigrationResult, MigrationStatistics)
+from .ports import (ISourceDatabase, ITargetDatabase, ITypeMapper, ILogger, ICheckpointStore,
+                    IPlanCache, ISpoolReader, IMetricsExporter, IMigrationHook)
+from .errors import TransientDatabaseError
 
 __all__ = [
-    'Column', 'Index', 'Table', 'MigrationResult', 'MigrationStatistics',
-    'ISourceDatabase', 'ITargetDatabase', 'ITypeMapper', 'ILogger'
+    'Column', 'LobValue', 'Index', 'PartitionScheme', 'Table', 'KeyRange', 'TableSize', 'TableCheckpoint', 'ChangeBatch',
+    'TablePlan', 'TableRunEstimate', 'SpoolFile', 'SpoolTable', 'RangeChecksum', 'VerificationResult',
+    'MigrationResult', 'MigrationStatistics',
+    'ISourceDatabase', 'ITargetDatabase', 'ITypeMapper', 'ILogger', 'ICheckpointStore',
+    'IPlanCache', 'ISpoolReader', 'IMetricsExporter', 'IMigrationHook',
+    'TransientDatabaseError'
 ]
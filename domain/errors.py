@@ -0,0 +1,2 @@
+class TransientDatabaseError(Exception):
+    pass
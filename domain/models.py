@@ -1,10 +1,16 @@
 from __future__ import annotations  
+import threading
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, TYPE_CHECKING
+from typing import List, Dict, Optional, Any, Tuple, Callable, Iterator, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .ports import ITypeMapper  
 
+PORTABLE_ORDER_TYPES = frozenset({
+    'tinyint', 'smallint', 'int', 'bigint', 'decimal', 'numeric', 'money', 'smallmoney', 'float', 'real',
+    'date', 'time', 'datetime', 'datetime2', 'smalldatetime', 'datetimeoffset',
+})
+
 @dataclass
 class Column:
     name: str
@@ -18,11 +24,44 @@ class Column:
     def to_postgresql_type(self, type_mapper: 'ITypeMapper') -> str:
         return type_mapper.map_type(self)
 
+    @property
+    def is_lob(self) -> bool:
+        return self.max_length == -1 or self.data_type.lower() in ('text', 'ntext', 'image', 'xml')
+
+    @property
+    def has_portable_order(self) -> bool:
+        # Values that sort the same in MSSQL, PostgreSQL and Python, unlike collated strings or GUIDs.
+        return self.data_type.lower() in PORTABLE_ORDER_TYPES
+
+@dataclass
+class LobValue:
+    length: int
+    chunks: Callable[[], Iterator[Union[bytes, str]]]
+
+    def read(self) -> Union[bytes, str]:
+        parts = list(self.chunks())
+        if not parts:
+            return b''
+        return parts[0][:0].join(parts)
+
 @dataclass
 class Index:
     name: str
     columns: List[Dict[str, Any]]
     is_unique: bool = False
+    is_filtered: bool = False
+    is_disabled: bool = False
+
+@dataclass
+class PartitionScheme:
+    column: str
+    function: str
+    # Inclusive lower bounds of partitions 2..N (RANGE RIGHT semantics).
+    boundaries: List[Any] = field(default_factory=list)
+
+    @property
+    def partition_count(self) -> int:
+        return len(self.boundaries) + 1
 
 @dataclass
 class Table:
@@ -30,6 +69,171 @@ class Table:
     columns: List[Column] = field(default_factory=list)
     primary_keys: List[str] = field(default_factory=list)
     indexes: List[Index] = field(default_factory=list)
+    schema: str = 'dbo'
+    partitioning: Optional[PartitionScheme] = None
+
+    @property
+    def qualified_name(self) -> str:
+        return self.name if self.schema == 'dbo' else f"{self.schema}.{self.name}"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Table:
+        return cls(
+            name=data['name'],
+            columns=[Column(**c) for c in data['columns']],
+            primary_keys=list(data['primary_keys']),
+            indexes=[Index(**i) for i in data['indexes']],
+            schema=data['schema'],
+            partitioning=PartitionScheme(**data['partitioning']) if data.get('partitioning') else None
+        )
+
+    def get_key_columns(self) -> List[str]:
+        if self.primary_keys:
+            return list(self.primary_keys)
+        nullable = {col.name for col in self.columns if col.is_nullable}
+        for idx in self.indexes:
+            names = [c['name'] for c in idx.columns]
+            # A filtered or disabled unique index does not make rows unique across the table.
+            if (idx.is_unique and not idx.is_filtered and not idx.is_disabled
+                    and names and not nullable.intersection(names)):
+                return names
+        return []
+
+    def has_portable_key_order(self) -> bool:
+        names = set(self.get_key_columns())
+        if self.partitioning is not None:
+            names.add(self.partitioning.column)
+        return all(col.has_portable_order for col in self.columns if col.name in names)
+
+@dataclass
+class KeyRange:
+    column: str
+    lower: Optional[Any] = None
+    upper: Optional[Any] = None
+    partition: Optional[int] = None
+
+    @staticmethod
+    def split(column: str, boundaries: List[Any]) -> List['KeyRange']:
+        # Boundaries arrive in source collation order, which Python sorting would not preserve.
+        edges = [None] + list(dict.fromkeys(boundaries)) + [None]
+        return [KeyRange(column, edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+
+    @staticmethod
+    def partitions(scheme: PartitionScheme) -> List['KeyRange']:
+        # Partition numbers must line up with $PARTITION, so the boundaries are taken as-is.
+        edges = [None] + list(scheme.boundaries) + [None]
+        return [KeyRange(scheme.column, edges[i], edges[i + 1], partition=i + 1)
+                for i in range(len(edges) - 1)]
+
+@dataclass
+class TableSize:
+    row_count: int = 0
+    reserved_bytes: int = 0
+
+@dataclass
+class TableCheckpoint:
+    table_name: str
+    range_id: int = 0
+    last_key: Optional[Tuple] = None
+    rows_committed: int = 0
+    schema_created: bool = False
+    data_done: bool = False
+    indexes_done: bool = False
+    deferred: bool = False
+    boundaries: Optional[List[Any]] = None
+
+@dataclass
+class ChangeBatch:
+    upserts: List[Tuple] = field(default_factory=list)
+    deletes: List[Tuple] = field(default_factory=list)
+    high_water_mark: Optional[Any] = None
+
+@dataclass
+class TablePlan:
+    table: Table
+    fingerprint: str
+    pg_types: Dict[str, str] = field(default_factory=dict)
+    ddl: List[str] = field(default_factory=list)
+    deferred_ddl: List[str] = field(default_factory=list)
+    read_strategy: str = 'keyset'
+    estimated_rows: int = 0
+    estimated_bytes: int = 0
+
+    def ddl_for(self, deferred: bool) -> List[str]:
+        return self.deferred_ddl if deferred else self.ddl
+
+@dataclass
+class TableRunEstimate:
+    table_name: str
+    row_count: int = 0
+    reserved_bytes: int = 0
+    has_key: bool = False
+    has_lobs: bool = False
+    index_count: int = 0
+    read_strategy: str = 'keyset'
+    parallelism: int = 1
+    batch_size: int = 0
+    adaptive_batching: bool = False
+    deferred_constraints: bool = False
+    row_bytes: float = 0.0
+    sample_rows: int = 0
+    sample_seconds: float = 0.0
+    read_rows_per_second: float = 0.0
+    load_seconds: float = 0.0
+    index_seconds: float = 0.0
+
+    @property
+    def estimated_seconds(self) -> float:
+        return self.load_seconds + self.index_seconds
+
+@dataclass
+class SpoolFile:
+    path: str
+    format: str
+    rows: int = 0
+    size_bytes: int = 0
+
+@dataclass
+class SpoolTable:
+    table: Table
+    deferred: bool = False
+    complete: bool = False
+    files: List[SpoolFile] = field(default_factory=list)
+
+@dataclass
+class RangeChecksum:
+    row_count: int = 0
+    digest: Tuple[int, int] = (0, 0)
+
+@dataclass
+class VerificationResult:
+    table_name: str
+    success: bool
+    source_rows: int = 0
+    target_rows: int = 0
+    ranges_checked: int = 0
+    mismatched_ranges: int = 0
+    keyed: bool = True
+    missing_keys: List[Tuple] = field(default_factory=list)
+    extra_keys: List[Tuple] = field(default_factory=list)
+    changed_keys: List[Tuple] = field(default_factory=list)
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+    @property
+    def matches(self) -> bool:
+        if not self.success or self.source_rows != self.target_rows:
+            return False
+        if not self.keyed:
+            return self.mismatched_ranges == 0
+        return not (self.missing_keys or self.extra_keys or self.changed_keys)
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
 
 @dataclass
 class MigrationResult:
@@ -38,6 +242,48 @@ class MigrationResult:
     success: bool
     error: Optional[str] = None
     duration_seconds: float = 0.0
+    index_duration_seconds: float = 0.0
+    deferred_constraints: bool = False
+    skipped: bool = False
+    bytes_migrated: int = 0
+    batch_count: int = 0
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    batch_latencies: List[float] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_migrated / self.duration_seconds if self.duration_seconds else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_migrated / self.duration_seconds if self.duration_seconds else 0.0
+
+    @property
+    def p50_batch_seconds(self) -> float:
+        return percentile(self.batch_latencies, 50)
+
+    @property
+    def p95_batch_seconds(self) -> float:
+        return percentile(self.batch_latencies, 95)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'table_name': self.table_name,
+            'success': self.success,
+            'skipped': self.skipped,
+            'error': self.error,
+            'rows_migrated': self.rows_migrated,
+            'bytes_migrated': self.bytes_migrated,
+            'batch_count': self.batch_count,
+            'duration_seconds': self.duration_seconds,
+            'index_duration_seconds': self.index_duration_seconds,
+            'deferred_constraints': self.deferred_constraints,
+            'stage_seconds': dict(self.stage_seconds),
+            'rows_per_second': self.rows_per_second,
+            'bytes_per_second': self.bytes_per_second,
+            'p50_batch_seconds': self.p50_batch_seconds,
+            'p95_batch_seconds': self.p95_batch_seconds,
+        }
 
 class MigrationStatistics:
     def __init__(self):
@@ -45,11 +291,17 @@ class MigrationStatistics:
         self.total_rows = 0
         self.failed_tables: List[str] = []
         self.results: List[MigrationResult] = []
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> List[MigrationResult]:
+        with self._lock:
+            return list(self.results)
 
     def add_result(self, result: MigrationResult) -> None:
-        self.results.append(result)
-        if result.success:
-            self.tables_processed += 1
-            self.total_rows += result.rows_migrated
-        else:
-            self.failed_tables.append(result.table_name)
+        with self._lock:
+            self.results.append(result)
+            if result.success:
+                self.tables_processed += 1
+                self.total_rows += result.rows_migrated
+            else:
+                self.failed_tables.append(result.table_name)
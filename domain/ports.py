@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
-from .models import Table, Index, Column  
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from .models import (Table, Index, Column, KeyRange, TableSize, TableCheckpoint, ChangeBatch,
+                     RangeChecksum, TablePlan, SpoolFile, SpoolTable, MigrationResult, MigrationStatistics)
 
 
 class ISourceDatabase(ABC):
@@ -22,12 +23,53 @@ class ISourceDatabase(ABC):
         pass
     
     @abstractmethod
-    def read_data_batch(self, table_name: str, columns: List[str], 
-                       offset: int, batch_size: int) -> List[Tuple]:
+    def get_table_schemas(self, table_names: List[str]) -> Dict[str, Table]:
         pass
     
     @abstractmethod
-    def count_rows(self, table_name: str) -> int:
+    def get_table_sizes(self) -> Dict[str, TableSize]:
+        pass
+    
+    @abstractmethod
+    def get_schema_fingerprints(self) -> Dict[str, str]:
+        pass
+    
+    @abstractmethod
+    def read_data_batch(self, table: Table, columns: List[str],
+                       last_key: Optional[Tuple], batch_size: int) -> List[Tuple]:
+        pass
+    
+    @abstractmethod
+    def stream_rows(self, table: Table, columns: List[str],
+                    chunk_size: Union[int, Callable[[], int]],
+                    after_key: Optional[Tuple] = None,
+                    key_range: Optional[KeyRange] = None) -> Iterator[List[Tuple]]:
+        pass
+    
+    @abstractmethod
+    def get_key_boundaries(self, table: Table, parts: int,
+                           key_range: Optional[KeyRange] = None) -> List[Any]:
+        pass
+    
+    @abstractmethod
+    def count_rows(self, table_name: str, exact: bool = False) -> int:
+        pass
+    
+    @abstractmethod
+    def get_change_tracking_method(self, table: Table) -> Optional[str]:
+        pass
+    
+    @abstractmethod
+    def read_changes(self, table: Table, columns: List[str], since: Optional[Any],
+                     chunk_size: int) -> Iterator[ChangeBatch]:
+        pass
+    
+    @abstractmethod
+    def checksum_range(self, table: Table, key_range: Optional[KeyRange] = None) -> RangeChecksum:
+        pass
+    
+    @abstractmethod
+    def row_hashes(self, table: Table, key_range: Optional[KeyRange] = None) -> Dict[Tuple, str]:
         pass
 
 
@@ -42,16 +84,55 @@ class ITargetDatabase(ABC):
         pass
     
     @abstractmethod
-    def create_table(self, table: Table) -> None:
+    def table_ddl(self, table: Table, deferred: bool = False) -> List[str]:
+        pass
+    
+    @abstractmethod
+    def create_table(self, table: Table, deferred: bool = False,
+                     ddl: Optional[List[str]] = None) -> None:
+        pass
+    
+    @abstractmethod
+    def begin_table_load(self, table: Table) -> None:
         pass
     
     @abstractmethod
-    def insert_batch(self, table_name: str, columns: List[str], 
+    def insert_batch(self, table: Table, columns: List[str],
                     rows: List[Tuple]) -> None:
         pass
     
     @abstractmethod
-    def create_indexes(self, table_name: str, indexes: List[Index]) -> None:
+    def copy_from(self, table: Table, columns: List[str], stream: BinaryIO, fmt: str) -> None:
+        pass
+    
+    @abstractmethod
+    def upsert_batch(self, table: Table, columns: List[str],
+                     rows: List[Tuple]) -> None:
+        pass
+    
+    @abstractmethod
+    def delete_batch(self, table: Table, keys: List[Tuple]) -> None:
+        pass
+    
+    @abstractmethod
+    def create_indexes(self, table: Table, indexes: List[Index]) -> None:
+        pass
+    
+    @abstractmethod
+    def build_deferred_constraints(self, table: Table) -> None:
+        pass
+    
+    @abstractmethod
+    def analyze_table(self, table: Table, vacuum: bool = False) -> None:
+        pass
+    
+    @abstractmethod
+    def delete_rows_after(self, table: Table, last_key: Optional[Tuple],
+                          key_range: Optional[KeyRange] = None) -> None:
+        pass
+    
+    @abstractmethod
+    def has_rows(self, table: Table) -> bool:
         pass
     
     @abstractmethod
@@ -65,6 +146,14 @@ class ITargetDatabase(ABC):
     @abstractmethod
     def rollback_transaction(self) -> None:
         pass
+    
+    @abstractmethod
+    def checksum_range(self, table: Table, key_range: Optional[KeyRange] = None) -> RangeChecksum:
+        pass
+    
+    @abstractmethod
+    def row_hashes(self, table: Table, key_range: Optional[KeyRange] = None) -> Dict[Tuple, str]:
+        pass
 
 
 class ITypeMapper(ABC):
@@ -87,3 +176,87 @@ class ILogger(ABC):
     @abstractmethod
     def error(self, message: str) -> None:
         pass
+    
+    @abstractmethod
+    def progress(self, message: str, fields: Dict[str, Any]) -> None:
+        pass
+
+
+
+class ICheckpointStore(ABC):
+    
+    @abstractmethod
+    def get(self, table_name: str, range_id: int = 0) -> Optional[TableCheckpoint]:
+        pass
+    
+    @abstractmethod
+    def save(self, checkpoint: TableCheckpoint) -> None:
+        pass
+    
+    @abstractmethod
+    def clear(self, table_name: Optional[str] = None) -> None:
+        pass
+    
+    @abstractmethod
+    def get_sync_state(self, table_name: str) -> Optional[Any]:
+        pass
+    
+    @abstractmethod
+    def save_sync_state(self, table_name: str, high_water_mark: Any) -> None:
+        pass
+
+
+
+class IPlanCache(ABC):
+    
+    @abstractmethod
+    def get(self, table_name: str) -> Optional[TablePlan]:
+        pass
+    
+    @abstractmethod
+    def save(self, plan: TablePlan) -> None:
+        pass
+    
+    @abstractmethod
+    def clear(self, table_name: Optional[str] = None) -> None:
+        pass
+
+
+
+class ISpoolReader(ABC):
+    
+    @abstractmethod
+    def get_tables(self) -> List[SpoolTable]:
+        pass
+    
+    @abstractmethod
+    def open_file(self, spool_file: SpoolFile) -> BinaryIO:
+        pass
+
+
+
+class IMetricsExporter(ABC):
+    
+    @abstractmethod
+    def export(self, stats: MigrationStatistics, in_progress: List[MigrationResult]) -> None:
+        pass
+
+
+
+class IMigrationHook(ABC):
+    
+    @abstractmethod
+    def before_table(self, table_name: str) -> None:
+        pass
+    
+    @abstractmethod
+    def after_table(self, table_name: str) -> None:
+        pass
+    
+    @abstractmethod
+    def before_stage(self, table_name: str, stage: str) -> None:
+        pass
+    
+    @abstractmethod
+    def after_stage(self, table_name: str, stage: str, seconds: float) -> None:
+        pass
@@ -1,11 +1,27 @@
 from .mssql_adapter import MSSQLAdapter
 from .postsql_adapter import PostgreSQLAdapter
 from .type_mapper import MSSQLToPostgreSQLTypeMapper
-from .logger_adapter import PythonLoggingAdapter
+from .logger_adapter import PythonLoggingAdapter, QueueLoggingAdapter
+from .checkpoint_store import SQLiteCheckpointStore
+from .plan_cache import SQLitePlanCache
+from .connection_pool import ConnectionPool
+from .metrics_exporter import FileMetricsExporter
+from .spool_adapter import SpoolTargetAdapter, SpoolDirectoryReader
+from .profiling_hooks import CProfileHook, TracemallocHook, SamplingProfilerHook
 
 __all__ = [
     'MSSQLAdapter',
     'PostgreSQLAdapter',
     'MSSQLToPostgreSQLTypeMapper',
-    'PythonLoggingAdapter'
+    'PythonLoggingAdapter',
+    'QueueLoggingAdapter',
+    'SQLiteCheckpointStore',
+    'SQLitePlanCache',
+    'ConnectionPool',
+    'FileMetricsExporter',
+    'SpoolTargetAdapter',
+    'SpoolDirectoryReader',
+    'CProfileHook',
+    'TracemallocHook',
+    'SamplingProfilerHook'
 ]
\ No newline at end of file
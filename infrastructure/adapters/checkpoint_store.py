@@ -0,0 +1,143 @@
+import base64
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Optional
+from domain.ports import ICheckpointStore
+from domain.models import TableCheckpoint
+
+
+def encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'$t': 'datetime', 'v': value.isoformat()}
+    if isinstance(value, date):
+        return {'$t': 'date', 'v': value.isoformat()}
+    if isinstance(value, time):
+        return {'$t': 'time', 'v': value.isoformat()}
+    if isinstance(value, Decimal):
+        return {'$t': 'decimal', 'v': str(value)}
+    if isinstance(value, uuid.UUID):
+        return {'$t': 'uuid', 'v': str(value)}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {'$t': 'bytes', 'v': base64.b64encode(bytes(value)).decode('ascii')}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: encode_value(v) for k, v in value.items()}
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [decode_value(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if '$t' not in value:
+        return {k: decode_value(v) for k, v in value.items()}
+    kind, raw = value['$t'], value['v']
+    if kind == 'datetime':
+        return datetime.fromisoformat(raw)
+    if kind == 'date':
+        return date.fromisoformat(raw)
+    if kind == 'time':
+        return time.fromisoformat(raw)
+    if kind == 'decimal':
+        return Decimal(raw)
+    if kind == 'uuid':
+        return uuid.UUID(raw)
+    if kind == 'bytes':
+        return base64.b64decode(raw)
+    raise ValueError(f"Unknown checkpoint value type: {kind}")
+
+
+class SQLiteCheckpointStore(ICheckpointStore):
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS table_checkpoints (
+                table_name TEXT NOT NULL,
+                range_id INTEGER NOT NULL,
+                last_key TEXT,
+                rows_committed INTEGER NOT NULL,
+                schema_created INTEGER NOT NULL,
+                data_done INTEGER NOT NULL,
+                indexes_done INTEGER NOT NULL,
+                deferred INTEGER NOT NULL,
+                boundaries TEXT,
+                PRIMARY KEY (table_name, range_id)
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS sync_state (
+                table_name TEXT PRIMARY KEY,
+                high_water_mark TEXT NOT NULL
+            )
+        """)
+
+    def get(self, table_name: str, range_id: int = 0) -> Optional[TableCheckpoint]:
+        with self._lock:
+            row = self._conn.execute("""
+                SELECT last_key, rows_committed, schema_created, data_done,
+                       indexes_done, deferred, boundaries
+                FROM table_checkpoints WHERE table_name = ? AND range_id = ?
+            """, (table_name, range_id)).fetchone()
+        if row is None:
+            return None
+        return TableCheckpoint(
+            table_name=table_name,
+            range_id=range_id,
+            last_key=tuple(decode_value(json.loads(row[0]))) if row[0] else None,
+            rows_committed=row[1],
+            schema_created=bool(row[2]),
+            data_done=bool(row[3]),
+            indexes_done=bool(row[4]),
+            deferred=bool(row[5]),
+            boundaries=decode_value(json.loads(row[6])) if row[6] else None
+        )
+
+    def save(self, checkpoint: TableCheckpoint) -> None:
+        last_key = json.dumps(encode_value(checkpoint.last_key)) if checkpoint.last_key is not None else None
+        boundaries = json.dumps(encode_value(checkpoint.boundaries)) if checkpoint.boundaries is not None else None
+        with self._lock:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO table_checkpoints
+                    (table_name, range_id, last_key, rows_committed, schema_created,
+                     data_done, indexes_done, deferred, boundaries)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (checkpoint.table_name, checkpoint.range_id, last_key,
+                  checkpoint.rows_committed, int(checkpoint.schema_created),
+                  int(checkpoint.data_done), int(checkpoint.indexes_done),
+                  int(checkpoint.deferred), boundaries))
+
+    def clear(self, table_name: Optional[str] = None) -> None:
+        with self._lock:
+            if table_name is None:
+                self._conn.execute("DELETE FROM table_checkpoints")
+            else:
+                self._conn.execute("DELETE FROM table_checkpoints WHERE table_name = ?", (table_name,))
+
+    def get_sync_state(self, table_name: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water_mark FROM sync_state WHERE table_name = ?", (table_name,)
+            ).fetchone()
+        return decode_value(json.loads(row[0])) if row else None
+
+    def save_sync_state(self, table_name: str, high_water_mark: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (table_name, high_water_mark) VALUES (?, ?)",
+                (table_name, json.dumps(encode_value(high_water_mark)))
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
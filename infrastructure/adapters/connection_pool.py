@@ -0,0 +1,62 @@
+import threading
+from typing import Any, Callable, List, Optional
+
+
+class ConnectionPool:
+
+    def __init__(self, open_connection: Callable[[], Any],
+                 is_alive: Callable[[Any], bool],
+                 prepare: Optional[Callable[[], None]] = None,
+                 max_idle: int = 8):
+        self.open_connection = open_connection
+        self.is_alive = is_alive
+        self.prepare = prepare
+        self.max_idle = max_idle
+        self._idle: List[Any] = []
+        self._lock = threading.Lock()
+        self._prepare_lock = threading.Lock()
+        self._prepared = prepare is None
+
+    def acquire(self) -> Any:
+        if not self._prepared:
+            with self._prepare_lock:
+                if not self._prepared:
+                    self.prepare()
+                    self._prepared = True
+
+        while True:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                return self.open_connection()
+            if self.is_alive(connection):
+                return connection
+            self._close(connection)
+
+    def release(self, connection: Any) -> None:
+        try:
+            connection.rollback()
+        except Exception:
+            self._close(connection)
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(connection)
+                return
+        self._close(connection)
+
+    def discard(self, connection: Any) -> None:
+        self._close(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            self._close(connection)
+
+    @staticmethod
+    def _close(connection: Any) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
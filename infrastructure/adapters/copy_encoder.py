@@ -0,0 +1,278 @@
+import io
+import re
+import struct
+import uuid
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+from domain.models import LobValue
+
+
+PG_EPOCH_DATE = date(2000, 1, 1)
+PG_EPOCH = datetime(2000, 1, 1)
+PG_EPOCH_TZ = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+BINARY_TRAILER = struct.pack('!h', -1)
+NULL_FIELD = struct.pack('!i', -1)
+
+ENCODE_ERRORS = (TypeError, ValueError, AttributeError, OverflowError, struct.error)
+BINARY_VALUES = (bytes, bytearray, memoryview)
+
+
+def base_pg_type(pg_type: str) -> str:
+    return re.sub(r'\(.*?\)', '', pg_type).strip().upper()
+
+
+def _pack_sized(fmt: str) -> Callable[[Any], bytes]:
+    packer = struct.Struct('!i' + fmt).pack
+    size = struct.calcsize('!' + fmt)
+    return lambda value: packer(size, value)
+
+
+def _text_value(value: Any) -> str:
+    # Unmapped binary types fall back to TEXT; str() would write their repr.
+    if isinstance(value, BINARY_VALUES):
+        raise TypeError(f"binary value for a text column: {type(value).__name__}")
+    return str(value)
+
+
+def _bin_text(value: Any) -> bytes:
+    data = _text_value(value).encode('utf-8')
+    return struct.pack('!i', len(data)) + data
+
+
+def _bin_bytea(value: Any) -> bytes:
+    data = bytes(value)
+    return struct.pack('!i', len(data)) + data
+
+
+def _bin_uuid(value: Any) -> bytes:
+    if not isinstance(value, uuid.UUID):
+        value = uuid.UUID(str(value))
+    return struct.pack('!i', 16) + value.bytes
+
+
+def _bin_date(value: date) -> bytes:
+    if isinstance(value, datetime):
+        value = value.date()
+    return struct.pack('!ii', 4, (value - PG_EPOCH_DATE).days)
+
+
+def _micros(delta) -> int:
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _bin_timestamp(value: datetime) -> bytes:
+    if value.tzinfo is not None:
+        raise ValueError("timezone-aware value for TIMESTAMP")
+    return struct.pack('!iq', 8, _micros(value - PG_EPOCH))
+
+
+def _bin_timestamptz(value: datetime) -> bytes:
+    if value.tzinfo is None:
+        raise ValueError("naive value for TIMESTAMP WITH TIME ZONE")
+    return struct.pack('!iq', 8, _micros(value - PG_EPOCH_TZ))
+
+
+def _bin_time(value: time) -> bytes:
+    micros = ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond
+    return struct.pack('!iq', 8, micros)
+
+
+def _bin_numeric(value: Any) -> bytes:
+    dec = value if isinstance(value, Decimal) else Decimal(str(value))
+    if dec.is_nan():
+        body = struct.pack('!hhHH', 0, 0, 0xC000, 0)
+        return struct.pack('!i', len(body)) + body
+    if dec.is_infinite():
+        raise ValueError("infinite NUMERIC value")
+
+    sign, digits, exponent = dec.as_tuple()
+    text = ''.join(map(str, digits))
+    if exponent >= 0:
+        int_part, frac_part = text + '0' * exponent, ''
+    else:
+        text = text.rjust(-exponent, '0')
+        int_part, frac_part = text[:exponent], text[exponent:]
+    dscale = len(frac_part)
+
+    int_part = int_part.rjust((len(int_part) + 3) // 4 * 4, '0')
+    frac_part = frac_part.ljust((len(frac_part) + 3) // 4 * 4, '0')
+    groups = [int(int_part[i:i + 4]) for i in range(0, len(int_part), 4)]
+    weight = len(groups) - 1
+    groups += [int(frac_part[i:i + 4]) for i in range(0, len(frac_part), 4)]
+
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+
+    body = struct.pack(f'!hhHH{len(groups)}H', len(groups), weight,
+                       0x4000 if sign else 0x0000, dscale, *groups)
+    return struct.pack('!i', len(body)) + body
+
+
+BINARY_ENCODERS = {
+    'SMALLINT': _pack_sized('h'),
+    'INTEGER': _pack_sized('i'),
+    'BIGINT': _pack_sized('q'),
+    'BOOLEAN': _pack_sized('?'),
+    'REAL': _pack_sized('f'),
+    'DOUBLE PRECISION': _pack_sized('d'),
+    'NUMERIC': _bin_numeric,
+    'CHAR': _bin_text,
+    'VARCHAR': _bin_text,
+    'TEXT': _bin_text,
+    'XML': _bin_text,
+    'BYTEA': _bin_bytea,
+    'UUID': _bin_uuid,
+    'DATE': _bin_date,
+    'TIMESTAMP': _bin_timestamp,
+    'TIMESTAMP WITH TIME ZONE': _bin_timestamptz,
+    'TIME': _bin_time,
+}
+
+
+_TEXT_ESCAPES = str.maketrans({'\\': '\\\\', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
+
+
+def _txt_plain(value: Any) -> str:
+    return _text_value(value)
+
+
+def _txt_escaped(value: Any) -> str:
+    return _text_value(value).translate(_TEXT_ESCAPES)
+
+
+def _txt_bool(value: Any) -> str:
+    return 't' if value else 'f'
+
+
+def _txt_bytea(value: Any) -> str:
+    return '\\\\x' + bytes(value).hex()
+
+
+def _txt_temporal(value: Any) -> str:
+    return value.isoformat()
+
+
+def _lob_bytea(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    yield b'\\\\x'
+    for chunk in chunks:
+        yield bytes(chunk).hex().encode('ascii')
+
+
+def _lob_text(chunks: Iterable[str]) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield chunk.translate(_TEXT_ESCAPES).encode('utf-8')
+
+
+class CopyStream(io.RawIOBase):
+
+    def __init__(self, pieces: Iterator[bytes]):
+        self._pieces = pieces
+        self._buffer = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            piece = next(self._pieces, None)
+            if piece is None:
+                break
+            self._buffer += piece
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def readinto(self, target) -> int:
+        data = self.read(len(target))
+        target[:len(data)] = data
+        return len(data)
+
+
+TEXT_ENCODERS = {
+    'SMALLINT': _txt_plain,
+    'INTEGER': _txt_plain,
+    'BIGINT': _txt_plain,
+    'BOOLEAN': _txt_bool,
+    'REAL': _txt_plain,
+    'DOUBLE PRECISION': _txt_plain,
+    'NUMERIC': _txt_plain,
+    'BYTEA': _txt_bytea,
+    'UUID': _txt_plain,
+    'DATE': _txt_temporal,
+    'TIMESTAMP': _txt_temporal,
+    'TIMESTAMP WITH TIME ZONE': _txt_temporal,
+    'TIME': _txt_temporal,
+}
+
+
+class CopyEncoder:
+
+    def __init__(self, pg_types: Sequence[str]):
+        self.pg_types = [base_pg_type(t) for t in pg_types]
+        self._binary: Optional[List[Callable[[Any], bytes]]] = None
+        if all(t in BINARY_ENCODERS for t in self.pg_types):
+            self._binary = [BINARY_ENCODERS[t] for t in self.pg_types]
+        self._text = [TEXT_ENCODERS.get(t, _txt_escaped) for t in self.pg_types]
+        self._lob = [_lob_bytea if t == 'BYTEA' else _lob_text for t in self.pg_types]
+        self._field_count = struct.pack('!h', len(self.pg_types))
+
+    @property
+    def supports_binary(self) -> bool:
+        return self._binary is not None
+
+    def encode_binary(self, rows: Sequence[Tuple]) -> io.BytesIO:
+        encoders = self._binary
+        field_count = self._field_count
+        buffer = io.BytesIO()
+        write = buffer.write
+        write(BINARY_HEADER)
+        for row in rows:
+            write(field_count)
+            for encode, value in zip(encoders, row):
+                write(NULL_FIELD if value is None else encode(value))
+        write(BINARY_TRAILER)
+        buffer.seek(0)
+        return buffer
+
+    def encode_text(self, rows: Sequence[Tuple]) -> io.BytesIO:
+        encoders = self._text
+        lines = []
+        for row in rows:
+            lines.append('\t'.join([
+                '\\N' if value is None else encode(value)
+                for encode, value in zip(encoders, row)
+            ]))
+        lines.append('')
+        return io.BytesIO('\n'.join(lines).encode('utf-8'))
+
+    def stream_text(self, rows: Sequence[Tuple]) -> CopyStream:
+        return CopyStream(self._iter_text(rows))
+
+    def _iter_text(self, rows: Sequence[Tuple]) -> Iterator[bytes]:
+        encoders = self._text
+        lob_encoders = self._lob
+        for row in rows:
+            parts = []
+            for i, value in enumerate(row):
+                if i:
+                    parts.append('\t')
+                if value is None:
+                    parts.append('\\N')
+                elif isinstance(value, LobValue):
+                    yield ''.join(parts).encode('utf-8')
+                    parts = []
+                    yield from lob_encoders[i](value.chunks())
+                else:
+                    parts.append(encoders[i](value))
+            parts.append('\n')
+            yield ''.join(parts).encode('utf-8')
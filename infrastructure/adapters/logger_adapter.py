@@ -1,13 +1,22 @@
+import atexit
+import json
 import logging
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, TextIO
 from domain.ports import ILogger
 
 
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
 class PythonLoggingAdapter(ILogger):
     
     def __init__(self):
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
+            format=LOG_FORMAT
         )
         self.logger = logging.getLogger(__name__)
     
@@ -18,4 +27,59 @@ class PythonLoggingAdapter(ILogger):
         self.logger.warning(message)
     
     def error(self, message: str) -> None:
-        self.logger.error(message)
\ No newline at end of file
+        self.logger.error(message)
+    
+    def progress(self, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.info(message)
+
+
+class JsonLogFormatter(logging.Formatter):
+    
+    def format(self, record: logging.LogRecord) -> str:
+        document = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname.lower(),
+            'message': record.getMessage().strip(),
+        }
+        document.update(getattr(record, 'fields', {}))
+        return json.dumps(document, ensure_ascii=False, default=str)
+
+
+class _RecordQueueHandler(QueueHandler):
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is left to the listener thread; messages arrive pre-rendered.
+        return record
+
+
+class QueueLoggingAdapter(ILogger):
+    
+    def __init__(self, json_format: bool = False, stream: Optional[TextIO] = None):
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(JsonLogFormatter() if json_format else logging.Formatter(LOG_FORMAT))
+        self._queue: queue.Queue = queue.Queue()
+        self._listener = QueueListener(self._queue, handler)
+        self.logger = logging.getLogger(f"{__name__}.{id(self)}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(_RecordQueueHandler(self._queue))
+        self._listener.start()
+        self._closed = False
+        atexit.register(self.close)
+    
+    def info(self, message: str) -> None:
+        self.logger.info(message)
+    
+    def warning(self, message: str) -> None:
+        self.logger.warning(message)
+    
+    def error(self, message: str) -> None:
+        self.logger.error(message)
+    
+    def progress(self, message: str, fields: Dict[str, Any]) -> None:
+        self.logger.info(message, extra={'fields': fields})
+    
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._listener.stop()
@@ -0,0 +1,90 @@
+import json
+import os
+import time
+from typing import Dict, List, Optional
+from domain.ports import IMetricsExporter
+from domain.models import MigrationResult, MigrationStatistics
+
+
+class FileMetricsExporter(IMetricsExporter):
+
+    PREFIX = 'mssql2pg'
+
+    def __init__(self, json_path: Optional[str] = None, prometheus_path: Optional[str] = None):
+        self.json_path = json_path
+        self.prometheus_path = prometheus_path
+
+    def export(self, stats: MigrationStatistics, in_progress: List[MigrationResult]) -> None:
+        finished = stats.snapshot()
+        if self.json_path:
+            self._write(self.json_path, self._render_json(stats, finished, in_progress))
+        if self.prometheus_path:
+            self._write(self.prometheus_path, self._render_prometheus(stats, finished, in_progress))
+
+    def _render_json(self, stats: MigrationStatistics, finished: List[MigrationResult],
+                     in_progress: List[MigrationResult]) -> str:
+        document = {
+            'generated_at': time.time(),
+            'tables_processed': stats.tables_processed,
+            'total_rows': stats.total_rows,
+            'failed_tables': list(stats.failed_tables),
+            'tables': [r.to_dict() for r in finished],
+            'in_progress': [r.to_dict() for r in in_progress],
+        }
+        return json.dumps(document, indent=2, ensure_ascii=False)
+
+    def _render_prometheus(self, stats: MigrationStatistics, finished: List[MigrationResult],
+                           in_progress: List[MigrationResult]) -> str:
+        lines: List[str] = []
+        self._metric(lines, 'tables_processed', 'gauge', 'Tables migrated successfully',
+                     [({}, stats.tables_processed)])
+        self._metric(lines, 'tables_failed', 'gauge', 'Tables that failed to migrate',
+                     [({}, len(stats.failed_tables))])
+
+        tables = [(r, 'done' if r.success else 'failed') for r in finished]
+        tables += [(r, 'running') for r in in_progress]
+        per_table = [
+            ('rows_total', 'counter', 'Rows written to the target', lambda r: r.rows_migrated),
+            ('bytes_total', 'counter', 'Estimated bytes written to the target', lambda r: r.bytes_migrated),
+            ('batches_total', 'counter', 'Batches committed', lambda r: r.batch_count),
+            ('duration_seconds', 'gauge', 'Wall time spent on the table', lambda r: r.duration_seconds),
+            ('rows_per_second', 'gauge', 'Row throughput', lambda r: r.rows_per_second),
+            ('bytes_per_second', 'gauge', 'Byte throughput', lambda r: r.bytes_per_second),
+        ]
+        for name, kind, help_text, value in per_table:
+            self._metric(lines, f'table_{name}', kind, help_text,
+                         [({'table': r.table_name, 'state': state}, value(r)) for r, state in tables])
+
+        self._metric(lines, 'table_stage_seconds', 'gauge', 'Time spent per stage',
+                     [({'table': r.table_name, 'stage': stage}, seconds)
+                      for r, _ in tables for stage, seconds in r.stage_seconds.items()])
+        self._metric(lines, 'table_batch_seconds', 'gauge', 'Batch commit latency quantiles',
+                     [({'table': r.table_name, 'quantile': q}, v)
+                      for r, _ in tables if r.batch_latencies
+                      for q, v in (('0.5', r.p50_batch_seconds), ('0.95', r.p95_batch_seconds))])
+        return "\n".join(lines) + "\n"
+
+    def _metric(self, lines: List[str], name: str, kind: str, help_text: str,
+                samples: List) -> None:
+        full_name = f"{self.PREFIX}_{name}"
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} {kind}")
+        for labels, value in samples:
+            lines.append(f"{full_name}{self._labels(labels)} {float(value)!r}")
+
+    @staticmethod
+    def _labels(labels: Dict[str, str]) -> str:
+        if not labels:
+            return ''
+        escaped = (
+            f'{key}="' + str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+            for key, value in labels.items()
+        )
+        return '{' + ','.join(escaped) + '}'
+
+    @staticmethod
+    def _write(path: str, content: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
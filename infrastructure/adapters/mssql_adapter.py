@@ -1,113 +1,786 @@
+import codecs
+import functools
+import hashlib
+import json
 import pyodbc
-from typing import Dict, List, Tuple
+import threading
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from domain.ports import ISourceDatabase, ITypeMapper
-from domain.models import Table, Column, Index
+from domain.errors import TransientDatabaseError
+from domain.models import (Table, Column, Index, KeyRange, TableSize, ChangeBatch, RangeChecksum, LobValue,
+                           PartitionScheme)
+from .connection_pool import ConnectionPool
+
+
+# Communication link failures, login/connection timeouts and deadlock victims.
+TRANSIENT_SQLSTATES = ('08001', '08003', '08004', '08007', '08S01', '40001', 'HYT00', 'HYT01')
+
+
+def is_transient(error: pyodbc.Error) -> bool:
+    return (isinstance(error, pyodbc.OperationalError)
+            or (bool(error.args) and error.args[0] in TRANSIENT_SQLSTATES))
+
+
+def transient_errors(method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        except pyodbc.Error as e:
+            if is_transient(e):
+                raise TransientDatabaseError(str(e)) from e
+            raise
+    return wrapper
 
 
 class MSSQLAdapter(ISourceDatabase):
     
-    def __init__(self, config: Dict[str, str], type_mapper: ITypeMapper):
+    SAMPLE_PERCENT = 1
+    SQL_DATETIMEOFFSET = -155
+    HASH_COLLATION = 'Latin1_General_100_BIN2_UTF8'
+    INTEGER_TYPES = ('bit', 'tinyint', 'smallint', 'int', 'bigint', 'decimal', 'numeric')
+    BINARY_TYPES = ('binary', 'varbinary', 'image', 'timestamp', 'rowversion')
+    ROWVERSION_TYPES = ('timestamp', 'rowversion')
+    NUMERIC_TYPES = ('tinyint', 'smallint', 'int', 'bigint', 'decimal', 'numeric',
+                     'money', 'smallmoney', 'float', 'real')
+    # RANGE LEFT functions can only be turned into inclusive lower bounds for discrete types.
+    RANGE_LEFT_STEPS = {'tinyint': 1, 'smallint': 1, 'int': 1, 'bigint': 1, 'date': timedelta(days=1)}
+    
+    def __init__(self, config: Dict[str, str], type_mapper: ITypeMapper,
+                 lob_inline_bytes: int = 256 * 1024, lob_chunk_bytes: int = 1024 * 1024,
+                 pool: Optional[ConnectionPool] = None):
         self.config = config
+        self.pool = pool or self.create_pool(config)
         self.type_mapper = type_mapper
+        self.lob_inline_bytes = lob_inline_bytes
+        self.lob_chunk_bytes = lob_chunk_bytes
         self.connection = None
+        self._catalog: Optional[Dict[str, Table]] = None
+        self._catalog_complete = False
+        self._table_refs: Optional[Dict[str, Table]] = None
+        self._fingerprints: Optional[Dict[str, str]] = None
+        self._sizes: Optional[Dict[str, TableSize]] = None
+        self._lob_local = threading.local()
+        self._lob_connections: List = []
+        self._lob_lock = threading.Lock()
     
-    def connect(self) -> None:
+    @classmethod
+    def create_pool(cls, config: Dict[str, str], max_idle: int = 8) -> ConnectionPool:
+        return ConnectionPool(lambda: cls._open_connection(config), cls._is_alive, max_idle=max_idle)
+    
+    @classmethod
+    def _open_connection(cls, config: Dict[str, str]):
         conn_str = (
         f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-        f"SERVER={self.config['server']};"
-        f"DATABASE={self.config['database']};"
-        f"Trusted_Connection={self.config.get('trusted_connection', 'yes')}"
+        f"SERVER={config['server']};"
+        f"DATABASE={config['database']};"
+        f"Trusted_Connection={config.get('trusted_connection', 'yes')}"
     )
-        self.connection = pyodbc.connect(conn_str)
-
+        connection = pyodbc.connect(conn_str)
+        connection.add_output_converter(cls.SQL_DATETIMEOFFSET, bytes)
+        return connection
+    
+    @staticmethod
+    def _is_alive(connection) -> bool:
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except pyodbc.Error:
+            return False
+    
+    @transient_errors
+    def connect(self) -> None:
+        self.connection = self.pool.acquire()
+        self._catalog = None
+        self._catalog_complete = False
+        self._table_refs = None
+        self._fingerprints = None
+        self._sizes = None
     
     def disconnect(self) -> None:
         if self.connection:
-            self.connection.close()
+            self.pool.release(self.connection)
+            self.connection = None
+        with self._lob_lock:
+            for connection in self._lob_connections:
+                self.pool.release(connection)
+            self._lob_connections = []
+        self._lob_local = threading.local()
     
     def get_tables(self) -> List[str]:
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT TABLE_NAME 
-            FROM INFORMATION_SCHEMA.TABLES 
-            WHERE TABLE_TYPE = 'BASE TABLE'
-            ORDER BY TABLE_NAME
-        """)
-        tables = [row[0] for row in cursor.fetchall()]
-        cursor.close()
-        return tables
+        refs = self._get_table_refs()
+        return sorted(refs, key=lambda name: (refs[name].name.lower(), refs[name].schema))
+    
+    def _get_table_refs(self) -> Dict[str, Table]:
+        # Names come from the fingerprint query so listing tables never loads the full catalog.
+        if self._table_refs is None:
+            self.get_schema_fingerprints()
+        return self._table_refs
+    
+    def get_table_sizes(self) -> Dict[str, TableSize]:
+        if self._sizes is None:
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute("""
+                    SELECT s.name, t.name,
+                           SUM(CASE WHEN ps.index_id IN (0, 1) THEN ps.row_count ELSE 0 END),
+                           SUM(ps.reserved_page_count) * 8192
+                    FROM sys.dm_db_partition_stats ps
+                    INNER JOIN sys.tables t ON t.object_id = ps.object_id
+                    INNER JOIN sys.schemas s ON s.schema_id = t.schema_id
+                    GROUP BY s.name, t.name
+                """)
+            except pyodbc.Error:
+                # dm_db_partition_stats needs VIEW DATABASE STATE; the catalog views do not.
+                cursor.execute("""
+                    SELECT s.name, t.name,
+                           SUM(CASE WHEN p.index_id IN (0, 1) AND au.type = 1 THEN p.rows ELSE 0 END),
+                           SUM(au.total_pages) * 8192
+                    FROM sys.tables t
+                    INNER JOIN sys.schemas s ON s.schema_id = t.schema_id
+                    INNER JOIN sys.partitions p ON p.object_id = t.object_id
+                    INNER JOIN sys.allocation_units au ON au.container_id = p.partition_id
+                    GROUP BY s.name, t.name
+                """)
+            self._sizes = {
+                Table(name=row[1], schema=row[0]).qualified_name:
+                    TableSize(row_count=int(row[2] or 0), reserved_bytes=int(row[3] or 0))
+                for row in cursor.fetchall()
+            }
+            cursor.close()
+        return dict(self._sizes)
+    
+    def get_schema_fingerprints(self) -> Dict[str, str]:
+        if self._fingerprints is None:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT s.name, t.name, CONVERT(varchar(27), t.modify_date, 126),
+                       (SELECT CHECKSUM_AGG(CHECKSUM(c.column_id, c.name, c.system_type_id, c.user_type_id,
+                                                     c.max_length, c.precision, c.scale, c.is_nullable))
+                        FROM sys.columns c WHERE c.object_id = t.object_id),
+                       (SELECT CHECKSUM_AGG(CHECKSUM(i.index_id, i.name, i.is_unique, i.is_primary_key,
+                                                     i.has_filter, i.is_disabled,
+                                                     ic.column_id, ic.key_ordinal, ic.is_descending_key))
+                        FROM sys.indexes i
+                        INNER JOIN sys.index_columns ic
+                            ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+                        WHERE i.object_id = t.object_id),
+                       (SELECT CHECKSUM_AGG(CHECKSUM(ps.function_id, prv.boundary_id,
+                                                     CAST(prv.value AS nvarchar(4000))))
+                        FROM sys.indexes pi
+                        INNER JOIN sys.partition_schemes ps ON ps.data_space_id = pi.data_space_id
+                        INNER JOIN sys.partition_range_values prv ON prv.function_id = ps.function_id
+                        WHERE pi.object_id = t.object_id AND pi.index_id IN (0, 1))
+                FROM sys.tables t
+                INNER JOIN sys.schemas s ON s.schema_id = t.schema_id
+            """)
+            fingerprints = {}
+            refs = {}
+            for row in cursor.fetchall():
+                ref = Table(name=row[1], schema=row[0])
+                refs[ref.qualified_name] = ref
+                fingerprints[ref.qualified_name] = hashlib.sha1(
+                    "|".join(str(v) for v in row[2:]).encode('utf-8')).hexdigest()
+            cursor.close()
+            self._table_refs = refs
+            self._fingerprints = fingerprints
+        return dict(self._fingerprints)
     
     def get_table_schema(self, table_name: str) -> Table:
-        table = Table(name=table_name)
-        table.columns = self._get_columns(table_name)
-        table.primary_keys = self._get_primary_keys(table_name)
-        table.indexes = self._get_indexes(table_name)
-        return table
+        if not self._catalog_complete and table_name not in (self._catalog or {}):
+            self._load_catalog(None)
+        return self._catalog[table_name]
+    
+    def get_table_schemas(self, table_names: List[str]) -> Dict[str, Table]:
+        missing = [name for name in table_names if name not in (self._catalog or {})]
+        if missing and not self._catalog_complete:
+            self._load_catalog([self._quote(self._get_table_refs()[name]) for name in missing])
+        return {name: self._catalog[name] for name in table_names}
+    
+    def _load_catalog(self, objects: Optional[List[str]]) -> None:
+        scope, params = self._catalog_scope(objects)
+        tables = self._load_columns(scope, params)
+        self._load_primary_keys(tables, scope, params)
+        self._load_indexes(tables, scope, params)
+        self._load_partitioning(tables, scope, params)
+        loaded = {table.qualified_name: table for table in tables.values()}
+        # Tables loaded earlier keep their objects; callers may already hold them.
+        self._catalog = {**loaded, **(self._catalog or {})}
+        self._catalog_complete = self._catalog_complete or objects is None
     
-    def _get_columns(self, table_name: str) -> List[Column]:
+    @staticmethod
+    def _catalog_scope(objects: Optional[List[str]]) -> Tuple[str, List]:
+        if objects is None:
+            return "", []
+        return " AND t.object_id IN (SELECT OBJECT_ID([value]) FROM OPENJSON(?))", [json.dumps(objects)]
+    
+    def _load_columns(self, scope: str, params: List) -> Dict[Tuple[str, str], Table]:
         cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
-                   NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE
-            FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_NAME = ?
-            ORDER BY ORDINAL_POSITION
-        """, (table_name,))
+        cursor.execute(f"""
+            SELECT s.name, t.name, c.name, COALESCE(bt.name, ut.name),
+                   c.max_length, c.precision, c.scale, c.is_nullable
+            FROM sys.tables t
+            INNER JOIN sys.schemas s ON s.schema_id = t.schema_id
+            INNER JOIN sys.columns c ON c.object_id = t.object_id
+            LEFT JOIN sys.types ut ON ut.user_type_id = c.user_type_id
+            LEFT JOIN sys.types bt ON bt.user_type_id = c.system_type_id
+            WHERE 1 = 1{scope}
+            ORDER BY s.name, t.name, c.column_id
+        """, params)
         
-        columns = []
+        tables: Dict[Tuple[str, str], Table] = {}
         for row in cursor.fetchall():
-            columns.append(Column(
-                name=row[0], data_type=row[1], max_length=row[2],
-                precision=row[3], scale=row[4], is_nullable=(row[5] == 'YES')
+            key = (row[0], row[1])
+            if key not in tables:
+                tables[key] = Table(name=row[1], schema=row[0])
+            data_type = row[3]
+            tables[key].columns.append(Column(
+                name=row[2], data_type=data_type,
+                max_length=self._char_length(data_type, row[4]),
+                precision=row[5] if data_type in self.NUMERIC_TYPES else None,
+                scale=row[6] if data_type in self.NUMERIC_TYPES else None,
+                is_nullable=bool(row[7])
             ))
         cursor.close()
-        return columns
+        return tables
     
-    def _get_primary_keys(self, table_name: str) -> List[str]:
+    def _char_length(self, data_type: str, max_length: int) -> Optional[int]:
+        if data_type == 'xml' or max_length == -1:
+            return -1
+        if data_type in ('nchar', 'nvarchar'):
+            return max_length // 2
+        if data_type in ('char', 'varchar', 'binary', 'varbinary'):
+            return max_length
+        return None
+    
+    def _load_primary_keys(self, tables: Dict[Tuple[str, str], Table], scope: str, params: List) -> None:
         cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT COLUMN_NAME
-            FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-            WHERE OBJECTPROPERTY(OBJECT_ID(CONSTRAINT_SCHEMA + '.' + CONSTRAINT_NAME), 'IsPrimaryKey') = 1
-            AND TABLE_NAME = ?
-        """, (table_name,))
-        pks = [row[0] for row in cursor.fetchall()]
+        cursor.execute(f"""
+            SELECT s.name, t.name, COL_NAME(ic.object_id, ic.column_id)
+            FROM sys.key_constraints kc
+            INNER JOIN sys.tables t ON t.object_id = kc.parent_object_id
+            INNER JOIN sys.schemas s ON s.schema_id = t.schema_id
+            INNER JOIN sys.index_columns ic
+                ON ic.object_id = kc.parent_object_id AND ic.index_id = kc.unique_index_id
+            WHERE kc.type = 'PK'{scope}
+            ORDER BY s.name, t.name, ic.key_ordinal
+        """, params)
+        for row in cursor.fetchall():
+            table = tables.get((row[0], row[1]))
+            if table is not None:
+                table.primary_keys.append(row[2])
         cursor.close()
-        return pks
     
-    def _get_indexes(self, table_name: str) -> List[Index]:
+    def _load_indexes(self, tables: Dict[Tuple[str, str], Table], scope: str, params: List) -> None:
         cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT i.name, i.is_unique, COL_NAME(ic.object_id, ic.column_id), ic.is_descending_key
+        cursor.execute(f"""
+            SELECT s.name, t.name, i.name, i.is_unique,
+                   COL_NAME(ic.object_id, ic.column_id), ic.is_descending_key, i.has_filter, i.is_disabled
             FROM sys.indexes i
+            INNER JOIN sys.tables t ON t.object_id = i.object_id
+            INNER JOIN sys.schemas s ON s.schema_id = t.schema_id
             INNER JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
-            WHERE i.object_id = OBJECT_ID(?) AND i.is_primary_key = 0 AND i.type > 0
-            ORDER BY i.name, ic.key_ordinal
-        """, (table_name,))
+            WHERE i.is_primary_key = 0 AND i.type > 0 AND ic.is_included_column = 0{scope}
+            ORDER BY s.name, t.name, i.name, ic.key_ordinal
+        """, params)
         
-        idx_dict = {}
+        idx_dict: Dict[Tuple[str, str, str], Index] = {}
         for row in cursor.fetchall():
-            if row[0] not in idx_dict:
-                idx_dict[row[0]] = Index(name=row[0], is_unique=row[1], columns=[])
-            idx_dict[row[0]].columns.append({'name': row[2], 'desc': row[3]})
-        
+            table = tables.get((row[0], row[1]))
+            if table is None:
+                continue
+            key = (row[0], row[1], row[2])
+            if key not in idx_dict:
+                idx_dict[key] = Index(name=row[2], is_unique=row[3], columns=[],
+                                      is_filtered=bool(row[6]), is_disabled=bool(row[7]))
+                table.indexes.append(idx_dict[key])
+            idx_dict[key].columns.append({'name': row[4], 'desc': row[5]})
+        cursor.close()
+    
+    def _load_partitioning(self, tables: Dict[Tuple[str, str], Table], scope: str, params: List) -> None:
+        cursor = self.connection.cursor()
+        cursor.execute(f"""
+            SELECT s.name, t.name, pf.function_id, pf.name, pf.boundary_value_on_right, c.name
+            FROM sys.tables t
+            INNER JOIN sys.schemas s ON s.schema_id = t.schema_id
+            INNER JOIN sys.indexes i ON i.object_id = t.object_id AND i.index_id IN (0, 1)
+            INNER JOIN sys.partition_schemes ps ON ps.data_space_id = i.data_space_id
+            INNER JOIN sys.partition_functions pf ON pf.function_id = ps.function_id
+            INNER JOIN sys.index_columns ic
+                ON ic.object_id = i.object_id AND ic.index_id = i.index_id AND ic.partition_ordinal = 1
+            INNER JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+            WHERE 1 = 1{scope}
+        """, params)
+        rows = cursor.fetchall()
+
+        for row in rows:
+            table = tables.get((row[0], row[1]))
+            if table is None:
+                continue
+            column = next(c for c in table.columns if c.name == row[5])
+            step = None if row[4] else self.RANGE_LEFT_STEPS.get(column.data_type.lower())
+            if not row[4] and step is None:
+                continue
+            # Casting to the column type avoids reading sql_variant, which pyodbc cannot decode.
+            cursor.execute(f"""
+                SELECT CAST(prv.value AS {self._sql_type(column)})
+                FROM sys.partition_range_values prv
+                WHERE prv.function_id = ?
+                ORDER BY prv.boundary_id
+            """, (row[2],))
+            boundaries = [r[0] for r in cursor.fetchall()]
+            if step is not None:
+                boundaries = [b + step for b in boundaries]
+            table.partitioning = PartitionScheme(column=column.name, function=row[3], boundaries=boundaries)
         cursor.close()
-        return list(idx_dict.values())
     
-    def count_rows(self, table_name: str) -> int:
+    def _quote(self, table: Table) -> str:
+        return f"[{table.schema}].[{table.name}]"
+    
+    def count_rows(self, table_name: str, exact: bool = False) -> int:
+        if not exact:
+            return self.get_table_sizes().get(table_name, TableSize()).row_count
         cursor = self.connection.cursor()
-        cursor.execute(f'SELECT COUNT(*) FROM [{table_name}]')
+        cursor.execute(f'SELECT COUNT_BIG(*) FROM {self._quote(self._get_table_refs()[table_name])}')
         count = cursor.fetchone()[0]
         cursor.close()
         return count
     
-    def read_data_batch(self, table_name: str, columns: List[str],
-                       offset: int, batch_size: int) -> List[Tuple]:
+    def get_change_tracking_method(self, table: Table) -> Optional[str]:
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT 1 FROM sys.change_tracking_tables WHERE object_id = OBJECT_ID(?)",
+                       (self._quote(table),))
+        tracked = cursor.fetchone() is not None
+        cursor.close()
+        if tracked and table.primary_keys:
+            return 'change_tracking'
+        if self._rowversion_column(table):
+            return 'rowversion'
+        return None
+    
+    def _rowversion_column(self, table: Table) -> Optional[str]:
+        return next((c.name for c in table.columns
+                     if c.data_type.lower() in self.ROWVERSION_TYPES), None)
+    
+    def read_changes(self, table: Table, columns: List[str], since: Optional[Any],
+                     chunk_size: int) -> Iterator[ChangeBatch]:
+        method = self.get_change_tracking_method(table)
+        if method == 'change_tracking':
+            return self._read_tracked_changes(table, columns, since, chunk_size)
+        if method == 'rowversion':
+            return self._read_rowversion_changes(table, columns, since, chunk_size)
+        raise ValueError(f"No rowversion column or change tracking on {table.qualified_name}")
+    
+    def _read_tracked_changes(self, table: Table, columns: List[str], since: Optional[Any],
+                              chunk_size: int) -> Iterator[ChangeBatch]:
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            SELECT CHANGE_TRACKING_MIN_VALID_VERSION(OBJECT_ID(?)), CHANGE_TRACKING_CURRENT_VERSION()
+        """, (self._quote(table),))
+        min_valid, current = cursor.fetchone()
+        cursor.close()
+        
+        if since is None:
+            for rows in self.stream_rows(table, columns, chunk_size):
+                yield ChangeBatch(upserts=rows, high_water_mark=current)
+            return
+        if min_valid is not None and since < min_valid:
+            raise RuntimeError(f"Change tracking history for {table.qualified_name} "
+                               f"is older than version {since}; a full reload is required")
+        
+        pks = table.primary_keys
+        pk_position = columns.index(pks[0])
+        ct_cols = ", ".join([f'ct.[{c}]' for c in pks])
+        t_cols = ", ".join([f't.[{c}]' for c in columns])
+        join = " AND ".join([f't.[{c}] = ct.[{c}]' for c in pks])
+        sql = (f"SELECT ct.SYS_CHANGE_OPERATION, {ct_cols}, {t_cols} "
+               f"FROM CHANGETABLE(CHANGES {self._quote(table)}, ?) AS ct "
+               f"LEFT JOIN {self._quote(table)} AS t ON {join}")
+        
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql, (since,))
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                batch = ChangeBatch(high_water_mark=current)
+                for row in rows:
+                    values = tuple(row[1 + len(pks):])
+                    if row[0] == 'D' or values[pk_position] is None:
+                        batch.deletes.append(tuple(row[1:1 + len(pks)]))
+                    else:
+                        batch.upserts.append(values)
+                yield batch
+        finally:
+            cursor.close()
+    
+    def _read_rowversion_changes(self, table: Table, columns: List[str], since: Optional[Any],
+                                 chunk_size: int) -> Iterator[ChangeBatch]:
         cursor = self.connection.cursor()
+        cursor.execute("SELECT MIN_ACTIVE_ROWVERSION()")
+        upper = cursor.fetchone()[0]
+        cursor.close()
+        
+        rv_column = self._rowversion_column(table)
         cols = ", ".join([f'[{c}]' for c in columns])
-        sql = f"SELECT {cols} FROM [{table_name}] ORDER BY (SELECT NULL) OFFSET {offset} ROWS FETCH NEXT {batch_size} ROWS ONLY"
-        cursor.execute(sql)
+        sql = f"SELECT {cols} FROM {self._quote(table)} WHERE [{rv_column}] < ?"
+        params: List = [upper]
+        if since is not None:
+            sql += f" AND [{rv_column}] >= ?"
+            params.append(since)
+        
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield ChangeBatch(upserts=rows, high_water_mark=upper)
+        finally:
+            cursor.close()
+    
+    @transient_errors
+    def read_data_batch(self, table: Table, columns: List[str],
+                       last_key: Optional[Tuple], batch_size: int) -> List[Tuple]:
+        key_columns = table.get_key_columns()
+        sql, params = self._build_select(table, columns, key_columns, last_key, batch_size)
+
+        cursor = self.connection.cursor()
+        cursor.execute(sql, params)
         rows = cursor.fetchall()
         cursor.close()
         return rows
+    
+    def stream_rows(self, table: Table, columns: List[str],
+                    chunk_size: Union[int, Callable[[], int]],
+                    after_key: Optional[Tuple] = None,
+                    key_range: Optional[KeyRange] = None) -> Iterator[List[Tuple]]:
+        key_columns = table.get_key_columns()
+        by_name = {col.name: col for col in table.columns}
+        lob_columns = [by_name[c] for c in columns if by_name[c].is_lob] if key_columns else []
+        expressions = None
+        if lob_columns:
+            expressions = [self._lob_select(by_name[c]) if by_name[c].is_lob else f'[{c}]'
+                           for c in columns]
+        sql, params = self._build_select(table, columns, key_columns, after_key,
+                                         key_range=key_range, expressions=expressions)
+
+        # pyodbc cursors are forward-only and read-only by default, so the
+        # result set is streamed from the server as fetchmany is called.
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size() if callable(chunk_size) else chunk_size)
+                if not rows:
+                    break
+                if lob_columns:
+                    rows = self._attach_lobs(table, columns, key_columns, rows)
+                yield rows
+        except pyodbc.Error as e:
+            if is_transient(e):
+                raise TransientDatabaseError(str(e)) from e
+            raise
+        finally:
+            cursor.close()
+    
+    def _lob_select(self, column: Column) -> str:
+        name = f'[{column.name}]'
+        return (f"CASE WHEN DATALENGTH({name}) <= {int(self.lob_inline_bytes)} "
+                f"THEN {self._lob_expr(column)} END, DATALENGTH({name})")
+    
+    def _lob_expr(self, column: Column) -> str:
+        data_type = column.data_type.lower()
+        if data_type == 'image':
+            return f"CAST([{column.name}] AS varbinary(max))"
+        if data_type in ('ntext', 'xml'):
+            return f"CAST([{column.name}] AS nvarchar(max))"
+        if data_type == 'text':
+            return f"CAST([{column.name}] AS varchar(max))"
+        return f"[{column.name}]"
+    
+    def _attach_lobs(self, table: Table, columns: List[str], key_columns: List[str],
+                     rows: List) -> List[Tuple]:
+        by_name = {col.name: col for col in table.columns}
+        layout: List[Tuple[int, Optional[Column]]] = []
+        position = 0
+        for name in columns:
+            column = by_name[name]
+            layout.append((position, column if column.is_lob else None))
+            position += 2 if column.is_lob else 1
+        key_slots = [layout[columns.index(k)][0] for k in key_columns]
+        
+        result = []
+        for row in rows:
+            values = []
+            for position, lob in layout:
+                value = row[position]
+                if lob is not None and value is None and row[position + 1] is not None:
+                    key = tuple(row[p] for p in key_slots)
+                    value = LobValue(row[position + 1], self._lob_chunks(table, lob, key_columns, key))
+                values.append(value)
+            result.append(tuple(values))
+        return result
+    
+    def _lob_chunks(self, table: Table, column: Column, key_columns: List[str],
+                    key: Tuple) -> Callable[[], Iterator]:
+        unicode = column.data_type.lower() in ('nchar', 'nvarchar', 'ntext', 'xml')
+        expr = self._lob_expr(column)
+        if unicode:
+            # SUBSTRING counts UTF-16 code units, Python counts code points; read bytes and decode here.
+            expr = f"CAST({expr} AS varbinary(max))"
+        chunk = max(self.lob_chunk_bytes & ~1, 2) if unicode else max(self.lob_chunk_bytes, 1)
+        # A short varbinary chunk is the last one; for varchar only an empty chunk is certain.
+        exact = unicode or column.data_type.lower() in self.BINARY_TYPES
+        where = " AND ".join([f'[{k}] = ?' for k in key_columns])
+        sql = f"SELECT SUBSTRING({expr}, ?, ?) FROM {self._quote(table)} WHERE {where}"
+        
+        def chunks() -> Iterator:
+            connection = self._lob_connection()
+            cursor = connection.cursor()
+            decoder = codecs.getincrementaldecoder('utf-16-le')() if unicode else None
+            broken = None
+            try:
+                offset = 1
+                while True:
+                    cursor.execute(sql, [offset, chunk, *key])
+                    row = cursor.fetchone()
+                    if row is None or not row[0]:
+                        break
+                    data = row[0]
+                    if decoder is not None:
+                        text = decoder.decode(bytes(data))
+                        if text:
+                            yield text
+                    else:
+                        yield data
+                    if exact and len(data) < chunk:
+                        break
+                    offset += chunk
+                if decoder is not None:
+                    tail = decoder.decode(b'', final=True)
+                    if tail:
+                        yield tail
+                return
+            except pyodbc.Error as e:
+                if not is_transient(e):
+                    raise
+                broken = e
+            finally:
+                cursor.close()
+            self._drop_lob_connection(connection)
+            raise TransientDatabaseError(str(broken)) from broken
+        return chunks
+    
+    def _lob_connection(self):
+        connection = getattr(self._lob_local, 'connection', None)
+        if connection is None:
+            connection = self.pool.acquire()
+            with self._lob_lock:
+                self._lob_connections.append(connection)
+            self._lob_local.connection = connection
+        return connection
+    
+    def _drop_lob_connection(self, connection) -> None:
+        self._lob_local.connection = None
+        with self._lob_lock:
+            if connection in self._lob_connections:
+                self._lob_connections.remove(connection)
+        self.pool.discard(connection)
+    
+    def _build_select(self, table: Table, columns: List[str], key_columns: List[str],
+                      last_key: Optional[Tuple], top: Optional[int] = None,
+                      key_range: Optional[KeyRange] = None,
+                      expressions: Optional[List[str]] = None) -> Tuple[str, List]:
+        cols = ", ".join(expressions or [f'[{c}]' for c in columns])
+        top_sql = f"TOP ({int(top)}) " if top else ""
+        sql = f"SELECT {top_sql}{cols} FROM {self._quote(table)}"
+
+        conditions, params = self._range_conditions(table, key_range)
+        if key_columns and last_key is not None:
+            where, seek_params = self._build_seek_predicate(key_columns, last_key)
+            conditions.append(f"({where})")
+            params.extend(seek_params)
 
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if key_columns:
+            sql += " ORDER BY " + ", ".join([f'[{c}]' for c in key_columns])
+        return sql, params
+    
+    def _range_conditions(self, table: Table,
+                          key_range: Optional[KeyRange]) -> Tuple[List[str], List]:
+        conditions: List[str] = []
+        params: List = []
+        if key_range is not None and key_range.partition is not None and table.partitioning is not None:
+            # Lets the optimizer eliminate every other partition, NULLs included.
+            conditions.append(f'$PARTITION.[{table.partitioning.function}]([{table.partitioning.column}]) = ?')
+            params.append(key_range.partition)
+        elif key_range is not None:
+            if key_range.lower is not None:
+                conditions.append(f'[{key_range.column}] >= ?')
+                params.append(key_range.lower)
+            if key_range.upper is not None:
+                conditions.append(f'[{key_range.column}] < ?')
+                params.append(key_range.upper)
+        return conditions, params
+    
+    def get_key_boundaries(self, table: Table, parts: int,
+                           key_range: Optional[KeyRange] = None) -> List[Any]:
+        key_columns = table.get_key_columns()
+        if not key_columns or parts < 2:
+            return []
+        column = next(c for c in table.columns if c.name == key_columns[0])
+        if key_range is not None:
+            return self._ntile_boundaries(table, column, parts, key_range)
+        boundaries = self._histogram_boundaries(table, column, parts)
+        if not boundaries:
+            boundaries = self._ntile_boundaries(table, column, parts)
+        return boundaries
+    
+    def _histogram_boundaries(self, table: Table, column: Column, parts: int) -> List[Any]:
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"""
+                SELECT s.stats_id, CAST(h.range_high_key AS {self._sql_type(column)}),
+                       h.range_rows + h.equal_rows
+                FROM sys.stats s
+                INNER JOIN sys.stats_columns sc
+                    ON sc.object_id = s.object_id AND sc.stats_id = s.stats_id AND sc.stats_column_id = 1
+                CROSS APPLY sys.dm_db_stats_histogram(s.object_id, s.stats_id) h
+                WHERE s.object_id = OBJECT_ID(?) AND COL_NAME(sc.object_id, sc.column_id) = ?
+                ORDER BY s.stats_id, h.step_number
+            """, (self._quote(table), column.name))
+            rows = cursor.fetchall()
+        except pyodbc.Error:
+            return []
+        finally:
+            cursor.close()
+
+        if not rows:
+            return []
+        steps = [(row[1], float(row[2])) for row in rows if row[0] == rows[0][0]]
+        total = sum(count for _, count in steps)
+        if total <= 0:
+            return []
+
+        boundaries = []
+        cumulative = 0.0
+        next_cut = total / parts
+        for high_key, count in steps:
+            cumulative += count
+            if cumulative >= next_cut and len(boundaries) < parts - 1:
+                boundaries.append(high_key)
+                next_cut += total / parts
+        return boundaries
+    
+    def _ntile_boundaries(self, table: Table, column: Column, parts: int,
+                          key_range: Optional[KeyRange] = None) -> List[Any]:
+        conditions, params = self._range_conditions(table, key_range)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        samples = [""] if key_range is not None else [f"TABLESAMPLE SYSTEM ({self.SAMPLE_PERCENT} PERCENT)", ""]
+        cursor = self.connection.cursor()
+        boundaries: List[Any] = []
+        for sample in samples:
+            cursor.execute(f"""
+                SELECT MIN(b.k)
+                FROM (
+                    SELECT [{column.name}] AS k, NTILE({int(parts)}) OVER (ORDER BY [{column.name}]) AS bucket
+                    FROM {self._quote(table)} {sample}{where}
+                ) b
+                WHERE b.bucket > 1
+                GROUP BY b.bucket
+                ORDER BY MIN(b.k)
+            """, params)
+            boundaries = [row[0] for row in cursor.fetchall()]
+            if len(boundaries) == parts - 1:
+                break
+        cursor.close()
+        return boundaries
+    
+    def checksum_range(self, table: Table, key_range: Optional[KeyRange] = None) -> RangeChecksum:
+        conditions, params = self._range_conditions(table, key_range)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        cursor = self.connection.cursor()
+        cursor.execute(f"""
+            SELECT COUNT_BIG(*),
+                   SUM(CAST(CAST(SUBSTRING(h.digest, 1, 4) AS INT) AS BIGINT)),
+                   SUM(CAST(CAST(SUBSTRING(h.digest, 5, 4) AS INT) AS BIGINT))
+            FROM (SELECT {self._row_hash_sql(table)} AS digest FROM {self._quote(table)}{where}) h
+        """, params)
+        row = cursor.fetchone()
+        cursor.close()
+        return RangeChecksum(row_count=int(row[0]), digest=(int(row[1] or 0), int(row[2] or 0)))
+    
+    def row_hashes(self, table: Table, key_range: Optional[KeyRange] = None) -> Dict[Tuple, str]:
+        by_name = {col.name: col for col in table.columns}
+        keys = ", ".join(self._normalized_sql(by_name[c]) for c in table.get_key_columns())
+        conditions, params = self._range_conditions(table, key_range)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        cursor = self.connection.cursor()
+        cursor.execute(f"SELECT {keys}, {self._row_hash_sql(table)} FROM {self._quote(table)}{where}", params)
+        hashes = {tuple(row[:-1]): bytes(row[-1]).hex() for row in cursor.fetchall()}
+        cursor.close()
+        return hashes
+    
+    def _row_hash_sql(self, table: Table) -> str:
+        values = " + NCHAR(31) + ".join(
+            f"COALESCE(N'V' + {self._normalized_sql(col)}, N'N')" for col in table.columns
+        )
+        return f"HASHBYTES('MD5', CAST(({values}) COLLATE {self.HASH_COLLATION} AS varchar(max)))"
+    
+    def _normalized_sql(self, column: Column) -> str:
+        name = f'[{column.name}]'
+        data_type = column.data_type.lower()
+        if data_type in self.INTEGER_TYPES:
+            return f"CAST({name} AS nvarchar(50))"
+        if data_type in ('money', 'smallmoney'):
+            return f"CAST(CAST({name} AS decimal(19,4)) AS nvarchar(50))"
+        if data_type == 'float':
+            return f"CONVERT(nvarchar(16), CAST({name} AS binary(8)), 2)"
+        if data_type == 'real':
+            return f"CONVERT(nvarchar(8), CAST({name} AS binary(4)), 2)"
+        if data_type in ('char', 'nchar'):
+            return f"RTRIM(CAST({name} AS nvarchar(max)))"
+        if data_type in self.BINARY_TYPES:
+            return f"CONVERT(nvarchar(max), CAST({name} AS varbinary(max)), 2)"
+        if data_type == 'uniqueidentifier':
+            return f"CAST({name} AS nchar(36))"
+        if data_type == 'date':
+            return f"CAST(DATEDIFF(DAY, '19700101', {name}) AS nvarchar(20))"
+        if data_type in ('datetime', 'smalldatetime', 'datetime2'):
+            precision = "(3)" if data_type == 'datetime' else ""
+            return (f"CAST(DATEDIFF_BIG(MICROSECOND, CAST('19700101' AS datetime2), "
+                    f"CAST({name} AS datetime2{precision})) AS nvarchar(20))")
+        if data_type == 'datetimeoffset':
+            return (f"CAST(DATEDIFF_BIG(MICROSECOND, CAST('1970-01-01 00:00:00 +00:00' AS datetimeoffset), "
+                    f"{name}) AS nvarchar(20))")
+        if data_type == 'time':
+            return f"CAST(DATEDIFF_BIG(MICROSECOND, CAST('00:00:00' AS time), {name}) AS nvarchar(20))"
+        return f"CAST({name} AS nvarchar(max))"
+    
+    def _sql_type(self, column: Column) -> str:
+        data_type = column.data_type.lower()
+        if data_type in ('char', 'varchar', 'nchar', 'nvarchar', 'binary', 'varbinary'):
+            length = 'max' if column.max_length in (None, -1) else column.max_length
+            return f"{data_type}({length})"
+        if data_type in ('decimal', 'numeric') and column.precision:
+            return f"{data_type}({column.precision},{column.scale or 0})"
+        return data_type
+    
+    def _build_seek_predicate(self, key_columns: List[str],
+                              last_key: Tuple) -> Tuple[str, List]:
+        clauses = []
+        params: List = []
+        for i, col in enumerate(key_columns):
+            parts = [f'[{key_columns[j]}] = ?' for j in range(i)]
+            parts.append(f'[{col}] > ?')
+            params.extend(last_key[:i + 1])
+            clauses.append("(" + " AND ".join(parts) + ")")
+        return " OR ".join(clauses), params
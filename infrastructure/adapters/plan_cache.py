@@ -0,0 +1,54 @@
+import dataclasses
+import json
+import sqlite3
+import threading
+from typing import Optional
+from domain.ports import IPlanCache
+from domain.models import Table, TablePlan
+from .checkpoint_store import encode_value, decode_value
+
+
+class SQLitePlanCache(IPlanCache):
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS table_plans (
+                table_name TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                plan TEXT NOT NULL
+            )
+        """)
+
+    def get(self, table_name: str) -> Optional[TablePlan]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT plan FROM table_plans WHERE table_name = ?", (table_name,)
+            ).fetchone()
+        if row is None:
+            return None
+        data = decode_value(json.loads(row[0]))
+        data['table'] = Table.from_dict(data['table'])
+        return TablePlan(**data)
+
+    def save(self, plan: TablePlan) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO table_plans (table_name, fingerprint, plan) VALUES (?, ?, ?)",
+                (plan.table.qualified_name, plan.fingerprint,
+                 json.dumps(encode_value(dataclasses.asdict(plan)), ensure_ascii=False))
+            )
+
+    def clear(self, table_name: Optional[str] = None) -> None:
+        with self._lock:
+            if table_name is None:
+                self._conn.execute("DELETE FROM table_plans")
+            else:
+                self._conn.execute("DELETE FROM table_plans WHERE table_name = ?", (table_name,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,29 +1,72 @@
 
+import functools
 import psycopg2
-from psycopg2.extras import execute_batch
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from psycopg2.extras import execute_batch, execute_values
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 from domain.ports import ITargetDatabase, ITypeMapper
-from domain.models import Table, Index
+from domain.errors import TransientDatabaseError
+from domain.models import Table, Column, Index, KeyRange, RangeChecksum, LobValue
+from .copy_encoder import CopyEncoder, ENCODE_ERRORS, base_pg_type
+from .connection_pool import ConnectionPool
+
+
+TRANSIENT_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+
+
+def transient_errors(method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        except TRANSIENT_ERRORS as e:
+            raise TransientDatabaseError(str(e)) from e
+    return wrapper
 
 
 class PostgreSQLAdapter(ITargetDatabase):
 
-    def __init__(self, config: Dict[str, str], type_mapper: ITypeMapper):
+    LOAD_METHODS = ('copy', 'copy_text', 'insert')
+    COPY_READ_SIZE = 1024 * 1024
+
+    def __init__(self, config: Dict[str, str], type_mapper: ITypeMapper,
+                 load_method: str = 'copy', index_workers: int = 4,
+                 maintenance_work_mem: str = '1GB',
+                 pool: Optional[ConnectionPool] = None):
+        if load_method not in self.LOAD_METHODS:
+            raise ValueError(f"Unknown load method: {load_method}")
         self.config = config
         self.type_mapper = type_mapper
+        self.load_method = load_method
+        self.index_workers = max(index_workers, 1)
+        self.maintenance_work_mem = maintenance_work_mem
+        self.pool = pool or self.create_pool(config)
         self.connection = None
+        self._fresh_tables = set()
+        self._encoders: Dict[Tuple, CopyEncoder] = {}
 
-    def connect(self) -> None:
+    @classmethod
+    def create_pool(cls, config: Dict[str, str], max_idle: int = 8) -> ConnectionPool:
+        return ConnectionPool(
+            lambda: cls._open_connection(config),
+            lambda conn: conn.closed == 0,
+            prepare=lambda: cls._ensure_database(config),
+            max_idle=max_idle
+        )
+
+    @staticmethod
+    def _ensure_database(config: Dict[str, str]) -> None:
         temp_conn = psycopg2.connect(
-            host=self.config['host'],
-            port=self.config.get('port', 5432),
-            user=self.config['username'],
-            password=self.config['password']
+            host=config['host'],
+            port=config.get('port', 5432),
+            user=config['username'],
+            password=config['password']
         )
         temp_conn.autocommit = True
         temp_cursor = temp_conn.cursor()
 
-        db_name = self.config['database']
+        db_name = config['database']
         temp_cursor.execute(f"SELECT 1 FROM pg_database WHERE datname='{db_name}'")
         exists = temp_cursor.fetchone()
         if not exists:
@@ -33,64 +76,442 @@ class PostgreSQLAdapter(ITargetDatabase):
         temp_cursor.close()
         temp_conn.close()
 
-        self.connection = psycopg2.connect(
-            host=self.config['host'],
-            port=self.config.get('port', 5432),
-            database=db_name,
-            user=self.config['username'],
-            password=self.config['password']
+    @staticmethod
+    def _open_connection(config: Dict[str, str]):
+        connection = psycopg2.connect(
+            host=config['host'],
+            port=config.get('port', 5432),
+            database=config['database'],
+            user=config['username'],
+            password=config['password']
         )
-        self.connection.autocommit = False
+        connection.autocommit = False
+        return connection
+
+    @transient_errors
+    def connect(self) -> None:
+        self.connection = self.pool.acquire()
 
     def disconnect(self) -> None:
         if self.connection:
-            self.connection.close()
+            self.pool.release(self.connection)
+            self.connection = None
 
-    def create_table(self, table: Table) -> None:
+    def table_ddl(self, table: Table, deferred: bool = False) -> List[str]:
         cols_def = []
         for col in table.columns:
             pg_type = col.to_postgresql_type(self.type_mapper)
             nullable = "NULL" if col.is_nullable else "NOT NULL"
             cols_def.append(f'"{col.name}" {pg_type} {nullable}')
 
-        if table.primary_keys:
+        if table.primary_keys and not deferred:
             pk = ", ".join([f'"{c}"' for c in table.primary_keys])
             cols_def.append(f'PRIMARY KEY ({pk})')
 
-        sql = f'CREATE TABLE IF NOT EXISTS "{table.name}" (\n  {",\n  ".join(cols_def)}\n)'
+        cols_sql = ",\n  ".join(cols_def)
+        unlogged = "UNLOGGED " if deferred else ""
+        statements = []
+        if table.schema != 'dbo':
+            statements.append(f'CREATE SCHEMA IF NOT EXISTS "{table.schema}"')
+        if not self._partitioned(table) or deferred:
+            statements.append(f'CREATE {unlogged}TABLE IF NOT EXISTS {self._quote(table)} (\n  {cols_sql}\n)')
+            return statements
+
+        statements.append(f'CREATE TABLE IF NOT EXISTS {self._quote(table)} (\n  {cols_sql}\n) '
+                          f'PARTITION BY RANGE ("{table.partitioning.column}")')
+        children = self._partition_tables(table)
+        for child, key_range in zip(children, KeyRange.partitions(table.partitioning)):
+            lower = "MINVALUE" if key_range.lower is None else self._literal(key_range.lower)
+            upper = "MAXVALUE" if key_range.upper is None else self._literal(key_range.upper)
+            statements.append(f'CREATE TABLE IF NOT EXISTS {self._quote(child)} '
+                              f'PARTITION OF {self._quote(table)} FOR VALUES FROM ({lower}) TO ({upper})')
+        # SQL Server keeps NULLs in the first partition; PostgreSQL range partitions reject them.
+        statements.append(f'CREATE TABLE IF NOT EXISTS {self._quote(children[-1])} '
+                          f'PARTITION OF {self._quote(table)} DEFAULT')
+        return statements
+
+    def _partitioned(self, table: Table) -> bool:
+        if table.partitioning is None:
+            return False
+        # Unique constraints on a partitioned table must include the partition key.
+        column = table.partitioning.column
+        if table.primary_keys and column not in table.primary_keys:
+            return False
+        return all(column in [c['name'] for c in idx.columns] for idx in table.indexes if idx.is_unique)
+
+    @staticmethod
+    def _partition_tables(table: Table) -> List[Table]:
+        suffixes = [f'_p{i}' for i in range(1, table.partitioning.partition_count + 1)] + ['_default']
+        return [Table(name=table.name[:63 - len(suffix)] + suffix, columns=table.columns,
+                      primary_keys=table.primary_keys, schema=table.schema)
+                for suffix in suffixes]
+
+    @staticmethod
+    def _literal(value: Any) -> str:
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, (int, float, Decimal)):
+            return str(value)
+        if isinstance(value, (bytes, bytearray)):
+            return f"'\\x{bytes(value).hex()}'"
+        return "'" + str(value).replace("'", "''") + "'"
 
+    @transient_errors
+    def create_table(self, table: Table, deferred: bool = False,
+                     ddl: Optional[List[str]] = None) -> None:
         cursor = self.connection.cursor()
-        cursor.execute(sql)
+        for sql in ddl if ddl is not None else self.table_ddl(table, deferred):
+            cursor.execute(sql)
         self.connection.commit()
         cursor.close()
 
-    def insert_batch(self, table_name: str, columns: List[str], rows: List[Tuple]) -> None:
+    @transient_errors
+    def begin_table_load(self, table: Table) -> None:
+        cursor = self.connection.cursor()
+        cursor.execute(f'TRUNCATE {self._quote(table)}')
+        cursor.close()
+        # COPY FREEZE is rejected on a partitioned parent.
+        if not self._partitioned(table):
+            self._fresh_tables.add(table.qualified_name)
+
+    @transient_errors
+    def insert_batch(self, table: Table, columns: List[str], rows: List[Tuple]) -> None:
+        lob_positions = self._lob_positions(table, columns, rows)
+        if lob_positions:
+            if self.load_method != 'insert':
+                self._copy_streaming(table, columns, rows)
+                return
+            rows = self._read_lobs(rows)
+        if self.load_method != 'insert':
+            buffer, fmt = self._encode_copy(table, columns, rows)
+            if buffer is not None:
+                self.copy_from(table, columns, buffer, fmt)
+                return
+        self._execute_insert(table, columns, rows)
+
+    @transient_errors
+    def copy_from(self, table: Table, columns: List[str], stream: BinaryIO, fmt: str) -> None:
+        cols = ", ".join([f'"{c}"' for c in columns])
+        # FREEZE is only allowed when the table was emptied in this same transaction.
+        freeze = ", FREEZE" if table.qualified_name in self._fresh_tables else ""
+        sql = f'COPY {self._quote(table)} ({cols}) FROM STDIN WITH (FORMAT {fmt}{freeze})'
+        cursor = self.connection.cursor()
+        cursor.copy_expert(sql, stream, size=self.COPY_READ_SIZE)
+        cursor.close()
+
+    def _lob_positions(self, table: Table, columns: List[str], rows: List[Tuple]) -> List[int]:
+        by_name = {col.name: col for col in table.columns}
+        positions = [i for i, c in enumerate(columns) if by_name[c].is_lob]
+        return [i for i in positions if any(isinstance(row[i], LobValue) for row in rows)]
+
+    @staticmethod
+    def _read_lobs(rows: List[Tuple]) -> List[Tuple]:
+        return [tuple(v.read() if isinstance(v, LobValue) else v for v in row) for row in rows]
+
+    def _copy_streaming(self, table: Table, columns: List[str], rows: List[Tuple]) -> None:
+        self.copy_from(table, columns, self._get_encoder(table, columns).stream_text(rows), 'text')
+
+    def _encode_copy(self, table: Table, columns: List[str], rows: List[Tuple]):
+        encoder = self._get_encoder(table, columns)
+        if self.load_method == 'copy' and encoder.supports_binary:
+            try:
+                return encoder.encode_binary(rows), 'binary'
+            except ENCODE_ERRORS:
+                pass
+        try:
+            return encoder.encode_text(rows), 'text'
+        except ENCODE_ERRORS:
+            return None, None
+
+    def _get_encoder(self, table: Table, columns: List[str]) -> CopyEncoder:
+        key = (table.qualified_name, tuple(columns))
+        encoder = self._encoders.get(key)
+        if encoder is None:
+            by_name = {col.name: col for col in table.columns}
+            encoder = CopyEncoder([by_name[c].to_postgresql_type(self.type_mapper) for c in columns])
+            self._encoders[key] = encoder
+        return encoder
+
+    def _execute_insert(self, table: Table, columns: List[str], rows: List[Tuple]) -> None:
         cursor = self.connection.cursor()
         cols = ", ".join([f'"{c}"' for c in columns])
         placeholders = ", ".join(["%s"] * len(columns))
-        sql = f'INSERT INTO "{table_name}" ({cols}) VALUES ({placeholders})'
+        sql = f'INSERT INTO {self._quote(table)} ({cols}) VALUES ({placeholders})'
         execute_batch(cursor, sql, rows, page_size=len(rows))
         cursor.close()
 
-    def create_indexes(self, table_name: str, indexes: List[Index]) -> None:
+    @transient_errors
+    def upsert_batch(self, table: Table, columns: List[str], rows: List[Tuple]) -> None:
+        key_columns = table.get_key_columns()
+        if not key_columns:
+            raise ValueError(f"Cannot upsert into {table.qualified_name} without a key")
+        cols = ", ".join([f'"{c}"' for c in columns])
+        keys = ", ".join([f'"{c}"' for c in key_columns])
+        updates = ", ".join([f'"{c}" = EXCLUDED."{c}"' for c in columns if c not in key_columns])
+        action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        if self._lob_positions(table, columns, rows):
+            rows = self._read_lobs(rows)
+        sql = f'INSERT INTO {self._quote(table)} ({cols}) VALUES %s ON CONFLICT ({keys}) {action}'
+        cursor = self.connection.cursor()
+        execute_values(cursor, sql, rows, page_size=len(rows))
+        cursor.close()
+
+    @transient_errors
+    def delete_batch(self, table: Table, keys: List[Tuple]) -> None:
+        key_columns = table.get_key_columns()
+        by_name = {col.name: col for col in table.columns}
+        cols = ", ".join([f'"{c}"' for c in key_columns])
+        # Literals in a VALUES list resolve to text; GUID keys would then fail to compare with uuid.
+        template = "(" + ", ".join(f"%s::{by_name[c].to_postgresql_type(self.type_mapper)}"
+                                   for c in key_columns) + ")"
+        sql = f'DELETE FROM {self._quote(table)} WHERE ({cols}) IN (VALUES %s)'
+        cursor = self.connection.cursor()
+        execute_values(cursor, sql, keys, template=template, page_size=len(keys))
+        cursor.close()
+
+    def create_indexes(self, table: Table, indexes: List[Index]) -> None:
+        if self._partitioned(table):
+            self._create_partitioned_indexes(table, indexes)
+            return
         cursor = self.connection.cursor()
         for idx in indexes:
             try:
-                unique = "UNIQUE" if idx.is_unique else ""
-                cols = ", ".join([f'"{c["name"]}"' + (" DESC" if c["desc"] else "") for c in idx.columns])
-                idx_name = f'idx_{table_name}_{idx.name}'[:63]
-                sql = f'CREATE {unique} INDEX IF NOT EXISTS "{idx_name}" ON "{table_name}" ({cols})'
-                cursor.execute(sql)
+                cursor.execute(self._index_sql(table, idx))
                 self.connection.commit()
             except:
                 self.connection.rollback()
         cursor.close()
 
+    def _create_partitioned_indexes(self, table: Table, indexes: List[Index]) -> None:
+        children = self._partition_tables(table)
+        statements = [self._index_sql(child, idx, self._partition_index_name(table, idx, child))
+                      for idx in indexes for child in children]
+        with ThreadPoolExecutor(max_workers=min(self.index_workers, max(len(statements), 1))) as pool:
+            list(pool.map(self._build_index, statements))
+
+        # The parent index is created empty and becomes valid once every child index is attached.
+        cursor = self.connection.cursor()
+        for idx in indexes:
+            try:
+                cursor.execute(self._index_sql(table, idx, only=True))
+                for child in children:
+                    cursor.execute(f'ALTER INDEX {self._quote_index(table, self._index_name(table, idx))} '
+                                   f'ATTACH PARTITION '
+                                   f'{self._quote_index(table, self._partition_index_name(table, idx, child))}')
+                self.connection.commit()
+            except psycopg2.Error:
+                self.connection.rollback()
+        cursor.close()
+
+    def build_deferred_constraints(self, table: Table) -> None:
+        pk_index = None
+        statements = [self._index_sql(table, idx) for idx in table.indexes]
+        if table.primary_keys:
+            pk_index = f'pk_{table.name}'[:63]
+            pk_cols = ", ".join([f'"{c}"' for c in table.primary_keys])
+            statements.insert(0, f'CREATE UNIQUE INDEX IF NOT EXISTS "{pk_index}" '
+                                 f'ON {self._quote(table)} ({pk_cols})')
+
+        with ThreadPoolExecutor(max_workers=min(self.index_workers, max(len(statements), 1))) as pool:
+            results = list(pool.map(self._build_index, statements))
+        if pk_index and not results[0]:
+            raise RuntimeError(f"Failed to build primary key index for {table.qualified_name}")
+
+        # A rerun after a crash or a repeated spool load may find either step already done.
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            SELECT c.relpersistence,
+                   EXISTS (SELECT 1 FROM pg_constraint k WHERE k.conrelid = c.oid AND k.contype = 'p')
+            FROM pg_class c
+            WHERE c.oid = %s::regclass
+        """, (self._quote(table),))
+        persistence, has_pk = cursor.fetchone()
+        if pk_index and not has_pk:
+            cursor.execute(f'ALTER TABLE {self._quote(table)} '
+                           f'ADD CONSTRAINT "{pk_index}" PRIMARY KEY USING INDEX "{pk_index}"')
+        if persistence == 'u':
+            cursor.execute(f'ALTER TABLE {self._quote(table)} SET LOGGED')
+        self.connection.commit()
+        cursor.close()
+
+    @transient_errors
+    def analyze_table(self, table: Table, vacuum: bool = False) -> None:
+        conn = self.pool.acquire()
+        conn.autocommit = True
+        try:
+            cursor = conn.cursor()
+            if vacuum:
+                cursor.execute(f'VACUUM (FREEZE, ANALYZE) {self._quote(table)}')
+            else:
+                cursor.execute(f'ANALYZE {self._quote(table)}')
+            cursor.close()
+        finally:
+            if conn.closed == 0:
+                conn.autocommit = False
+            self.pool.release(conn)
+
+    def _build_index(self, sql: str) -> bool:
+        conn = self.pool.acquire()
+        conn.autocommit = True
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SET maintenance_work_mem = %s", (self.maintenance_work_mem,))
+            cursor.execute(sql)
+            cursor.execute("RESET maintenance_work_mem")
+            cursor.close()
+            return True
+        except psycopg2.Error:
+            return False
+        finally:
+            if conn.closed == 0:
+                conn.autocommit = False
+            self.pool.release(conn)
+
+    def _index_sql(self, table: Table, idx: Index, idx_name: Optional[str] = None,
+                   only: bool = False) -> str:
+        unique = "UNIQUE" if idx.is_unique else ""
+        cols = ", ".join([f'"{c["name"]}"' + (" DESC" if c["desc"] else "") for c in idx.columns])
+        idx_name = idx_name or self._index_name(table, idx)
+        target = f'ONLY {self._quote(table)}' if only else self._quote(table)
+        return f'CREATE {unique} INDEX IF NOT EXISTS "{idx_name}" ON {target} ({cols})'
+
+    @staticmethod
+    def _index_name(table: Table, idx: Index) -> str:
+        return f'idx_{table.name}_{idx.name}'[:63]
+
+    @staticmethod
+    def _partition_index_name(table: Table, idx: Index, child: Table) -> str:
+        suffix = child.name[child.name.rfind('_'):]
+        return f'idx_{table.name}_{idx.name}'[:63 - len(suffix)] + suffix
+
+    @staticmethod
+    def _quote_index(table: Table, idx_name: str) -> str:
+        if table.schema == 'dbo':
+            return f'"{idx_name}"'
+        return f'"{table.schema}"."{idx_name}"'
+
+    @transient_errors
+    def delete_rows_after(self, table: Table, last_key: Optional[Tuple],
+                          key_range: Optional[KeyRange] = None) -> None:
+        key_columns = table.get_key_columns()
+        if (key_range is not None or last_key is not None) and not table.has_portable_key_order():
+            raise ValueError(f"{table.qualified_name}: key order differs from the source, "
+                             f"rows can only be discarded by truncating")
+        cursor = self.connection.cursor()
+        if key_range is None and (not key_columns or last_key is None):
+            cursor.execute(f'TRUNCATE {self._quote(table)}')
+        else:
+            conditions: List[str] = []
+            params: List = []
+            if key_columns and last_key is not None:
+                cols = ", ".join([f'"{c}"' for c in key_columns])
+                placeholders = ", ".join(["%s"] * len(key_columns))
+                conditions.append(f'({cols}) > ({placeholders})')
+                params.extend(last_key)
+            range_conditions, range_params = self._range_conditions(key_range)
+            conditions.extend(range_conditions)
+            params.extend(range_params)
+            where = " WHERE " + " AND ".join(conditions) if conditions else ""
+            cursor.execute(f'DELETE FROM {self._quote(table)}{where}', params)
+        self.connection.commit()
+        cursor.close()
+
+    @transient_errors
+    def has_rows(self, table: Table) -> bool:
+        cursor = self.connection.cursor()
+        cursor.execute(f'SELECT EXISTS (SELECT 1 FROM {self._quote(table)})')
+        found = cursor.fetchone()[0]
+        cursor.close()
+        self.connection.commit()
+        return bool(found)
+
+    def _range_conditions(self, key_range: Optional[KeyRange]) -> Tuple[List[str], List]:
+        conditions: List[str] = []
+        params: List = []
+        if key_range is not None:
+            if key_range.lower is not None:
+                conditions.append(f'"{key_range.column}" >= %s')
+                params.append(key_range.lower)
+            if key_range.upper is not None:
+                if key_range.partition is not None and key_range.lower is None:
+                    # Source partition 1 also holds the NULLs, which live in the default partition here.
+                    conditions.append(f'("{key_range.column}" < %s OR "{key_range.column}" IS NULL)')
+                else:
+                    conditions.append(f'"{key_range.column}" < %s')
+                params.append(key_range.upper)
+        return conditions, params
+
+    def checksum_range(self, table: Table, key_range: Optional[KeyRange] = None) -> RangeChecksum:
+        conditions, params = self._range_conditions(key_range)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        cursor = self.connection.cursor()
+        cursor.execute(f"""
+            SELECT count(*),
+                   sum(('x' || substr(h.digest, 1, 8))::bit(32)::int::bigint),
+                   sum(('x' || substr(h.digest, 9, 8))::bit(32)::int::bigint)
+            FROM (SELECT {self._row_hash_sql(table)} AS digest FROM {self._quote(table)}{where}) h
+        """, params)
+        row = cursor.fetchone()
+        cursor.close()
+        self.connection.commit()
+        return RangeChecksum(row_count=int(row[0]), digest=(int(row[1] or 0), int(row[2] or 0)))
+
+    def row_hashes(self, table: Table, key_range: Optional[KeyRange] = None) -> Dict[Tuple, str]:
+        by_name = {col.name: col for col in table.columns}
+        keys = ", ".join(self._normalized_sql(by_name[c]) for c in table.get_key_columns())
+        conditions, params = self._range_conditions(key_range)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        cursor = self.connection.cursor()
+        cursor.execute(f"SELECT {keys}, {self._row_hash_sql(table)} FROM {self._quote(table)}{where}", params)
+        hashes = {tuple(row[:-1]): row[-1] for row in cursor.fetchall()}
+        cursor.close()
+        self.connection.commit()
+        return hashes
+
+    def _row_hash_sql(self, table: Table) -> str:
+        values = " || chr(31) || ".join(
+            f"COALESCE('V' || {self._normalized_sql(col)}, 'N')" for col in table.columns
+        )
+        return f"md5({values})"
+
+    def _normalized_sql(self, column: Column) -> str:
+        name = f'"{column.name}"'
+        pg_type = base_pg_type(column.to_postgresql_type(self.type_mapper))
+        if pg_type == 'BOOLEAN':
+            return f"CASE WHEN {name} THEN '1' ELSE '0' END"
+        if pg_type == 'DOUBLE PRECISION':
+            return f"upper(encode(float8send({name}), 'hex'))"
+        if pg_type == 'REAL':
+            return f"upper(encode(float4send({name}), 'hex'))"
+        if pg_type == 'BYTEA':
+            return f"upper(encode({name}, 'hex'))"
+        if pg_type == 'UUID':
+            return f"upper({name}::text)"
+        if pg_type == 'DATE':
+            return f"({name} - DATE '1970-01-01')::text"
+        if pg_type in ('TIMESTAMP', 'TIMESTAMP WITH TIME ZONE'):
+            # Days plus microseconds into the day stay exact where extract() returns double (PostgreSQL < 14).
+            value = f"({name} AT TIME ZONE 'UTC')" if pg_type == 'TIMESTAMP WITH TIME ZONE' else name
+            return (f"((({value})::date - DATE '1970-01-01')::bigint * 86400000000"
+                    f" + round(extract(epoch FROM ({value})::time) * 1000000)::bigint)::text")
+        if pg_type == 'TIME':
+            return f"round(extract(epoch FROM {name}) * 1000000)::bigint::text"
+        return f"{name}::text"
+
+    def _quote(self, table: Table) -> str:
+        if table.schema == 'dbo':
+            return f'"{table.name}"'
+        return f'"{table.schema}"."{table.name}"'
+
     def begin_transaction(self) -> None:
         pass
 
+    @transient_errors
     def commit_transaction(self) -> None:
+        self._fresh_tables.clear()
         self.connection.commit()
 
+    @transient_errors
     def rollback_transaction(self) -> None:
+        self._fresh_tables.clear()
         self.connection.rollback()
@@ -0,0 +1,190 @@
+import cProfile
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+from domain.ports import IMigrationHook
+from .spool_adapter import table_dir_name
+
+
+MIB = 1024 * 1024
+
+
+class CProfileHook(IMigrationHook):
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        self._local = threading.local()
+        # Only one deterministic profiler can be active per process on Python 3.12+.
+        self._active = threading.Lock()
+
+    def before_table(self, table_name: str) -> None:
+        if not self._active.acquire(blocking=False):
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            self._active.release()
+            return
+        self._local.profile = (table_name, profiler)
+
+    def after_table(self, table_name: str) -> None:
+        entry = getattr(self._local, 'profile', None)
+        if entry is None or entry[0] != table_name:
+            return
+        self._local.profile = None
+        profiler = entry[1]
+        profiler.disable()
+        self._active.release()
+        profiler.dump_stats(os.path.join(self.output_dir, f"{table_dir_name(table_name)}.prof"))
+
+    def before_stage(self, table_name: str, stage: str) -> None:
+        pass
+
+    def after_stage(self, table_name: str, stage: str, seconds: float) -> None:
+        pass
+
+
+class TracemallocHook(IMigrationHook):
+
+    def __init__(self, output_dir: str, frames: int = 10, top: int = 25):
+        self.output_dir = output_dir
+        self.frames = frames
+        self.top = top
+        os.makedirs(output_dir, exist_ok=True)
+        self._peaks: Dict[str, List[int]] = {}
+        self._worst: Dict[str, Tuple[int, Optional[tracemalloc.Snapshot]]] = {}
+        self._lock = threading.Lock()
+        self._owns_tracing = False
+
+    def before_table(self, table_name: str) -> None:
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                self._owns_tracing = True
+            self._peaks[table_name] = []
+            self._worst[table_name] = (0, None)
+        tracemalloc.reset_peak()
+
+    def after_stage(self, table_name: str, stage: str, seconds: float) -> None:
+        # The peak since the previous insert covers this batch's fetch, transform and encode.
+        if stage != 'insert':
+            return
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        with self._lock:
+            if table_name not in self._peaks:
+                return
+            self._peaks[table_name].append(peak)
+            worse = peak > self._worst[table_name][0]
+        if worse:
+            snapshot = tracemalloc.take_snapshot()
+            with self._lock:
+                if table_name in self._worst and peak > self._worst[table_name][0]:
+                    self._worst[table_name] = (peak, snapshot)
+
+    def after_table(self, table_name: str) -> None:
+        with self._lock:
+            peaks = self._peaks.pop(table_name, [])
+            worst_peak, snapshot = self._worst.pop(table_name, (0, None))
+            if not self._peaks and self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+
+        lines = [f"table: {table_name}", f"batches: {len(peaks)}"]
+        if peaks:
+            lines.append(f"peak MiB: max {max(peaks) / MIB:.1f}, mean {sum(peaks) / len(peaks) / MIB:.1f}")
+            lines.append("per-batch peak MiB: " + " ".join(f"{p / MIB:.1f}" for p in peaks))
+        if snapshot is not None:
+            lines.append(f"top allocations after the worst batch ({worst_peak / MIB:.1f} MiB peak):")
+            lines.extend(str(stat) for stat in snapshot.statistics('lineno')[:self.top])
+        path = os.path.join(self.output_dir, f"{table_dir_name(table_name)}.tracemalloc.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+    def before_stage(self, table_name: str, stage: str) -> None:
+        pass
+
+
+class SamplingProfilerHook(IMigrationHook):
+
+    def __init__(self, output_dir: str, interval_seconds: float = 0.005, max_depth: int = 64):
+        self.output_dir = output_dir
+        self.interval_seconds = interval_seconds
+        self.max_depth = max_depth
+        os.makedirs(output_dir, exist_ok=True)
+        self._threads: Dict[int, str] = {}
+        self._samples: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def before_table(self, table_name: str) -> None:
+        with self._lock:
+            self._samples[table_name] = Counter()
+            self._threads[threading.get_ident()] = table_name
+            if self._sampler is None:
+                self._stop.clear()
+                self._sampler = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+                self._sampler.start()
+
+    def before_stage(self, table_name: str, stage: str) -> None:
+        # Range readers and pipeline writers are attributed to the table they last worked on.
+        self._threads[threading.get_ident()] = table_name
+
+    def after_stage(self, table_name: str, stage: str, seconds: float) -> None:
+        pass
+
+    def after_table(self, table_name: str) -> None:
+        sampler = None
+        with self._lock:
+            for ident in [i for i, name in self._threads.items() if name == table_name]:
+                del self._threads[ident]
+            samples = self._samples.pop(table_name, Counter())
+            if not self._samples:
+                sampler, self._sampler = self._sampler, None
+        if sampler is not None:
+            self._stop.set()
+            sampler.join()
+
+        path = os.path.join(self.output_dir, f"{table_dir_name(table_name)}.folded")
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            frames = sys._current_frames()
+            with self._lock:
+                for ident, table_name in list(self._threads.items()):
+                    frame = frames.get(ident)
+                    if frame is None or ident == own or table_name not in self._samples:
+                        continue
+                    self._samples[table_name][self._fold(frame)] += 1
+
+    def _fold(self, frame) -> str:
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+
+PROFILING_HOOKS = {
+    'cprofile': CProfileHook,
+    'tracemalloc': TracemallocHook,
+    'sampling': SamplingProfilerHook,
+}
+
+
+def create_profiling_hooks(names: Sequence[str], output_dir: str) -> List[IMigrationHook]:
+    unknown = [name for name in names if name not in PROFILING_HOOKS]
+    if unknown:
+        raise ValueError(f"Unknown profiler: {', '.join(unknown)}")
+    return [PROFILING_HOOKS[name](output_dir) for name in dict.fromkeys(names)]
@@ -0,0 +1,294 @@
+import dataclasses
+import gzip
+import json
+import os
+import re
+import shutil
+import threading
+import uuid
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from domain.ports import ITargetDatabase, ITypeMapper, ISpoolReader
+from domain.models import (Table, Index, KeyRange, RangeChecksum, LobValue,
+                           SpoolFile, SpoolTable)
+from .copy_encoder import CopyEncoder, ENCODE_ERRORS
+from .checkpoint_store import encode_value, decode_value
+
+
+MANIFEST = 'manifest.json'
+TABLE_FILE = 'table.json'
+BATCHES_FILE = 'batches.jsonl'
+COPY_CHUNK_BYTES = 1024 * 1024
+
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(path: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+def _write_json(path: str, document: Any) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: str, default: Any = None) -> Any:
+    if not os.path.exists(path):
+        return default
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _read_batches(path: str) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def table_dir_name(table_name: str) -> str:
+    return re.sub(r'[^\w.-]', '_', table_name)
+
+
+class SpoolTargetAdapter(ITargetDatabase):
+
+    LOAD_METHODS = ('copy', 'copy_text')
+
+    def __init__(self, spool_dir: str, type_mapper: ITypeMapper,
+                 load_method: str = 'copy', compress_level: int = 1):
+        if load_method not in self.LOAD_METHODS:
+            raise ValueError(f"Unsupported spool load method: {load_method}")
+        self.spool_dir = spool_dir
+        self.type_mapper = type_mapper
+        self.load_method = load_method
+        self.compress_level = compress_level
+        self._encoders: Dict[Tuple, CopyEncoder] = {}
+        self._pending: List[Dict[str, Any]] = []
+
+    def connect(self) -> None:
+        os.makedirs(self.spool_dir, exist_ok=True)
+
+    def disconnect(self) -> None:
+        self.rollback_transaction()
+
+    def _table_dir(self, table: Table) -> str:
+        return os.path.join(self.spool_dir, table_dir_name(table.qualified_name))
+
+    def table_ddl(self, table: Table, deferred: bool = False) -> List[str]:
+        return []
+
+    def create_table(self, table: Table, deferred: bool = False,
+                     ddl: Optional[List[str]] = None) -> None:
+        table_dir = self._table_dir(table)
+        os.makedirs(table_dir, exist_ok=True)
+        _write_json(os.path.join(table_dir, TABLE_FILE), {
+            'table': encode_value(dataclasses.asdict(table)),
+            'deferred': deferred,
+            'complete': False,
+        })
+
+        manifest_path = os.path.join(self.spool_dir, MANIFEST)
+        with _lock_for(manifest_path):
+            manifest = _read_json(manifest_path, {'version': 1, 'tables': []})
+            entry = {'name': table.qualified_name, 'dir': table_dir_name(table.qualified_name)}
+            if entry not in manifest['tables']:
+                manifest['tables'].append(entry)
+                _write_json(manifest_path, manifest)
+
+    def begin_table_load(self, table: Table) -> None:
+        self.delete_rows_after(table, None)
+
+    def insert_batch(self, table: Table, columns: List[str], rows: List[Tuple]) -> None:
+        if not rows:
+            return
+        tmp_path = os.path.join(self._table_dir(table), f"{uuid.uuid4().hex}.tmp")
+        with gzip.open(tmp_path, 'wb', compresslevel=self.compress_level) as f:
+            fmt = self._write_copy(f, table, columns, rows)
+
+        key_positions = [columns.index(k) for k in table.get_key_columns()]
+        range_position = columns.index(table.partitioning.column) if table.partitioning else None
+        self._pending.append({
+            'table_dir': self._table_dir(table),
+            'tmp_path': tmp_path,
+            'format': fmt,
+            'rows': len(rows),
+            'first_key': encode_value([rows[0][p] for p in key_positions]) if key_positions else None,
+            'last_key': encode_value([rows[-1][p] for p in key_positions]) if key_positions else None,
+            # Each batch is read from a single source partition.
+            'range_value': encode_value(rows[0][range_position]) if range_position is not None else None,
+        })
+
+    def _write_copy(self, f: BinaryIO, table: Table, columns: List[str], rows: List[Tuple]) -> str:
+        encoder = self._get_encoder(table, columns)
+        if any(isinstance(v, LobValue) for row in rows for v in row):
+            shutil.copyfileobj(encoder.stream_text(rows), f, COPY_CHUNK_BYTES)
+            return 'text'
+        if self.load_method == 'copy' and encoder.supports_binary:
+            try:
+                f.write(encoder.encode_binary(rows).getbuffer())
+                return 'binary'
+            except ENCODE_ERRORS:
+                pass
+        f.write(encoder.encode_text(rows).getbuffer())
+        return 'text'
+
+    def _get_encoder(self, table: Table, columns: List[str]) -> CopyEncoder:
+        key = (table.qualified_name, tuple(columns))
+        encoder = self._encoders.get(key)
+        if encoder is None:
+            by_name = {col.name: col for col in table.columns}
+            encoder = CopyEncoder([by_name[c].to_postgresql_type(self.type_mapper) for c in columns])
+            self._encoders[key] = encoder
+        return encoder
+
+    def copy_from(self, table: Table, columns: List[str], stream: BinaryIO, fmt: str) -> None:
+        raise NotImplementedError("The spool target only accepts row batches")
+
+    def upsert_batch(self, table: Table, columns: List[str], rows: List[Tuple]) -> None:
+        raise NotImplementedError("The spool target supports full loads only")
+
+    def delete_batch(self, table: Table, keys: List[Tuple]) -> None:
+        raise NotImplementedError("The spool target supports full loads only")
+
+    def create_indexes(self, table: Table, indexes: List[Index]) -> None:
+        self._mark_complete(table)
+
+    def build_deferred_constraints(self, table: Table) -> None:
+        self._mark_complete(table)
+
+    def analyze_table(self, table: Table, vacuum: bool = False) -> None:
+        pass
+
+    def has_rows(self, table: Table) -> bool:
+        return bool(_read_batches(os.path.join(self._table_dir(table), BATCHES_FILE)))
+
+    def _mark_complete(self, table: Table) -> None:
+        path = os.path.join(self._table_dir(table), TABLE_FILE)
+        with _lock_for(path):
+            document = _read_json(path)
+            document['complete'] = True
+            _write_json(path, document)
+
+    def delete_rows_after(self, table: Table, last_key: Optional[Tuple],
+                          key_range: Optional[KeyRange] = None) -> None:
+        if (key_range is not None or last_key is not None) and not table.has_portable_key_order():
+            raise ValueError(f"{table.qualified_name}: key order differs from the source, "
+                             f"batches can only be discarded all at once")
+        table_dir = self._table_dir(table)
+        batches_path = os.path.join(table_dir, BATCHES_FILE)
+        with _lock_for(batches_path):
+            keep = []
+            for batch in _read_batches(batches_path):
+                first_key = tuple(decode_value(batch['first_key'])) if batch['first_key'] else None
+                if table.partitioning is not None:
+                    range_value = decode_value(batch.get('range_value'))
+                else:
+                    range_value = first_key[0] if first_key else None
+                if self._is_after(first_key, last_key, key_range, range_value):
+                    os.remove(os.path.join(table_dir, batch['file']))
+                else:
+                    keep.append(batch)
+            listed = {batch['file'] for batch in keep}
+            if last_key is None and key_range is None:
+                for name in os.listdir(table_dir):
+                    if name.endswith('.gz') and name not in listed:
+                        os.remove(os.path.join(table_dir, name))
+            tmp_path = f"{batches_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for batch in keep:
+                    f.write(json.dumps(batch) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, batches_path)
+
+    @staticmethod
+    def _is_after(first_key: Optional[Tuple], last_key: Optional[Tuple],
+                  key_range: Optional[KeyRange], range_value: Any = None) -> bool:
+        if key_range is not None:
+            if range_value is None:
+                # NULL partition values belong to the first source partition.
+                if key_range.lower is not None:
+                    return False
+            else:
+                if key_range.lower is not None and range_value < key_range.lower:
+                    return False
+                if key_range.upper is not None and range_value >= key_range.upper:
+                    return False
+        if first_key is None:
+            return True
+        return last_key is None or first_key > tuple(last_key)
+
+    def begin_transaction(self) -> None:
+        self.rollback_transaction()
+
+    def commit_transaction(self) -> None:
+        for batch in self._pending:
+            name = os.path.basename(batch['tmp_path'])[:-len('.tmp')] + f".{batch['format']}.gz"
+            os.replace(batch['tmp_path'], os.path.join(batch['table_dir'], name))
+            batches_path = os.path.join(batch['table_dir'], BATCHES_FILE)
+            line = json.dumps({
+                'file': name,
+                'format': batch['format'],
+                'rows': batch['rows'],
+                'first_key': batch['first_key'],
+                'last_key': batch['last_key'],
+                'range_value': batch['range_value'],
+            })
+            with _lock_for(batches_path):
+                with open(batches_path, 'a', encoding='utf-8') as f:
+                    f.write(line + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+        self._pending = []
+
+    def rollback_transaction(self) -> None:
+        for batch in self._pending:
+            if os.path.exists(batch['tmp_path']):
+                os.remove(batch['tmp_path'])
+        self._pending = []
+
+    def checksum_range(self, table: Table, key_range: Optional[KeyRange] = None) -> RangeChecksum:
+        raise NotImplementedError("Verify against the loaded database, not the spool")
+
+    def row_hashes(self, table: Table, key_range: Optional[KeyRange] = None) -> Dict[Tuple, str]:
+        raise NotImplementedError("Verify against the loaded database, not the spool")
+
+
+class SpoolDirectoryReader(ISpoolReader):
+
+    def __init__(self, spool_dir: str):
+        self.spool_dir = spool_dir
+
+    def get_tables(self) -> List[SpoolTable]:
+        manifest = _read_json(os.path.join(self.spool_dir, MANIFEST))
+        if manifest is None:
+            raise FileNotFoundError(f"No spool manifest in {self.spool_dir}")
+
+        tables = []
+        for entry in manifest['tables']:
+            table_dir = os.path.join(self.spool_dir, entry['dir'])
+            document = _read_json(os.path.join(table_dir, TABLE_FILE))
+            files = [
+                SpoolFile(
+                    path=os.path.join(table_dir, batch['file']),
+                    format=batch['format'],
+                    rows=batch['rows'],
+                    size_bytes=os.path.getsize(os.path.join(table_dir, batch['file']))
+                )
+                for batch in _read_batches(os.path.join(table_dir, BATCHES_FILE))
+            ]
+            tables.append(SpoolTable(
+                table=Table.from_dict(decode_value(document['table'])),
+                deferred=document['deferred'],
+                complete=document['complete'],
+                files=files
+            ))
+        return tables
+
+    def open_file(self, spool_file: SpoolFile) -> BinaryIO:
+        return gzip.open(spool_file.path, 'rb')
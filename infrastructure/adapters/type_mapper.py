@@ -14,7 +14,8 @@ class MSSQLToPostgreSQLTypeMapper(ITypeMapper):
         'char': 'CHAR', 'varchar': 'VARCHAR', 'text': 'TEXT',
         'nchar': 'CHAR', 'nvarchar': 'VARCHAR', 'ntext': 'TEXT',
         'binary': 'BYTEA', 'varbinary': 'BYTEA', 'image': 'BYTEA',
-        'uniqueidentifier': 'UUID', 'xml': 'XML'
+        'uniqueidentifier': 'UUID', 'xml': 'XML',
+        'timestamp': 'BYTEA', 'rowversion': 'BYTEA'
     }
     
     def map_type(self, column: Column) -> str:
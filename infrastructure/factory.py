@@ -1,25 +1,176 @@
-from typing import Dict
+from typing import Dict, Optional, Sequence
+from domain.ports import ITargetDatabase
 from application.use_cases.migrate_db import MigrateDatabaseUseCase
+from application.use_cases.sync_db import SyncDatabaseUseCase
+from application.use_cases.verify_db import VerifyDatabaseUseCase
+from application.use_cases.load_spool import LoadSpoolUseCase
+from application.use_cases.dry_run import DryRunUseCase
 from infrastructure.adapters.mssql_adapter import MSSQLAdapter
 from infrastructure.adapters.postsql_adapter import PostgreSQLAdapter
 from infrastructure.adapters.type_mapper import MSSQLToPostgreSQLTypeMapper
-from infrastructure.adapters.logger_adapter import PythonLoggingAdapter
+from infrastructure.adapters.logger_adapter import PythonLoggingAdapter, QueueLoggingAdapter
+from infrastructure.adapters.checkpoint_store import SQLiteCheckpointStore
+from infrastructure.adapters.plan_cache import SQLitePlanCache
+from infrastructure.adapters.metrics_exporter import FileMetricsExporter
+from infrastructure.adapters.spool_adapter import SpoolTargetAdapter, SpoolDirectoryReader
+from infrastructure.adapters.profiling_hooks import create_profiling_hooks
 
 
 class MigrationServiceFactory:
     
     @staticmethod
     def create(mssql_config: Dict[str, str], pg_config: Dict[str, str],
-              batch_size: int = 10000) -> MigrateDatabaseUseCase:
+              batch_size: int = 10000,
+              load_method: str = 'copy',
+              pipeline_depth: int = 0,
+              writer_count: int = 1,
+              table_workers: int = 1,
+              partition_threshold_rows: int = 0,
+              range_partitions: int = 4,
+              deferred_threshold_rows: int = 0,
+              index_workers: int = 4,
+              checkpoint_path: Optional[str] = None,
+              resume: bool = False,
+              adaptive_batching: bool = False,
+              target_batch_bytes: int = 32 * 1024 * 1024,
+              target_batch_seconds: float = 2.0,
+              memory_ceiling_bytes: int = 512 * 1024 * 1024,
+              metrics_json_path: Optional[str] = None,
+              metrics_prometheus_path: Optional[str] = None,
+              metrics_interval_seconds: float = 5.0,
+              exact_row_counts: bool = False,
+              spool_dir: Optional[str] = None,
+              plan_cache_path: Optional[str] = None,
+              pool_size: int = 8,
+              retry_attempts: int = 5,
+              retry_base_delay: float = 0.5,
+              retry_max_delay: float = 30.0,
+              maintenance_workers: int = 2,
+              vacuum_after_load: bool = False,
+              progress_interval_seconds: float = 5.0,
+              log_json: bool = False,
+              profilers: Sequence[str] = (),
+              profile_dir: str = 'profiles') -> MigrateDatabaseUseCase:
         type_mapper = MSSQLToPostgreSQLTypeMapper()
-        logger = PythonLoggingAdapter()
-        source_db = MSSQLAdapter(mssql_config, type_mapper)
-        target_db = PostgreSQLAdapter(pg_config, type_mapper)
+        logger = QueueLoggingAdapter(json_format=log_json)
+        source_pool = MSSQLAdapter.create_pool(mssql_config, max_idle=pool_size)
+        target_pool = PostgreSQLAdapter.create_pool(pg_config, max_idle=pool_size)
+        source_db = MSSQLAdapter(mssql_config, type_mapper, pool=source_pool)
+        
+        def make_target() -> ITargetDatabase:
+            if spool_dir:
+                return SpoolTargetAdapter(spool_dir, type_mapper, load_method=load_method)
+            return PostgreSQLAdapter(pg_config, type_mapper, load_method=load_method,
+                                     index_workers=index_workers, pool=target_pool)
+        
+        target_db = make_target()
+        checkpoint_store = SQLiteCheckpointStore(checkpoint_path) if checkpoint_path else None
+        metrics_exporter = None
+        if metrics_json_path or metrics_prometheus_path:
+            metrics_exporter = FileMetricsExporter(metrics_json_path, metrics_prometheus_path)
         
         return MigrateDatabaseUseCase(
             source_db=source_db,
             target_db=target_db,
             type_mapper=type_mapper,
             logger=logger,
+            batch_size=batch_size,
+            pipeline_depth=pipeline_depth,
+            writer_count=writer_count,
+            target_factory=make_target,
+            table_workers=table_workers,
+            source_factory=lambda: MSSQLAdapter(mssql_config, type_mapper, pool=source_pool),
+            partition_threshold_rows=partition_threshold_rows,
+            range_partitions=range_partitions,
+            deferred_threshold_rows=deferred_threshold_rows,
+            checkpoint_store=checkpoint_store,
+            resume=resume,
+            adaptive_batching=adaptive_batching,
+            target_batch_bytes=target_batch_bytes,
+            target_batch_seconds=target_batch_seconds,
+            memory_ceiling_bytes=memory_ceiling_bytes,
+            metrics_exporter=metrics_exporter,
+            metrics_interval_seconds=metrics_interval_seconds,
+            exact_row_counts=exact_row_counts,
+            plan_cache=SQLitePlanCache(plan_cache_path) if plan_cache_path else None,
+            retry_attempts=retry_attempts,
+            retry_base_delay=retry_base_delay,
+            retry_max_delay=retry_max_delay,
+            maintenance_workers=maintenance_workers,
+            vacuum_after_load=vacuum_after_load,
+            progress_interval_seconds=progress_interval_seconds,
+            hooks=create_profiling_hooks(profilers, profile_dir) if profilers else None
+        )
+    
+    @staticmethod
+    def create_sync(mssql_config: Dict[str, str], pg_config: Dict[str, str],
+                    checkpoint_path: str, batch_size: int = 10000) -> SyncDatabaseUseCase:
+        type_mapper = MSSQLToPostgreSQLTypeMapper()
+        
+        return SyncDatabaseUseCase(
+            source_db=MSSQLAdapter(mssql_config, type_mapper),
+            target_db=PostgreSQLAdapter(pg_config, type_mapper),
+            type_mapper=type_mapper,
+            checkpoint_store=SQLiteCheckpointStore(checkpoint_path),
+            logger=PythonLoggingAdapter(),
             batch_size=batch_size
-        )
\ No newline at end of file
+        )
+    
+    @staticmethod
+    def create_verify(mssql_config: Dict[str, str], pg_config: Dict[str, str],
+                      workers: int = 4) -> VerifyDatabaseUseCase:
+        type_mapper = MSSQLToPostgreSQLTypeMapper()
+        
+        return VerifyDatabaseUseCase(
+            source_factory=lambda: MSSQLAdapter(mssql_config, type_mapper),
+            target_factory=lambda: PostgreSQLAdapter(pg_config, type_mapper),
+            logger=PythonLoggingAdapter(),
+            workers=workers
+        )
+    
+    @staticmethod
+    def create_load_spool(pg_config: Dict[str, str], spool_dir: str,
+                          workers: int = 4, index_workers: int = 4,
+                          freeze: bool = True) -> LoadSpoolUseCase:
+        type_mapper = MSSQLToPostgreSQLTypeMapper()
+        target_pool = PostgreSQLAdapter.create_pool(pg_config, max_idle=workers + index_workers)
+        
+        return LoadSpoolUseCase(
+            spool_reader=SpoolDirectoryReader(spool_dir),
+            target_factory=lambda: PostgreSQLAdapter(pg_config, type_mapper,
+                                                     index_workers=index_workers, pool=target_pool),
+            logger=PythonLoggingAdapter(),
+            workers=workers,
+            freeze=freeze
+        )
+    
+    @staticmethod
+    def create_dry_run(mssql_config: Dict[str, str],
+                       batch_size: int = 10000,
+                       pipeline_depth: int = 0,
+                       writer_count: int = 1,
+                       table_workers: int = 1,
+                       partition_threshold_rows: int = 0,
+                       range_partitions: int = 4,
+                       deferred_threshold_rows: int = 0,
+                       index_workers: int = 4,
+                       adaptive_batching: bool = False,
+                       sample_rows: int = 10000,
+                       write_mb_per_second: float = 64.0) -> DryRunUseCase:
+        type_mapper = MSSQLToPostgreSQLTypeMapper()
+        
+        return DryRunUseCase(
+            source_db=MSSQLAdapter(mssql_config, type_mapper),
+            logger=PythonLoggingAdapter(),
+            batch_size=batch_size,
+            pipeline_depth=pipeline_depth,
+            writer_count=writer_count,
+            table_workers=table_workers,
+            partition_threshold_rows=partition_threshold_rows,
+            range_partitions=range_partitions,
+            deferred_threshold_rows=deferred_threshold_rows,
+            index_workers=index_workers,
+            adaptive_batching=adaptive_batching,
+            sample_rows=sample_rows,
+            write_bytes_per_second=write_mb_per_second * 1024 * 1024
+        )
@@ -1,7 +1,65 @@
+import argparse
 from infrastructure.factory import MigrationServiceFactory
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="MSSQL to PostgreSQL migration tool")
+    parser.add_argument('--checkpoint-file', default='migration_checkpoint.db',
+                        help="SQLite file that records per-table progress")
+    parser.add_argument('--resume', action='store_true',
+                        help="skip finished tables and continue partial ones from the last committed batch")
+    parser.add_argument('--plan-cache', default='migration_plans.db',
+                        help="SQLite file with compiled per-table plans, reused while the source schema is unchanged "
+                             "(pass an empty string to disable)")
+    parser.add_argument('--adaptive-batching', action='store_true',
+                        help="size batches by bytes and commit latency instead of a fixed row count")
+    parser.add_argument('--retry-attempts', type=int, default=5,
+                        help="attempts per batch on transient connection errors, with exponential backoff")
+    parser.add_argument('--exact-counts', action='store_true',
+                        help="run COUNT(*) per table instead of using partition-stats row estimates")
+    parser.add_argument('--metrics-json', metavar='PATH',
+                        help="write per-table and per-stage metrics as JSON")
+    parser.add_argument('--metrics-prom', metavar='PATH',
+                        help="write metrics in Prometheus text format (for node_exporter textfile collector)")
+    parser.add_argument('--sync', action='store_true',
+                        help="apply only rows changed since the last run (rowversion / change tracking)")
+    parser.add_argument('--verify', action='store_true',
+                        help="compare source and target with per-range checksums instead of migrating")
+    parser.add_argument('--verify-workers', type=int, default=4,
+                        help="parallel connection pairs used by --verify")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="print the per-table plan and estimated duration from metadata and a small sample read")
+    parser.add_argument('--sample-rows', type=int, default=10000,
+                        help="rows read from each large table by --dry-run to measure read speed")
+    parser.add_argument('--write-mbps', type=float, default=64.0,
+                        help="assumed PostgreSQL load rate per connection (MB/s) for --dry-run estimates")
+    parser.add_argument('--spool-dir', metavar='DIR',
+                        help="export to compressed COPY files in DIR instead of writing to PostgreSQL")
+    parser.add_argument('--load-spool', metavar='DIR',
+                        help="load a finished spool directory into PostgreSQL without touching the source")
+    parser.add_argument('--load-workers', type=int, default=4,
+                        help="parallel connections used by --load-spool")
+    parser.add_argument('--no-freeze', action='store_true',
+                        help="load spool files one transaction per file instead of COPY FREEZE per table")
+    parser.add_argument('--maintenance-workers', type=int, default=2,
+                        help="connections running post-load VACUUM/ANALYZE (0 disables)")
+    parser.add_argument('--vacuum-freeze', action='store_true',
+                        help="run VACUUM (FREEZE, ANALYZE) after load instead of only ANALYZE; "
+                             "rewrites every loaded page, so it is off by default")
+    parser.add_argument('--progress-interval', type=float, default=5.0,
+                        help="seconds between progress reports (0 disables them)")
+    parser.add_argument('--log-json', action='store_true',
+                        help="write log and progress lines as JSON objects for log shippers")
+    parser.add_argument('--profile', action='append', choices=['cprofile', 'tracemalloc', 'sampling'],
+                        default=[], help="profile each table (repeatable); results go to --profile-dir")
+    parser.add_argument('--profile-dir', default='profiles',
+                        help="directory for .prof, .tracemalloc.txt and .folded profiling output")
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    
     print("="*70)
     print("MSSQL TO POSTGRESQL MIGRATION TOOL")
     print("="*70)
@@ -25,11 +83,80 @@ def main():
     }
     
     try:
-        migration_service = MigrationServiceFactory.create(
-            mssql_config=mssql_config,
-            pg_config=pg_config,
-            batch_size=10000
-        )
+        if args.verify:
+            results = MigrationServiceFactory.create_verify(
+                mssql_config=mssql_config,
+                pg_config=pg_config,
+                workers=args.verify_workers
+            ).execute()
+            mismatched = [r.table_name for r in results if not r.matches]
+            
+            print(f"\n{'='*70}")
+            print("VERIFICATION")
+            print(f"{'='*70}")
+            print(f"✓ Tables checked: {len(results)}")
+            print(f"{'✗' if mismatched else '✓'} Mismatched: {len(mismatched)}")
+            for name in mismatched:
+                print(f"   - {name}")
+            
+            return 0 if not mismatched else 1
+        
+        if args.dry_run:
+            planner = MigrationServiceFactory.create_dry_run(
+                mssql_config=mssql_config,
+                batch_size=10000,
+                adaptive_batching=args.adaptive_batching,
+                sample_rows=args.sample_rows,
+                write_mb_per_second=args.write_mbps
+            )
+            estimates = planner.execute()
+            
+            print(f"\n{'='*70}")
+            print("DRY RUN PLAN")
+            print(f"{'='*70}")
+            print(f"{'table':<40} {'rows':>12} {'strategy':>10} {'par':>4} {'batch':>8} {'defer':>6} {'est. s':>9}")
+            for e in sorted(estimates, key=lambda e: e.estimated_seconds, reverse=True):
+                print(f"{e.table_name[:40]:<40} {e.row_count:>12,} {e.read_strategy:>10} {e.parallelism:>4} "
+                      f"{e.batch_size:>8,} {'yes' if e.deferred_constraints else 'no':>6} {e.estimated_seconds:>9,.1f}")
+            print(f"\n✓ Estimated total: ~{planner.total_seconds / 60:,.1f} min")
+            
+            return 0
+        
+        if args.load_spool:
+            migration_service = MigrationServiceFactory.create_load_spool(
+                pg_config=pg_config,
+                spool_dir=args.load_spool,
+                workers=args.load_workers,
+                freeze=not args.no_freeze
+            )
+        elif args.sync:
+            migration_service = MigrationServiceFactory.create_sync(
+                mssql_config=mssql_config,
+                pg_config=pg_config,
+                checkpoint_path=args.checkpoint_file,
+                batch_size=10000
+            )
+        else:
+            migration_service = MigrationServiceFactory.create(
+                mssql_config=mssql_config,
+                pg_config=pg_config,
+                batch_size=10000,
+                checkpoint_path=args.checkpoint_file,
+                resume=args.resume,
+                adaptive_batching=args.adaptive_batching,
+                metrics_json_path=args.metrics_json,
+                metrics_prometheus_path=args.metrics_prom,
+                exact_row_counts=args.exact_counts,
+                spool_dir=args.spool_dir,
+                plan_cache_path=args.plan_cache,
+                retry_attempts=args.retry_attempts,
+                maintenance_workers=args.maintenance_workers,
+                vacuum_after_load=args.vacuum_freeze,
+                progress_interval_seconds=args.progress_interval,
+                log_json=args.log_json,
+                profilers=args.profile,
+                profile_dir=args.profile_dir
+            )
         
         stats = migration_service.execute()
         